@@ -1,14 +1,12 @@
 """Alembic environment configuration."""
 
+import os
 from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config, pool
 
 from alembic import context
 
-# Import app configuration and models
-from app.core.config import settings
-
 # Import all models to ensure they're registered
 from app.models import (  # noqa: F401
     Booking,
@@ -33,8 +31,27 @@ if config.config_file_name is not None:
 # Set metadata for autogenerate
 target_metadata = Base.metadata
 
+
+def get_database_url() -> str:
+    """
+    Get the synchronous database URL for migrations.
+
+    DATABASE_URL is read straight from the environment when set, so migrations
+    (e.g. the migrator Lambda) do not need the app's other required settings such
+    as REDIS_URL and JWT_SECRET_KEY. Otherwise fall back to the app settings,
+    which also load .env for local development.
+    """
+    database_url = os.environ.get("DATABASE_URL")
+    if database_url:
+        return database_url.replace("+asyncpg", "")
+
+    from app.core.config import settings
+
+    return settings.database_url_sync
+
+
 # Override sqlalchemy.url from environment
-config.set_main_option("sqlalchemy.url", settings.database_url_sync)
+config.set_main_option("sqlalchemy.url", get_database_url())
 
 
 def run_migrations_offline() -> None:
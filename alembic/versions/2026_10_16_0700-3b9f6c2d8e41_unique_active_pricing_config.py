@@ -0,0 +1,43 @@
+"""unique_active_pricing_config
+
+Revision ID: 3b9f6c2d8e41
+Revises: 842955808270
+Create Date: 2026-10-16 07:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9f6c2d8e41'
+down_revision: Union[str, None] = '842955808270'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep only the newest active config per org before enforcing uniqueness
+    op.execute(
+        """
+        UPDATE pricing_configs SET is_active = false
+        WHERE is_active AND id NOT IN (
+            SELECT DISTINCT ON (org_id) id FROM pricing_configs
+            WHERE is_active
+            ORDER BY org_id, created_at DESC
+        )
+        """
+    )
+    op.create_index(
+        'uq_pricing_configs_active_org',
+        'pricing_configs',
+        ['org_id'],
+        unique=True,
+        postgresql_where=sa.text('is_active'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_pricing_configs_active_org', table_name='pricing_configs')
@@ -16,13 +16,13 @@ from app.core.database import get_db, set_rls_context
 from app.core.security import verify_token
 from app.models.organization import Organization, OrganizationStatus
 from app.models.user import CustomerSession, User, UserRole
-from app.services.redis_cache import RedisCache
+from app.services.redis_cache import get_redis_cache
 
 logger = logging.getLogger(__name__)
 
 # Security schemes
 security = HTTPBearer()
-redis_cache = RedisCache()
+redis_cache = get_redis_cache()
 
 
 async def get_current_user(
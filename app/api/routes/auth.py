@@ -26,14 +26,14 @@ from app.schemas.auth import (
     UserLogin,
     UserResponse,
 )
-from app.services.notifications import NotificationService
-from app.services.redis_cache import RedisCache
+from app.services.notifications import get_notification_service
+from app.services.redis_cache import OTPAlreadyPendingError, get_redis_cache
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
-notification_service = NotificationService()
-redis_cache = RedisCache()
+notification_service = get_notification_service()
+redis_cache = get_redis_cache()
 
 
 @router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
@@ -148,6 +148,15 @@ async def request_customer_otp(
     # Generate OTP
     otp_code = generate_otp()
 
+    # Store OTP in Redis; refuse to replace one that is still live
+    try:
+        await redis_cache.store_otp(request.identifier, otp_code)
+    except OTPAlreadyPendingError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="An OTP was already sent. Please wait before requesting another.",
+        ) from e
+
     # Create or update customer session
     stmt = select(CustomerSession).where(
         CustomerSession.identifier == request.identifier,
@@ -182,9 +191,6 @@ async def request_customer_otp(
 
     await db.commit()
 
-    # Store OTP in Redis
-    await redis_cache.store_otp(request.identifier, otp_code)
-
     # Send OTP
     if request.identifier_type == "email":
         await notification_service.send_otp_email(request.identifier, otp_code)
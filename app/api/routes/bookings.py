@@ -24,13 +24,13 @@ from app.schemas.booking import (
 )
 from app.schemas.pricing import PricingConfigResponse
 from app.services.booking import BookingConflictError, BookingService
-from app.services.notifications import NotificationService
+from app.services.notifications import get_notification_service
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/bookings", tags=["Bookings"])
 
 booking_service = BookingService()
-notification_service = NotificationService()
+notification_service = get_notification_service()
 
 
 @router.post("/check-availability", response_model=AvailabilityResponse)
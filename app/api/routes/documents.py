@@ -9,6 +9,8 @@ from app.api.dependencies import get_current_active_user, get_db
 from app.core.config import settings
 from app.models.user import User
 from app.schemas.document_upload import (
+    BatchDownloadURLRequest,
+    BatchDownloadURLResponse,
     DownloadURLRequest,
     DownloadURLResponse,
     UploadCompleteRequest,
@@ -16,7 +18,7 @@ from app.schemas.document_upload import (
     UploadURLRequest,
     UploadURLResponse,
 )
-from app.services.s3 import S3Service
+from app.services.s3 import S3Service, get_s3_service
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/documents", tags=["Documents"])
@@ -52,7 +54,7 @@ async def get_upload_url(
     )
 
     # Generate presigned upload URL
-    s3_service = S3Service()
+    s3_service = get_s3_service()
 
     try:
         presigned_data = await s3_service.generate_presigned_upload_url(
@@ -103,7 +105,7 @@ async def notify_upload_complete(
     # In production, this would be handled by S3 event notifications
 
     # Generate download URL
-    s3_service = S3Service()
+    s3_service = get_s3_service()
 
     try:
         download_url = await s3_service.generate_presigned_download_url(
@@ -145,7 +147,7 @@ async def get_download_url(
 
     Requires mover authentication.
     """
-    s3_service = S3Service()
+    s3_service = get_s3_service()
 
     try:
         download_url = await s3_service.generate_presigned_download_url(
@@ -163,7 +165,7 @@ async def get_download_url(
 
         return DownloadURLResponse(
             download_url=download_url,
-            expires_in=download_request.expires_in,
+            expires_in=min(download_request.expires_in, s3_service.max_download_url_expires_in),
         )
 
     except Exception as e:
@@ -172,3 +174,43 @@ async def get_download_url(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to generate download URL",
         ) from e
+
+
+@router.post("/download-urls", response_model=BatchDownloadURLResponse)
+async def get_download_urls(
+    download_request: BatchDownloadURLRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> BatchDownloadURLResponse:
+    """
+    Get presigned URLs for downloading several files from S3 in one call.
+
+    Requires mover authentication.
+    """
+    s3_service = get_s3_service()
+    file_keys = list(dict.fromkeys(download_request.file_keys))
+
+    try:
+        download_urls = await s3_service.generate_presigned_download_urls(
+            [(file_key, download_request.expires_in) for file_key in file_keys]
+        )
+
+        logger.info(
+            f"Generated {len(file_keys)} download URLs for {current_user.email}",
+            extra={
+                "user_email": current_user.email,
+                "file_count": len(file_keys),
+            },
+        )
+
+        return BatchDownloadURLResponse(
+            download_urls=dict(zip(file_keys, download_urls, strict=True)),
+            expires_in=min(download_request.expires_in, s3_service.max_download_url_expires_in),
+        )
+
+    except Exception as e:
+        logger.error(f"Failed to generate download URLs: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to generate download URLs",
+        ) from e
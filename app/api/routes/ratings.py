@@ -7,7 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_current_active_user, get_current_customer_session
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.models.user import CustomerSession, User
 from app.schemas.rating import (
     RatingCreate,
@@ -17,17 +17,19 @@ from app.schemas.rating import (
     RatingSummaryResponse,
     RatingUpdate,
 )
-from app.services.notifications import NotificationService
+from app.services.notifications import get_notification_service
 from app.services.rating import (
     BookingNotEligibleError,
     RatingAlreadyExistsError,
     RatingService,
+    decode_rating_cursor,
+    encode_rating_cursor,
 )
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/ratings", tags=["Ratings"])
 
-notification_service = NotificationService()
+notification_service = get_notification_service()
 
 
 @router.post(
@@ -132,38 +134,43 @@ async def get_rating_by_booking(
 async def list_organization_ratings(
     org_id: UUID,
     limit: int = Query(20, ge=1, le=100),
-    page: int = Query(1, ge=1),
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    db: AsyncSession = Depends(get_read_db),
 ) -> RatingListResponse:
     """
-    List all ratings for an organization.
+    List all ratings for an organization, newest first.
 
     Public endpoint - displays published ratings only.
-    Used for mover profile pages.
+    Used for mover profile pages. Pass the returned next_cursor to get the next page.
     """
-    offset = (page - 1) * limit
+    try:
+        decoded_cursor = decode_rating_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
 
-    ratings, total = await RatingService.list_ratings_for_org(
+    ratings, next_cursor = await RatingService.list_ratings_for_org(
         db=db,
         org_id=org_id,
         limit=limit,
-        offset=offset,
+        cursor=decoded_cursor,
         published_only=True,
     )
 
     return RatingListResponse(
         ratings=[RatingResponse.model_validate(r) for r in ratings],
-        total=total,
-        page=page,
         page_size=limit,
-        has_more=(offset + limit) < total,
+        has_more=next_cursor is not None,
+        next_cursor=encode_rating_cursor(next_cursor) if next_cursor else None,
     )
 
 
 @router.get("/organization/{org_id}/summary", response_model=RatingSummaryResponse)
 async def get_organization_rating_summary(
     org_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> RatingSummaryResponse:
     """
     Get aggregate rating statistics for an organization.
@@ -192,13 +199,13 @@ async def get_organization_rating_summary(
             updated_at=None,  # type: ignore
         )
 
-    return RatingSummaryResponse.model_validate(summary)
+    return summary
 
 
 @router.get("/organization/{org_id}/stats", response_model=RatingStatsResponse)
 async def get_organization_rating_stats(
     org_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> RatingStatsResponse:
     """
     Get detailed rating statistics for an organization.
@@ -219,7 +226,6 @@ async def get_organization_rating_stats(
         db=db,
         org_id=org_id,
         limit=10,
-        offset=0,
         published_only=True,
     )
 
@@ -231,7 +237,7 @@ async def get_organization_rating_stats(
 
     return RatingStatsResponse(
         org_id=org_id,
-        summary=RatingSummaryResponse.model_validate(summary),
+        summary=summary,
         recent_ratings=[RatingResponse.model_validate(r) for r in recent_ratings],
         rating_trend=trend,
         response_rate=response_rate,
@@ -3,12 +3,11 @@
 import logging
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_current_active_user, get_current_customer_session, get_db
-from app.models.booking import Booking
 from app.models.support import IssueStatus, SupportIssue
 from app.models.user import CustomerSession, User
 from app.schemas.support import (
@@ -21,7 +20,11 @@ from app.schemas.support import (
     SupportIssueWithComments,
     SupportStats,
 )
-from app.services.support import SupportError, SupportTicketService
+from app.services.support import (
+    SupportBookingNotFoundError,
+    SupportError,
+    SupportTicketService,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/support", tags=["Support"])
@@ -30,6 +33,7 @@ router = APIRouter(prefix="/support", tags=["Support"])
 @router.post("/tickets", response_model=SupportIssueResponse)
 async def create_support_ticket(
     ticket_create: SupportIssueCreate,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     customer_session: CustomerSession = Depends(get_current_customer_session),
 ) -> SupportIssueResponse:
@@ -38,22 +42,6 @@ async def create_support_ticket(
 
     Requires customer session authentication.
     """
-    # Verify booking belongs to customer
-    booking_result = await db.execute(select(Booking).where(Booking.id == ticket_create.booking_id))
-    booking = booking_result.scalar_one_or_none()
-
-    if not booking:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Booking {ticket_create.booking_id} not found",
-        )
-
-    if booking.customer_email != customer_session.email:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only create tickets for your own bookings",
-        )
-
     try:
         ticket = await SupportTicketService.create_support_ticket(
             db=db,
@@ -65,8 +53,13 @@ async def create_support_ticket(
             reporter_email=ticket_create.reporter_email,
             reporter_phone=ticket_create.reporter_phone,
             evidence_urls=ticket_create.evidence_urls,
+            # Ownership is checked inside the INSERT; no separate booking lookup
+            customer_email=customer_session.email,
         )
 
+        # Email customer and mover after the response is sent
+        background_tasks.add_task(SupportTicketService.notify_ticket_created, ticket.id)
+
         logger.info(
             f"Support ticket created by {customer_session.email}: {ticket.id}",
             extra={
@@ -78,6 +71,11 @@ async def create_support_ticket(
 
         return SupportIssueResponse.model_validate(ticket)
 
+    except SupportBookingNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        ) from e
     except SupportError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -137,8 +135,7 @@ async def add_comment_to_ticket(
     Requires customer session authentication.
     """
     # Verify customer owns ticket
-    ticket_result = await db.execute(select(SupportIssue).where(SupportIssue.id == ticket_id))
-    ticket = ticket_result.scalar_one_or_none()
+    ticket = await db.get(SupportIssue, ticket_id)
 
     if not ticket:
         raise HTTPException(
@@ -235,6 +232,7 @@ async def list_organization_tickets(
 async def update_support_ticket(
     ticket_id: UUID,
     ticket_update: SupportIssueUpdate,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ) -> SupportIssueResponse:
@@ -244,8 +242,7 @@ async def update_support_ticket(
     Requires mover or platform admin authentication.
     """
     # Get ticket
-    ticket_result = await db.execute(select(SupportIssue).where(SupportIssue.id == ticket_id))
-    ticket = ticket_result.scalar_one_or_none()
+    ticket = await db.get(SupportIssue, ticket_id)
 
     if not ticket:
         raise HTTPException(
@@ -261,6 +258,8 @@ async def update_support_ticket(
             detail="Access denied",
         )
 
+    was_resolved = ticket.status == IssueStatus.RESOLVED
+
     try:
         updated_ticket = await SupportTicketService.update_ticket(
             db=db,
@@ -271,8 +270,13 @@ async def update_support_ticket(
             resolution_notes=ticket_update.resolution_notes,
             refund_amount=ticket_update.refund_amount,
             resolved_by=current_user.id if ticket_update.status == IssueStatus.RESOLVED else None,
+            ticket=ticket,
         )
 
+        # Email the reporter after the response is sent
+        if updated_ticket.status == IssueStatus.RESOLVED and not was_resolved:
+            background_tasks.add_task(SupportTicketService.notify_ticket_resolved, ticket_id)
+
         logger.info(
             f"Ticket {ticket_id} updated by {current_user.email}",
             extra={
@@ -338,8 +342,7 @@ async def add_mover_comment(
     Requires mover authentication.
     """
     # Verify ticket belongs to mover's org
-    ticket_result = await db.execute(select(SupportIssue).where(SupportIssue.id == ticket_id))
-    ticket = ticket_result.scalar_one_or_none()
+    ticket = await db.get(SupportIssue, ticket_id)
 
     if not ticket:
         raise HTTPException(
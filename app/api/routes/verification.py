@@ -1,10 +1,20 @@
 """Document verification API endpoints."""
 
+import hashlib
 import logging
-from datetime import datetime
+from datetime import UTC, datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Response,
+    status,
+)
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -12,7 +22,7 @@ from app.api.dependencies import get_current_active_user, get_db
 from app.models.driver import Driver
 from app.models.organization import Organization
 from app.models.user import User
-from app.models.verification import DocumentVerification, VerificationStatus
+from app.models.verification import DocumentType, DocumentVerification, VerificationStatus
 from app.schemas.verification import (
     DocumentVerificationCreate,
     DocumentVerificationListResponse,
@@ -22,12 +32,42 @@ from app.schemas.verification import (
     DriverVerificationStatus,
     OrganizationVerificationStatus,
 )
-from app.services.verification import VerificationError, VerificationService
+from app.services.notification_templates import email_templates
+from app.services.notifications import get_notification_service
+from app.services.verification import (
+    EXPIRY_REMINDER_MARK_BATCH_SIZE,
+    VerificationError,
+    VerificationService,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/verification", tags=["Verification"])
 
 
+def _status_etag(
+    name: str,
+    documents: list[tuple[DocumentType, VerificationStatus, datetime]],
+) -> str:
+    """Weak ETag for a status response from the name and latest documents it is built from."""
+    digest = hashlib.blake2b(name.encode(), digest_size=16)
+    for document_type, doc_status, updated_at in documents:
+        digest.update(
+            f"\0{document_type.value}:{doc_status.value}:{updated_at.isoformat()}".encode()
+        )
+    return f'W/"{digest.hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag.removeprefix("W/") in {
+        tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+    }
+
+
 @router.post("/organization/{org_id}/documents", response_model=DocumentVerificationResponse)
 async def submit_organization_document(
     org_id: UUID,
@@ -123,6 +163,7 @@ async def submit_driver_document(
 async def review_document_verification(
     verification_id: UUID,
     review: DocumentVerificationReview,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ) -> DocumentVerificationResponse:
@@ -144,6 +185,9 @@ async def review_document_verification(
             rejection_reason=review.rejection_reason,
         )
 
+        # Email the organization/driver after the response is sent
+        background_tasks.add_task(VerificationService.notify_verification_reviewed, verification.id)
+
         logger.info(
             f"Document reviewed by {current_user.email}: {verification_id}",
             extra={
@@ -210,13 +254,16 @@ async def list_pending_verifications(
 @router.get("/organization/{org_id}/status", response_model=OrganizationVerificationStatus)
 async def get_organization_verification_status(
     org_id: UUID,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
-) -> OrganizationVerificationStatus:
+) -> OrganizationVerificationStatus | Response:
     """
     Get verification status for an organization.
 
     Requires mover authentication for own organization or platform admin.
+    Responds 304 Not Modified when If-None-Match matches the current ETag.
     """
     # Verify access
     if current_user.org_id != org_id:
@@ -236,10 +283,18 @@ async def get_organization_verification_status(
             detail=f"Organization {org_id} not found",
         )
 
+    # Revalidate polling clients before computing the status
+    documents = await VerificationService.get_organization_latest_documents(db, org_id)
+    etag = _status_etag(org.business_name, documents)
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
     # Get verification status
     status_dict = await VerificationService.get_organization_verification_status(
         db=db,
         org_id=org_id,
+        version=etag,
     )
 
     return OrganizationVerificationStatus(
@@ -252,13 +307,16 @@ async def get_organization_verification_status(
 @router.get("/driver/{driver_id}/status", response_model=DriverVerificationStatus)
 async def get_driver_verification_status(
     driver_id: UUID,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
-) -> DriverVerificationStatus:
+) -> DriverVerificationStatus | Response:
     """
     Get verification status for a driver.
 
     Requires mover authentication for own organization's drivers or platform admin.
+    Responds 304 Not Modified when If-None-Match matches the current ETag.
     """
     # Get driver
     result = await db.execute(select(Driver).where(Driver.id == driver_id))
@@ -278,10 +336,18 @@ async def get_driver_verification_status(
             detail="Access denied",
         )
 
+    # Revalidate polling clients before computing the status
+    documents = await VerificationService.get_driver_latest_documents(db, driver_id)
+    etag = _status_etag(driver.name, documents)
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
     # Get verification status
     status_dict = await VerificationService.get_driver_verification_status(
         db=db,
         driver_id=driver_id,
+        version=etag,
     )
 
     return DriverVerificationStatus(
@@ -340,7 +406,7 @@ async def get_verification_stats(
     expired = expired_result.scalar_one()
 
     # Get expiring soon
-    expiring_docs = await VerificationService.get_expiring_documents(db=db, days_threshold=30)
+    expiring_soon = await VerificationService.count_expiring_documents(db=db, days_threshold=30)
 
     return DocumentVerificationStats(
         total_pending=pending,
@@ -348,7 +414,7 @@ async def get_verification_stats(
         total_approved=approved,
         total_rejected=rejected,
         total_expired=expired,
-        documents_expiring_soon=len(expiring_docs),
+        documents_expiring_soon=expiring_soon,
     )
 
 
@@ -407,20 +473,18 @@ async def send_expiry_reminders(
     Typically called by background job/cron.
     Requires platform admin role.
     """
-    from app.services.notification_templates import EmailTemplates
-    from app.services.notifications import NotificationService
+    notification_service = get_notification_service()
+    total_expiring = 0
+    sent_count = 0
+    # Sent reminders are flagged in bulk rather than one UPDATE/commit each
+    sent_ids: list[UUID] = []
 
-    # Get expiring documents
-    expiring_docs = await VerificationService.get_expiring_documents(
+    # Paged by (expiry_date, id): reminders go out while later pages are still unread
+    async for verification in VerificationService.iter_expiring_documents(
         db=db,
         days_threshold=days_threshold,
-    )
-
-    notification_service = NotificationService()
-    email_templates = EmailTemplates()
-    sent_count = 0
-
-    for verification in expiring_docs:
+    ):
+        total_expiring += 1
         try:
             # Get entity (org or driver)
             if verification.org_id:
@@ -448,7 +512,7 @@ async def send_expiry_reminders(
 
             # Calculate days until expiry
             days_until_expiry = (
-                (verification.expiry_date - datetime.utcnow()).days
+                (verification.expiry_date - datetime.now(UTC)).days
                 if verification.expiry_date
                 else 0
             )
@@ -477,12 +541,7 @@ async def send_expiry_reminders(
                 html_content=html_content,
             )
 
-            # Mark reminder sent
-            await VerificationService.mark_expiry_reminder_sent(
-                db=db,
-                verification_id=verification.id,
-            )
-
+            sent_ids.append(verification.id)
             sent_count += 1
 
             logger.info(
@@ -500,8 +559,14 @@ async def send_expiry_reminders(
                 exc_info=True,
             )
 
+        if len(sent_ids) >= EXPIRY_REMINDER_MARK_BATCH_SIZE:
+            await VerificationService.mark_expiry_reminders_sent(db=db, verification_ids=sent_ids)
+            sent_ids = []
+
+    await VerificationService.mark_expiry_reminders_sent(db=db, verification_ids=sent_ids)
+
     return {
-        "total_expiring": len(expiring_docs),
+        "total_expiring": total_expiring,
         "reminders_sent": sent_count,
         "days_threshold": days_threshold,
     }
@@ -532,7 +597,7 @@ async def preview_expiring_documents(
                 "document_type": doc.document_type.value,
                 "expiry_date": doc.expiry_date.strftime("%Y-%m-%d") if doc.expiry_date else None,
                 "days_until_expiry": (
-                    (doc.expiry_date - datetime.utcnow()).days if doc.expiry_date else 0
+                    (doc.expiry_date - datetime.now(UTC)).days if doc.expiry_date else 0
                 ),
                 "org_id": str(doc.org_id) if doc.org_id else None,
                 "driver_id": str(doc.driver_id) if doc.driver_id else None,
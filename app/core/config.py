@@ -42,19 +42,23 @@ class Settings(BaseSettings):
 
     # Database (PostgreSQL with PostGIS)
     DATABASE_URL: PostgresDsn
+    DATABASE_READ_URL: PostgresDsn | None = None  # Read replica; defaults to the primary
     DATABASE_POOL_SIZE: int = Field(default=20, ge=5, le=100)
     DATABASE_MAX_OVERFLOW: int = Field(default=10, ge=0, le=50)
     DATABASE_ECHO: bool = False
     DATABASE_POOL_RECYCLE: int = Field(default=3600, ge=300)  # Prevent stale connections
     DATABASE_POOL_TIMEOUT: int = Field(default=30, ge=5, le=60)  # Connection timeout
     DATABASE_POOL_PRE_PING: bool = True  # Verify connections before use
+    DATABASE_POOL_USE_LIFO: bool = False  # Reuse the most recent connection (keeps few warm)
     DATABASE_STATEMENT_TIMEOUT: int = Field(default=30000, ge=1000)  # Statement timeout (ms)
 
     # Redis
     REDIS_URL: RedisDsn
     REDIS_SESSION_DB: int = Field(default=1, ge=0, le=15)
     REDIS_CACHE_DB: int = Field(default=2, ge=0, le=15)
-    REDIS_POOL_SIZE: int = Field(default=10, ge=1)
+    REDIS_POOL_SIZE: int = Field(default=50, ge=1)
+    REDIS_POOL_TIMEOUT: float = Field(default=0.25, gt=0)  # Max wait for a free connection (s)
+    REDIS_HEALTH_CHECK_INTERVAL: int = Field(default=30, ge=0)  # PING idle connections (s)
 
     # JWT & Security
     JWT_SECRET_KEY: str = Field(min_length=32)
@@ -69,6 +73,8 @@ class Settings(BaseSettings):
     AWS_SECRET_ACCESS_KEY: str | None = None
     S3_BUCKET_NAME: str = "test-bucket"  # Default for testing
     S3_PRESIGNED_URL_EXPIRE_SECONDS: int = Field(default=300, ge=60, le=3600)
+    # Fraction of single presign calls that get their own trace span
+    S3_PRESIGN_SPAN_SAMPLE_RATE: float = Field(default=0.1, ge=0.0, le=1.0)
     SQS_QUEUE_URL: str | None = None
 
     # Stripe
@@ -76,6 +82,7 @@ class Settings(BaseSettings):
     STRIPE_PUBLISHABLE_KEY: str = "pk_test_dummy"  # Default for testing
     STRIPE_WEBHOOK_SECRET: str = "whsec_dummy"  # Default for testing
     PLATFORM_FEE_PERCENTAGE: float = Field(default=5.0, ge=0, le=100)
+    STRIPE_WARMUP_ON_STARTUP: bool = True  # Pre-open DNS/TLS to api.stripe.com
 
     # Twilio (SMS)
     TWILIO_ACCOUNT_SID: str | None = None
@@ -107,6 +114,9 @@ class Settings(BaseSettings):
     DEFAULT_COMMUTE_BUFFER_MINUTES: int = Field(default=30, ge=0)
     BOOKING_CANCELLATION_HOURS: int = Field(default=24, ge=1)
 
+    # Ratings
+    RATING_SUMMARY_RECONCILE_INTERVAL_SECONDS: int = Field(default=3600, ge=60)
+
     # File Upload
     MAX_UPLOAD_SIZE_MB: int = Field(default=10, ge=1, le=100)
     ALLOWED_UPLOAD_EXTENSIONS: list[str] = [".jpg", ".jpeg", ".png", ".pdf"]
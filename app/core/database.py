@@ -4,6 +4,7 @@ Provides async SQLAlchemy engine with optimized connection pooling and RLS suppo
 
 Connection Pooling Strategy:
 - Global engine and session factory (singleton pattern)
+- Optional read-replica engine for read-only endpoints (DATABASE_READ_URL)
 - QueuePool for production (configurable size and overflow)
 - NullPool for testing (no pooling overhead)
 - Pool recycling to prevent stale connections
@@ -40,6 +41,8 @@ class Base(DeclarativeBase):
 # Global engine and session factory
 _engine: AsyncEngine | None = None
 _session_factory: async_sessionmaker[AsyncSession] | None = None
+_read_engine: AsyncEngine | None = None
+_read_session_factory: async_sessionmaker[AsyncSession] | None = None
 
 
 def get_engine() -> AsyncEngine:
@@ -62,48 +65,88 @@ def get_engine() -> AsyncEngine:
     global _engine
 
     if _engine is None:
-        # Use NullPool only for testing (no pooling overhead)
-        # AsyncAdaptedQueuePool for all other environments (dev, staging, production)
-        pool_class = NullPool if settings.ENVIRONMENT == "test" else AsyncAdaptedQueuePool
-
-        # Create engine with optimized pool settings
-        _engine = create_async_engine(
-            str(settings.DATABASE_URL),
-            echo=settings.DATABASE_ECHO,
-            # Connection Pool Settings
-            poolclass=pool_class,
-            pool_size=settings.DATABASE_POOL_SIZE,
-            max_overflow=settings.DATABASE_MAX_OVERFLOW,
-            pool_timeout=settings.DATABASE_POOL_TIMEOUT,
-            pool_recycle=settings.DATABASE_POOL_RECYCLE,
-            pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
-            # Connection Settings
-            connect_args={
-                "server_settings": {
-                    # Statement timeout (prevent long-running queries)
-                    "statement_timeout": str(settings.DATABASE_STATEMENT_TIMEOUT),
-                    # Application name for connection tracking
-                    "application_name": f"{settings.APP_NAME}-{settings.ENVIRONMENT}",
-                },
-                # Command timeout at driver level
-                "command_timeout": settings.DATABASE_POOL_TIMEOUT,
+        _engine = _create_engine(str(settings.DATABASE_URL))
+        logger.info("✓ Primary database engine ready")
+
+    return _engine
+
+
+def get_read_engine() -> AsyncEngine:
+    """
+    Get or create the engine for read-only traffic.
+
+    Points at the read replica when DATABASE_READ_URL is set; otherwise this is
+    the primary engine, so read paths work unchanged in single-node setups.
+
+    Returns:
+        AsyncEngine: Replica engine, or the primary engine if no replica is configured
+    """
+    global _read_engine
+
+    if settings.DATABASE_READ_URL is None:
+        return get_engine()
+
+    if _read_engine is None:
+        _read_engine = _create_engine(str(settings.DATABASE_READ_URL))
+        logger.info("✓ Read replica database engine ready")
+
+    return _read_engine
+
+
+def _create_engine(database_url: str) -> AsyncEngine:
+    """
+    Create an async engine with the shared pool and connection settings.
+
+    Args:
+        database_url: Database connection URL
+
+    Returns:
+        AsyncEngine: SQLAlchemy async engine with connection pool
+    """
+    # Use NullPool only for testing (no pooling overhead)
+    # AsyncAdaptedQueuePool for all other environments (dev, staging, production)
+    pool_class = NullPool if settings.ENVIRONMENT == "test" else AsyncAdaptedQueuePool
+
+    # Create engine with optimized pool settings
+    engine = create_async_engine(
+        database_url,
+        echo=settings.DATABASE_ECHO,
+        # Connection Pool Settings
+        poolclass=pool_class,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
+        pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+        pool_use_lifo=settings.DATABASE_POOL_USE_LIFO,
+        # Connection Settings
+        connect_args={
+            "server_settings": {
+                # Statement timeout (prevent long-running queries)
+                "statement_timeout": str(settings.DATABASE_STATEMENT_TIMEOUT),
+                # Application name for connection tracking
+                "application_name": f"{settings.APP_NAME}-{settings.ENVIRONMENT}",
             },
-        )
+            # Command timeout at driver level
+            "command_timeout": settings.DATABASE_POOL_TIMEOUT,
+        },
+    )
 
-        # Register connection pool event listeners for monitoring
-        _setup_pool_listeners(_engine)
-
-        logger.info(
-            f"✓ Database engine created with connection pooling: "
-            f"pool_class={pool_class.__name__}, "
-            f"pool_size={settings.DATABASE_POOL_SIZE}, "
-            f"max_overflow={settings.DATABASE_MAX_OVERFLOW}, "
-            f"total_capacity={settings.DATABASE_POOL_SIZE + settings.DATABASE_MAX_OVERFLOW}, "
-            f"pool_timeout={settings.DATABASE_POOL_TIMEOUT}s, "
-            f"pool_recycle={settings.DATABASE_POOL_RECYCLE}s"
-        )
+    # Register connection pool event listeners for monitoring
+    _setup_pool_listeners(engine)
 
-    return _engine
+    logger.info(
+        f"✓ Database engine created with connection pooling: "
+        f"pool_class={pool_class.__name__}, "
+        f"pool_size={settings.DATABASE_POOL_SIZE}, "
+        f"max_overflow={settings.DATABASE_MAX_OVERFLOW}, "
+        f"total_capacity={settings.DATABASE_POOL_SIZE + settings.DATABASE_MAX_OVERFLOW}, "
+        f"pool_timeout={settings.DATABASE_POOL_TIMEOUT}s, "
+        f"pool_recycle={settings.DATABASE_POOL_RECYCLE}s, "
+        f"pool_use_lifo={settings.DATABASE_POOL_USE_LIFO}"
+    )
+
+    return engine
 
 
 def _setup_pool_listeners(engine: AsyncEngine) -> None:
@@ -149,6 +192,32 @@ def _setup_pool_listeners(engine: AsyncEngine) -> None:
     logger.debug("Connection pool event listeners registered")
 
 
+def get_pool_status(engine: AsyncEngine) -> dict[str, int | str]:
+    """
+    Snapshot of an engine's connection pool usage.
+
+    Args:
+        engine: SQLAlchemy engine to inspect
+
+    Returns:
+        Pool class plus size/checked-in/checked-out/overflow counts (queue pools only)
+    """
+    pool = engine.sync_engine.pool
+    status: dict[str, int | str] = {"pool_class": type(pool).__name__}
+
+    # NullPool (tests) keeps no connections, so it has no counters
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+            capacity=pool.size() + settings.DATABASE_MAX_OVERFLOW,
+        )
+
+    return status
+
+
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
     """
     Get or create the global session factory.
@@ -172,6 +241,29 @@ def get_session_factory() -> async_sessionmaker[AsyncSession]:
     return _session_factory
 
 
+def get_read_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    Get or create the session factory for read-only traffic.
+
+    Returns:
+        async_sessionmaker: Session factory bound to the read engine
+    """
+    global _read_session_factory
+
+    if _read_session_factory is None:
+        _read_session_factory = async_sessionmaker(
+            bind=get_read_engine(),
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autocommit=False,
+            autoflush=False,
+        )
+
+        logger.info("Read session factory created")
+
+    return _read_session_factory
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency to get database session for FastAPI endpoints.
@@ -201,6 +293,27 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get a read-only database session for FastAPI endpoints.
+
+    Backed by the read replica when DATABASE_READ_URL is set. Only use it for
+    endpoints that never write; replica reads may lag the primary slightly.
+
+    Yields:
+        AsyncSession: Database session backed by the read engine's pool
+    """
+    session_factory = get_read_session_factory()
+    async with session_factory() as session:
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+
 @asynccontextmanager
 async def get_db_context() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -318,7 +431,13 @@ async def init_db() -> None:
 
 async def close_db() -> None:
     """Close database connections and cleanup."""
-    global _engine, _session_factory
+    global _engine, _session_factory, _read_engine, _read_session_factory
+
+    if _read_engine:
+        await _read_engine.dispose()
+        _read_engine = None
+        logger.info("Read replica connections closed")
+    _read_session_factory = None
 
     if _engine:
         await _engine.dispose()
@@ -3,7 +3,9 @@ OpenTelemetry observability configuration.
 Provides comprehensive tracing, metrics, and logging for production monitoring.
 """
 
+import asyncio
 import logging
+from collections import deque
 from typing import Optional
 
 from opentelemetry import metrics, trace
@@ -15,6 +17,7 @@ from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from opentelemetry.instrumentation.logging import LoggingInstrumentor
 from opentelemetry.instrumentation.redis import RedisInstrumentor
 from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
+from opentelemetry.metrics import Histogram
 from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
 from opentelemetry.sdk.resources import Resource
@@ -205,6 +208,55 @@ def start_prometheus_server(port: int = 9090) -> None:
         logger.warning(f"Failed to start Prometheus server: {e}")
 
 
+class MetricsBuffer:
+    """
+    Per-worker buffer of histogram samples.
+
+    Hot paths append to a bounded deque (no metrics SDK locking); the samples are
+    recorded into the underlying histogram in batches by flush_metrics_buffers().
+    When the buffer is full the oldest samples are dropped.
+    """
+
+    def __init__(self, histogram: Histogram, maxlen: int = 10_000) -> None:
+        self._histogram = histogram
+        self._samples: deque[float] = deque(maxlen=maxlen)
+
+    def append(self, value: float) -> None:
+        """Buffer a sample for the next flush."""
+        self._samples.append(value)
+
+    def flush(self) -> int:
+        """
+        Record all buffered samples into the histogram.
+
+        Returns:
+            Number of samples recorded
+        """
+        count = 0
+        while self._samples:
+            self._histogram.record(self._samples.popleft())
+            count += 1
+        return count
+
+
+async def flush_metrics_buffers(interval_seconds: float = 0.1) -> None:
+    """
+    Periodically drain all metrics buffers until cancelled.
+
+    Args:
+        interval_seconds: Delay between flushes (default: 100ms)
+    """
+    try:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            for buffer in METRICS_BUFFERS:
+                buffer.flush()
+    finally:
+        # Record whatever is left on shutdown
+        for buffer in METRICS_BUFFERS:
+            buffer.flush()
+
+
 # Tracer and meter for custom instrumentation
 tracer = trace.get_tracer(__name__)
 meter = metrics.get_meter(__name__)
@@ -233,3 +285,8 @@ availability_check_histogram = meter.create_histogram(
     description="Time taken to check availability",
     unit="ms",
 )
+
+# Buffered metrics for hot paths, drained by flush_metrics_buffers()
+pricing_metrics_buffer = MetricsBuffer(pricing_calculation_histogram)
+
+METRICS_BUFFERS: tuple[MetricsBuffer, ...] = (pricing_metrics_buffer,)
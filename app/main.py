@@ -9,6 +9,8 @@ Main FastAPI application with comprehensive middleware stack:
 - Request logging
 """
 
+import asyncio
+import contextlib
 import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
@@ -39,14 +41,24 @@ from app.api.routes import (
     verification,
 )
 from app.core.config import settings
-from app.core.database import close_db, get_engine
-from app.core.observability import initialize_observability, start_prometheus_server
+from app.core.database import close_db, get_engine, get_pool_status, get_read_engine
+from app.core.observability import (
+    flush_metrics_buffers,
+    initialize_observability,
+    start_prometheus_server,
+)
 from app.services.booking import BookingConflictError
-from app.services.redis_cache import RedisCache
+from app.services.payments import PaymentService
+from app.services.rating import reconcile_rating_summaries_periodically
+from app.services.redis_cache import get_redis_cache
+from app.services.s3 import get_s3_service
 
 # Initialize logging and observability
 logger = logging.getLogger(__name__)
 
+# Shared Redis cache (one set of connection pools per worker)
+redis_cache = get_redis_cache()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator:
@@ -80,20 +92,43 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
 
     # Verify Redis connection
     try:
-        redis = RedisCache()
-        await redis._get_cache_client()
+        await redis_cache._get_cache_client().ping()
         logger.info("✓ Redis connection established")
     except Exception as e:
         logger.error(f"✗ Redis connection failed: {e}")
         # Non-fatal - continue without Redis
 
+    # Warm up Stripe connection (skipped for the placeholder test key)
+    if settings.STRIPE_WARMUP_ON_STARTUP and settings.STRIPE_SECRET_KEY != "sk_test_dummy":
+        try:
+            PaymentService.warm_up()
+        except Exception as e:
+            logger.warning(f"Stripe warm-up failed: {e}")
+            # Non-fatal - first payment request pays the handshake cost
+
+    # Drain buffered hot-path metrics in the background
+    metrics_flush_task = asyncio.create_task(flush_metrics_buffers())
+
+    # Periodically rebuild rating summaries to correct drift in the incremental counters
+    rating_reconcile_task = asyncio.create_task(
+        reconcile_rating_summaries_periodically(settings.RATING_SUMMARY_RECONCILE_INTERVAL_SECONDS)
+    )
+
     logger.info("✓ Application startup complete")
 
     yield
 
     # Shutdown
     logger.info("Shutting down application...")
+    metrics_flush_task.cancel()
+    rating_reconcile_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await metrics_flush_task
+    with contextlib.suppress(asyncio.CancelledError):
+        await rating_reconcile_task
     await close_db()
+    await redis_cache.close()
+    await get_s3_service().close()
     logger.info("✓ Application shutdown complete")
 
 
@@ -198,10 +233,9 @@ async def rate_limit_middleware(request: Request, call_next):  # type: ignore
         return await call_next(request)
 
     client_ip = request.client.host if request.client else "unknown"
-    redis = RedisCache()
 
     # Check rate limit
-    is_allowed = await redis.check_rate_limit(
+    is_allowed = await redis_cache.check_rate_limit(
         key=f"ip:{client_ip}",
         max_requests=settings.RATE_LIMIT_PER_MINUTE,
         window_seconds=60,
@@ -349,6 +383,23 @@ async def database_health_check() -> dict:
         )
 
 
+@app.get("/health/db/pool", tags=["Health"])
+async def database_pool_status() -> dict:
+    """
+    Database connection pool usage.
+
+    Shows checked-out vs idle connections and overflow, to spot pool exhaustion.
+    """
+    engine = get_engine()
+    read_engine = get_read_engine()
+
+    pools = {"primary": get_pool_status(engine)}
+    if read_engine is not engine:
+        pools["read_replica"] = get_pool_status(read_engine)
+
+    return pools
+
+
 @app.get("/health/redis", tags=["Health"])
 async def redis_health_check() -> dict:
     """
@@ -357,10 +408,7 @@ async def redis_health_check() -> dict:
     Verifies Redis connectivity.
     """
     try:
-        redis = RedisCache()
-        client = await redis._get_cache_client()
-        await client.ping()
-        await client.close()
+        await redis_cache._get_cache_client().ping()
 
         return {"status": "healthy", "redis": "connected"}
 
@@ -3,7 +3,7 @@
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from sqlalchemy import Boolean, CheckConstraint, ForeignKey, Numeric
+from sqlalchemy import Boolean, CheckConstraint, ForeignKey, Index, Numeric, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -81,6 +81,13 @@ class PricingConfig(BaseModel):
         CheckConstraint("base_hourly_rate > 0", name="positive_hourly_rate"),
         CheckConstraint("base_mileage_rate >= 0", name="non_negative_mileage_rate"),
         CheckConstraint("minimum_charge >= 0", name="non_negative_minimum"),
+        # Enforces a single active config per org
+        Index(
+            "uq_pricing_configs_active_org",
+            "org_id",
+            unique=True,
+            postgresql_where=text("is_active"),
+        ),
     )
 
     def __repr__(self) -> str:
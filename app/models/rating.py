@@ -1,10 +1,11 @@
 """Rating and Review models for quality tracking."""
 
 import enum
+from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import CheckConstraint, ForeignKey, Integer, String, Text
+from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import BaseModel
@@ -69,7 +70,9 @@ class Rating(BaseModel):
 
     # Response from Mover
     mover_response: Mapped[str | None] = mapped_column(Text, nullable=True)
-    mover_responded_at: Mapped[str | None] = mapped_column(String(30), nullable=True)
+    mover_responded_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
 
     # Moderation
     is_published: Mapped[bool] = mapped_column(nullable=False, default=True)
@@ -101,6 +104,16 @@ class Rating(BaseModel):
             "value_for_money_rating IS NULL OR (value_for_money_rating >= 1 AND value_for_money_rating <= 5)",
             name="valid_value_rating",
         ),
+        # Published ratings of an organization, newest first: serves keyset
+        # pagination, trend and aggregate queries as index-only scans
+        Index(
+            "idx_ratings_org_published_created",
+            "org_id",
+            text("created_at DESC"),
+            text("id DESC"),
+            postgresql_include=["overall_rating"],
+            postgresql_where=text("is_published"),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -114,8 +127,8 @@ class RatingSummary(BaseModel):
     """
     Aggregated rating statistics for an organization.
 
-    Updated via background job after each new rating.
-    Denormalized for fast read performance.
+    Updated incrementally as each new rating is created, and fully recomputed
+    by the reconciliation job. Denormalized for fast read performance.
     """
 
     __tablename__ = "rating_summaries"
@@ -139,6 +152,13 @@ class RatingSummary(BaseModel):
     average_communication: Mapped[float | None] = mapped_column(nullable=True)
     average_value_for_money: Mapped[float | None] = mapped_column(nullable=True)
 
+    # Number of ratings that filled in each category (for incremental averages)
+    professionalism_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    punctuality_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    care_of_items_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    communication_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    value_for_money_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
     # Distribution (count by star rating)
     five_star_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     four_star_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
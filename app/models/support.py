@@ -1,12 +1,13 @@
 """Support ticket and issue reporting models."""
 
 import enum
+from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import CheckConstraint, ForeignKey, String, Text
+from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Index, String, Text, text
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import BaseModel
@@ -94,7 +95,6 @@ class SupportIssue(BaseModel):
         SQLEnum(IssueStatus, values_callable=lambda x: [e.value for e in x]),
         nullable=False,
         default=IssueStatus.OPEN,
-        index=True,
     )
 
     # Content
@@ -103,7 +103,7 @@ class SupportIssue(BaseModel):
 
     # Evidence
     evidence_urls: Mapped[list[str]] = mapped_column(
-        JSONB,
+        ARRAY(Text),
         nullable=False,
         default=list,
     )  # Photos/documents
@@ -115,7 +115,7 @@ class SupportIssue(BaseModel):
 
     # Resolution
     resolution_notes: Mapped[str | None] = mapped_column(Text, nullable=True)
-    resolved_at: Mapped[str | None] = mapped_column(String(30), nullable=True)
+    resolved_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     resolved_by: Mapped[UUID | None] = mapped_column(
         ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True,
@@ -123,7 +123,9 @@ class SupportIssue(BaseModel):
 
     # Refund/Compensation
     refund_amount: Mapped[float | None] = mapped_column(nullable=True)
-    refund_issued_at: Mapped[str | None] = mapped_column(String(30), nullable=True)
+    refund_issued_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
 
     # Relationships
     booking: Mapped["Booking"] = relationship("Booking")
@@ -134,6 +136,12 @@ class SupportIssue(BaseModel):
     resolved_user: Mapped["User | None"] = relationship(
         "User", foreign_keys=[resolved_by], back_populates=None
     )
+    comments: Mapped[list["IssueComment"]] = relationship(
+        "IssueComment",
+        back_populates="issue",
+        order_by="IssueComment.created_at",
+        passive_deletes=True,
+    )
 
     __table_args__ = (
         CheckConstraint(
@@ -149,6 +157,22 @@ class SupportIssue(BaseModel):
             name="valid_priority",
         ),
         CheckConstraint("refund_amount IS NULL OR refund_amount >= 0", name="non_negative_refund"),
+        # Status counts and status-filtered listings, newest first; the leading
+        # status column also covers plain status lookups
+        Index("ix_support_issues_status_created", "status", text("created_at DESC")),
+        # Working queue: only tickets still awaiting resolution
+        Index(
+            "ix_support_issues_open",
+            text("created_at DESC"),
+            postgresql_include=["status"],
+            postgresql_where=text("status IN ('open', 'in_progress', 'escalated')"),
+        ),
+        # Refund total only touches the few tickets that carry a refund
+        Index(
+            "ix_support_issues_refunds",
+            "refund_amount",
+            postgresql_where=text("refund_amount IS NOT NULL"),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -187,7 +211,7 @@ class IssueComment(BaseModel):
     # Content
     comment_text: Mapped[str] = mapped_column(Text, nullable=False)
     attachment_urls: Mapped[list[str]] = mapped_column(
-        JSONB,
+        ARRAY(Text),
         nullable=False,
         default=list,
     )
@@ -198,7 +222,7 @@ class IssueComment(BaseModel):
     )  # Only visible to platform team
 
     # Relationships
-    issue: Mapped["SupportIssue"] = relationship("SupportIssue")
+    issue: Mapped["SupportIssue"] = relationship("SupportIssue", back_populates="comments")
     author: Mapped["User | None"] = relationship("User")
 
     __table_args__ = (
@@ -1,11 +1,11 @@
 """Document verification and compliance tracking models."""
 
 import enum
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import CheckConstraint, DateTime, ForeignKey, String, Text
+from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Index, String, Text, text
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -111,8 +111,9 @@ class DocumentVerification(BaseModel):
     )  # Store additional info (e.g., extracted data)
 
     # Relationships
-    organization: Mapped["Organization | None"] = relationship("Organization")
-    driver: Mapped["Driver | None"] = relationship("Driver")
+    # lazy="raise": load explicitly (e.g. joinedload) instead of an implicit query
+    organization: Mapped["Organization | None"] = relationship("Organization", lazy="raise")
+    driver: Mapped["Driver | None"] = relationship("Driver", lazy="raise")
     reviewer: Mapped["User | None"] = relationship("User")
 
     __table_args__ = (
@@ -128,6 +129,32 @@ class DocumentVerification(BaseModel):
             "status IN ('pending', 'under_review', 'approved', 'rejected', 'expired', 'resubmission_required')",
             name="valid_verification_status",
         ),
+        # Latest submission per document type (DISTINCT ON) for an org or driver
+        Index(
+            "ix_document_verifications_org_type_created",
+            "org_id",
+            "document_type",
+            text("created_at DESC"),
+            postgresql_where=text("org_id IS NOT NULL"),
+        ),
+        Index(
+            "ix_document_verifications_driver_type_created",
+            "driver_id",
+            "document_type",
+            text("created_at DESC"),
+            postgresql_where=text("driver_id IS NOT NULL"),
+        ),
+        # Expiry reminder job (keyset-paginated by expiry_date, id): only approved
+        # documents still awaiting a reminder
+        Index(
+            "ix_document_verifications_expiry_pending_reminder",
+            "expiry_date",
+            "id",
+            postgresql_where=text(
+                "status = 'approved' AND expiry_reminder_sent = false "
+                "AND expiry_date IS NOT NULL"
+            ),
+        ),
     )
 
     @property
@@ -135,14 +162,14 @@ class DocumentVerification(BaseModel):
         """Check if document has expired."""
         if not self.expiry_date:
             return False
-        return datetime.now() > self.expiry_date
+        return datetime.now(UTC) > self.expiry_date
 
     @property
     def days_until_expiry(self) -> int | None:
         """Calculate days until document expires."""
         if not self.expiry_date:
             return None
-        delta = self.expiry_date - datetime.now()
+        delta = self.expiry_date - datetime.now(UTC)
         return max(0, delta.days)
 
     def __repr__(self) -> str:
@@ -205,8 +232,9 @@ class ComplianceAlert(BaseModel):
     )
 
     # Relationships
-    organization: Mapped["Organization | None"] = relationship("Organization")
-    driver: Mapped["Driver | None"] = relationship("Driver")
+    # lazy="raise": load explicitly (e.g. joinedload) instead of an implicit query
+    organization: Mapped["Organization | None"] = relationship("Organization", lazy="raise")
+    driver: Mapped["Driver | None"] = relationship("Driver", lazy="raise")
     document_verification: Mapped["DocumentVerification | None"] = relationship(
         "DocumentVerification"
     )
@@ -42,7 +42,15 @@ class DownloadURLRequest(BaseModel):
     """Request for presigned download URL."""
 
     file_key: str = Field(description="S3 object key")
-    expires_in: int = Field(default=3600, description="URL expiration in seconds", ge=60, le=86400)
+    expires_in: int = Field(
+        default=7200,
+        description=(
+            "URL expiration in seconds (up to 7 days less 10 minutes with static "
+            "AWS keys, 1 hour with temporary credentials)"
+        ),
+        ge=60,
+        le=604200,
+    )
 
 
 class DownloadURLResponse(BaseModel):
@@ -50,3 +58,25 @@ class DownloadURLResponse(BaseModel):
 
     download_url: str = Field(description="Presigned GET URL")
     expires_in: int = Field(description="URL expiration in seconds")
+
+
+class BatchDownloadURLRequest(BaseModel):
+    """Request for several presigned download URLs."""
+
+    file_keys: list[str] = Field(description="S3 object keys", min_length=1, max_length=100)
+    expires_in: int = Field(
+        default=7200,
+        description=(
+            "URL expiration in seconds (up to 7 days less 10 minutes with static "
+            "AWS keys, 1 hour with temporary credentials)"
+        ),
+        ge=60,
+        le=604200,
+    )
+
+
+class BatchDownloadURLResponse(BaseModel):
+    """Presigned download URLs keyed by S3 object key."""
+
+    download_urls: dict[str, str] = Field(description="Presigned GET URL per object key")
+    expires_in: int = Field(description="URL expiration in seconds")
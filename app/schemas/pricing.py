@@ -1,5 +1,9 @@
 """Pricing schemas."""
 
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cached_property
 from typing import Any, Literal
 from uuid import UUID
 
@@ -7,6 +11,9 @@ from pydantic import Field, field_validator
 
 from app.schemas.base import BaseSchema, ResourceResponse
 
+# Bits for Sunday (0) and Saturday (6), always charged by weekend rules
+WEEKEND_DAY_MASK = (1 << 0) | (1 << 6)
+
 
 class SurchargeRule(BaseSchema):
     """Surcharge rule for pricing calculations."""
@@ -31,6 +38,18 @@ class SurchargeRule(BaseSchema):
                 raise ValueError("Days must be between 0 (Sunday) and 6 (Saturday)")
         return v
 
+    @cached_property
+    def day_mask(self) -> int:
+        """
+        Bitmask of days this rule applies to (bit 0=Sunday ... bit 6=Saturday).
+
+        Weekend rules always include Saturday and Sunday.
+        """
+        mask = WEEKEND_DAY_MASK if self.type == "weekend" else 0
+        for day in self.days or ():
+            mask |= 1 << (day % 7)
+        return mask
+
 
 class PricingConfigBase(BaseSchema):
     """Base pricing configuration schema."""
@@ -76,3 +95,39 @@ class PriceEstimate(BaseSchema):
     estimated_amount: float = Field(..., ge=0, description="Total estimated amount")
     platform_fee: float = Field(..., ge=0, description="Platform fee (5%)")
     breakdown: PriceBreakdown = Field(..., description="Detailed price breakdown")
+
+
+@dataclass(frozen=True, slots=True)
+class BookingContext:
+    """
+    Booking details consumed by the pricing engine.
+
+    Built once per price calculation so surcharge rules read typed attributes
+    instead of repeating dict lookups. ``special_items`` is lowercased up front.
+    """
+
+    estimated_duration_hours: float = 0.0
+    estimated_distance_miles: float = 0.0
+    pickup_floors: int = 0
+    dropoff_floors: int = 0
+    has_elevator_pickup: bool = False
+    has_elevator_dropoff: bool = False
+    move_date: datetime | None = None
+    special_items: frozenset[str] = frozenset()
+
+    @classmethod
+    def from_dict(cls, booking_details: Mapping[str, Any]) -> "BookingContext":
+        """Build a context from a plain booking details mapping."""
+        move_date = booking_details.get("move_date")
+        return cls(
+            estimated_duration_hours=booking_details.get("estimated_duration_hours") or 0.0,
+            estimated_distance_miles=booking_details.get("estimated_distance_miles") or 0.0,
+            pickup_floors=booking_details.get("pickup_floors") or 0,
+            dropoff_floors=booking_details.get("dropoff_floors") or 0,
+            has_elevator_pickup=bool(booking_details.get("has_elevator_pickup", False)),
+            has_elevator_dropoff=bool(booking_details.get("has_elevator_dropoff", False)),
+            move_date=move_date if isinstance(move_date, datetime) else None,
+            special_items=frozenset(
+                item.lower() for item in booking_details.get("special_items") or ()
+            ),
+        )
@@ -67,7 +67,7 @@ class RatingResponse(BaseSchema):
     customer_name: str
 
     mover_response: str | None
-    mover_responded_at: str | None
+    mover_responded_at: datetime | None
 
     is_published: bool
     is_verified_booking: bool
@@ -102,13 +102,12 @@ class RatingSummaryResponse(BaseSchema):
 
 
 class RatingListResponse(BaseSchema):
-    """Schema for paginated rating list."""
+    """Schema for cursor-paginated rating list."""
 
     ratings: list[RatingResponse]
-    total: int
-    page: int
     page_size: int
     has_more: bool
+    next_cursor: str | None = Field(None, description="Cursor for fetching the next page")
 
 
 class RatingStatsResponse(BaseSchema):
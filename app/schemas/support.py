@@ -63,10 +63,10 @@ class SupportIssueResponse(BaseModel):
     reporter_email: str
     reporter_phone: str | None
     resolution_notes: str | None
-    resolved_at: str | None
+    resolved_at: datetime | None
     resolved_by: UUID | None
     refund_amount: float | None
-    refund_issued_at: str | None
+    refund_issued_at: datetime | None
     created_at: datetime
     updated_at: datetime
 
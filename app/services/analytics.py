@@ -1,10 +1,12 @@
 """Analytics and dashboard service."""
 
+import heapq
 import logging
+from collections import Counter
 from datetime import datetime, timedelta
 from uuid import UUID
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import Row, and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.observability import tracer
@@ -29,6 +31,9 @@ from app.schemas.analytics import (
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round-trip when streaming ratings for metrics
+RATING_METRICS_CHUNK_SIZE = 1000
+
 
 class AnalyticsService:
     """Service for analytics and dashboard data."""
@@ -251,11 +256,35 @@ class AnalyticsService:
         with tracer.start_as_current_span("analytics.rating_metrics") as span:
             span.set_attribute("org_id", str(org_id))
 
-            # Get all ratings for organization
-            result = await db.execute(select(Rating).where(Rating.org_id == org_id))
-            ratings = result.scalars().all()
+            # Stream only the columns used below in fixed-size chunks (server-side
+            # cursor), so peak memory stays flat regardless of the org's rating count
+            stmt = (
+                select(
+                    Rating.overall_rating,
+                    Rating.review_text,
+                    Rating.created_at,
+                    Rating.booking_id,
+                )
+                .where(Rating.org_id == org_id)
+                .execution_options(yield_per=RATING_METRICS_CHUNK_SIZE)
+            )
+            result = await db.stream(stmt)
+
+            star_counts: Counter[int] = Counter()
+            rating_sum = 0
+            latest_reviews: list[Row] = []
+            async for partition in result.partitions():
+                overalls = [r.overall_rating for r in partition]
+                star_counts.update(overalls)
+                rating_sum += sum(overalls)
+                # Keep only the 5 newest commented reviews seen so far
+                latest_reviews = heapq.nlargest(
+                    5,
+                    [*latest_reviews, *(r for r in partition if r.review_text)],
+                    key=lambda r: r.created_at,
+                )
 
-            total = len(ratings)
+            total = star_counts.total()
             if total == 0:
                 return RatingMetrics(
                     total_ratings=0,
@@ -269,18 +298,10 @@ class AnalyticsService:
                     recent_reviews=[],
                 )
 
-            # Calculate distribution
-            five_star = sum(1 for r in ratings if r.overall_rating == 5)
-            four_star = sum(1 for r in ratings if r.overall_rating == 4)
-            three_star = sum(1 for r in ratings if r.overall_rating == 3)
-            two_star = sum(1 for r in ratings if r.overall_rating == 2)
-            one_star = sum(1 for r in ratings if r.overall_rating == 1)
-
-            average_rating = sum(r.overall_rating for r in ratings) / total
+            distribution = {stars: star_counts[stars] for stars in range(1, 6)}
+            average_rating = rating_sum / total
 
-            # Get recent reviews (last 5 with comments)
-            reviews_with_comments = [r for r in ratings if r.review_text]
-            reviews_with_comments.sort(key=lambda x: x.created_at, reverse=True)
+            # Recent reviews (last 5 with comments)
             recent_reviews = [
                 {
                     "rating": r.overall_rating,
@@ -288,24 +309,18 @@ class AnalyticsService:
                     "created_at": r.created_at.isoformat(),
                     "booking_id": str(r.booking_id),
                 }
-                for r in reviews_with_comments[:5]
+                for r in latest_reviews
             ]
 
             return RatingMetrics(
                 total_ratings=total,
                 average_rating=average_rating,
-                five_star_count=five_star,
-                four_star_count=four_star,
-                three_star_count=three_star,
-                two_star_count=two_star,
-                one_star_count=one_star,
-                rating_distribution={
-                    1: one_star,
-                    2: two_star,
-                    3: three_star,
-                    4: four_star,
-                    5: five_star,
-                },
+                five_star_count=distribution[5],
+                four_star_count=distribution[4],
+                three_star_count=distribution[3],
+                two_star_count=distribution[2],
+                one_star_count=distribution[1],
+                rating_distribution=distribution,
                 recent_reviews=recent_reviews,
             )
 
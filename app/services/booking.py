@@ -25,6 +25,7 @@ from app.schemas.booking import (
     BookingResponse,
     BookingUpdate,
 )
+from app.schemas.pricing import BookingContext
 from app.services.pricing import PricingService
 
 logger = logging.getLogger(__name__)
@@ -196,18 +197,18 @@ class BookingService:
             )
 
             # Calculate pricing
-            booking_details = {
-                "estimated_duration_hours": booking_data.estimated_duration_hours,
-                "estimated_distance_miles": booking_data.estimated_distance_miles,
-                "special_items": booking_data.special_items,
-                "pickup_floors": booking_data.pickup_floors,
-                "dropoff_floors": booking_data.dropoff_floors,
-                "has_elevator_pickup": booking_data.has_elevator_pickup,
-                "has_elevator_dropoff": booking_data.has_elevator_dropoff,
-                "move_date": booking_data.move_date,
-            }
-
-            price_estimate = PricingService.calculate_price(pricing_config, booking_details)
+            booking_context = BookingContext(
+                estimated_duration_hours=booking_data.estimated_duration_hours,
+                estimated_distance_miles=booking_data.estimated_distance_miles,
+                special_items=frozenset(item.lower() for item in booking_data.special_items or ()),
+                pickup_floors=booking_data.pickup_floors,
+                dropoff_floors=booking_data.dropoff_floors,
+                has_elevator_pickup=booking_data.has_elevator_pickup,
+                has_elevator_dropoff=booking_data.has_elevator_dropoff,
+                move_date=booking_data.move_date,
+            )
+
+            price_estimate = PricingService.calculate_price(pricing_config, booking_context)
 
             # Create booking object
             booking = Booking(
@@ -12,8 +12,8 @@ from app.core.observability import tracer
 from app.models.booking import Booking, BookingStatus
 from app.models.booking_status_history import BookingStatusHistory
 from app.models.user import User
-from app.services.notification_templates import EmailTemplates, SMSTemplates
-from app.services.notifications import NotificationService
+from app.services.notification_templates import SMSTemplates, email_templates
+from app.services.notifications import get_notification_service
 
 logger = logging.getLogger(__name__)
 
@@ -182,8 +182,7 @@ class BookingStatusService:
             new_status: New status
         """
         with tracer.start_as_current_span("booking_status.send_notifications"):
-            notification_service = NotificationService()
-            email_templates = EmailTemplates()
+            notification_service = get_notification_service()
             sms_templates = SMSTemplates()
 
             # Prepare booking details for templates
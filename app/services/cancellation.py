@@ -16,8 +16,8 @@ from app.models.cancellation import (
     RefundStatus,
 )
 from app.services.booking_status import BookingStatusService
-from app.services.notification_templates import EmailTemplates, SMSTemplates
-from app.services.notifications import NotificationService
+from app.services.notification_templates import SMSTemplates, email_templates
+from app.services.notifications import get_notification_service
 from app.services.payments import PaymentService
 
 logger = logging.getLogger(__name__)
@@ -296,8 +296,7 @@ class CancellationService:
             refund_percentage: Refund percentage
         """
         with tracer.start_as_current_span("cancellation.send_notifications"):
-            notification_service = NotificationService()
-            email_templates = EmailTemplates()
+            notification_service = get_notification_service()
             sms_templates = SMSTemplates()
 
             # Prepare cancellation data
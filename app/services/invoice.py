@@ -22,9 +22,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.observability import tracer
 from app.models.booking import Booking, BookingStatus
 from app.models.invoice import Invoice, InvoiceStatus
-from app.services.notification_templates import EmailTemplates
-from app.services.notifications import NotificationService
-from app.services.s3 import S3Service
+from app.services.notification_templates import email_templates
+from app.services.notifications import get_notification_service
+from app.services.s3 import get_s3_service
 
 logger = logging.getLogger(__name__)
 
@@ -427,7 +427,7 @@ class InvoiceService:
             )
 
             # Upload to S3
-            s3_service = S3Service()
+            s3_service = get_s3_service()
             filename = f"invoices/{invoice.invoice_number}.pdf"
 
             pdf_url = await s3_service.upload_file(
@@ -463,8 +463,7 @@ class InvoiceService:
             result = await db.execute(select(Booking).where(Booking.id == invoice.booking_id))
             booking = result.scalar_one()
 
-            notification_service = NotificationService()
-            email_templates = EmailTemplates()
+            notification_service = get_notification_service()
 
             booking_details = {
                 "booking_id": str(booking.id),
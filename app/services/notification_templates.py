@@ -4,6 +4,7 @@ Comprehensive notification templates for all workflow events.
 Provides HTML email templates and SMS messages for customer and mover notifications.
 """
 
+from html import escape
 from typing import Any
 
 
@@ -421,6 +422,58 @@ class EmailTemplates:
         """
         return subject, html
 
+    @staticmethod
+    def support_ticket_resolved(data: dict[str, Any]) -> tuple[str, str]:
+        """Email to reporter when their support ticket is resolved."""
+        subject = f"Support Ticket Resolved - #{data['ticket_id']}"
+
+        # Reporter name and resolution notes are user-entered; escape them
+        refund_html = (
+            f"<p><strong>Refund Amount:</strong> ${data['refund_amount']:.2f}</p>"
+            if data.get("refund_amount")
+            else ""
+        )
+
+        html = f"""
+        <html>
+        <body>
+            <h2>Support Ticket Resolved</h2>
+            <p>Dear {escape(data['reporter_name'])},</p>
+            <p>Your support ticket has been resolved.</p>
+            <p><strong>Ticket ID:</strong> {data['ticket_id']}</p>
+            <p><strong>Issue Type:</strong> {data['issue_type']}</p>
+            <p><strong>Resolution:</strong> {escape(data['resolution_notes'])}</p>
+            {refund_html}
+            <p>Thank you for your patience.</p>
+        </body>
+        </html>
+        """
+        return subject, html
+
+    @staticmethod
+    def document_verification_update(data: dict[str, Any]) -> tuple[str, str]:
+        """Email to an organization or driver when a document review changes its status."""
+        document_type = data["document_type"]
+
+        # Recipient name, message and review notes carry user-entered text; escape them
+        review_notes = escape(data.get("review_notes") or "")
+
+        review_notes_html = f"<p>Review Notes: {review_notes}</p>" if review_notes else ""
+
+        html = f"""
+        <html>
+        <body>
+            <h2>Document Verification Update</h2>
+            <p>Dear {escape(data['recipient_name'])},</p>
+            <p>{escape(data['message'])}</p>
+            <p>Document Type: {document_type}</p>
+            {review_notes_html}
+            <p>Thank you,<br>MoveHub Platform Team</p>
+        </body>
+        </html>
+        """
+        return data["subject"], html
+
 
 class SMSTemplates:
     """SMS templates for critical notifications."""
@@ -466,3 +519,7 @@ class SMSTemplates:
             f"MoveHub: Reminder - Your move is tomorrow at {data['move_time']}. "
             f"Pickup: {data['pickup_address']}. Contact: {data['mover_phone']}"
         )
+
+
+# Shared instance; all templates are stateless static methods
+email_templates = EmailTemplates()
@@ -4,7 +4,9 @@ Notification service for email and SMS.
 Integrates with SendGrid (email) and Twilio (SMS).
 """
 
+import asyncio
 import logging
+from functools import lru_cache
 from typing import Any
 
 from sendgrid import SendGridAPIClient
@@ -78,7 +80,8 @@ class NotificationService:
                 if plain_content:
                     mail.add_content(Content("text/plain", plain_content))
 
-                response = self.sendgrid_client.send(mail)
+                # The SendGrid client is blocking; keep its HTTP round-trip off the event loop
+                response = await asyncio.to_thread(self.sendgrid_client.send, mail)
 
                 if response.status_code in [200, 201, 202]:
                     logger.info(
@@ -117,7 +120,9 @@ class NotificationService:
                 return False
 
             try:
-                message_obj = self.twilio_client.messages.create(
+                # The Twilio client is blocking; keep its HTTP round-trip off the event loop
+                message_obj = await asyncio.to_thread(
+                    self.twilio_client.messages.create,
                     body=message,
                     from_=self.twilio_phone,
                     to=to_phone,
@@ -219,3 +224,9 @@ class NotificationService:
         """
         message = f"Your MoveHub verification code is: {otp_code}. Valid for 10 minutes."
         return await self.send_sms(phone, message)
+
+
+@lru_cache
+def get_notification_service() -> NotificationService:
+    """Get the shared notification service (SendGrid/Twilio clients built once)."""
+    return NotificationService()
@@ -5,6 +5,8 @@ Handles payment processing with platform fees for marketplace model.
 """
 
 import logging
+import socket
+from decimal import ROUND_HALF_UP, Decimal
 from typing import Any
 
 import stripe
@@ -18,9 +20,34 @@ logger = logging.getLogger(__name__)
 stripe.api_key = settings.STRIPE_SECRET_KEY
 
 
+def to_cents(amount: float) -> int:
+    """
+    Convert a USD amount to integer cents.
+
+    Goes through Decimal so float artifacts (19.99 * 100 == 1998.99...) round to
+    the intended cent instead of being truncated.
+    """
+    return int((Decimal(str(amount)) * 100).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+
+
 class PaymentService:
     """Service for Stripe payment processing."""
 
+    @staticmethod
+    def warm_up() -> None:
+        """
+        Pre-open the connection to the Stripe API.
+
+        Resolves api.stripe.com and performs a cheap authenticated call so the
+        first real payment request reuses a warm DNS entry and TLS connection.
+        Runs on the calling thread on purpose: the Stripe client keeps its HTTP
+        session per thread, and payment calls are issued from the event loop thread.
+        """
+        with tracer.start_as_current_span("payment.warm_up"):
+            socket.getaddrinfo("api.stripe.com", 443, type=socket.SOCK_STREAM)
+            stripe.Account.retrieve()
+            logger.info("Stripe connection warmed up")
+
     @staticmethod
     async def create_payment_intent(
         amount: float,
@@ -48,8 +75,8 @@ class PaymentService:
 
             try:
                 # Convert to cents
-                amount_cents = int(amount * 100)
-                fee_cents = int(platform_fee * 100)
+                amount_cents = to_cents(amount)
+                fee_cents = to_cents(platform_fee)
 
                 # Create payment intent with destination charge
                 # Platform receives fee, organization receives rest
@@ -218,7 +245,7 @@ class PaymentService:
                 }
 
                 if amount:
-                    refund_params["amount"] = int(amount * 100)
+                    refund_params["amount"] = to_cents(amount)
                     span.set_attribute("payment.refund_amount", amount)
 
                 if reason:
@@ -10,11 +10,23 @@ from datetime import datetime, time
 from typing import Any
 
 from app.core.config import settings
-from app.core.observability import pricing_calculation_histogram, tracer
-from app.schemas.pricing import PriceBreakdown, PriceEstimate, PricingConfigResponse, SurchargeRule
+from app.core.observability import pricing_metrics_buffer, tracer
+from app.schemas.pricing import (
+    BookingContext,
+    PriceBreakdown,
+    PriceEstimate,
+    PricingConfigResponse,
+    SurchargeRule,
+)
 
 logger = logging.getLogger(__name__)
 
+# Rule types matched against the booking's special items
+SPECIAL_ITEM_RULE_TYPES = frozenset({"piano", "fragile", "antiques"})
+
+# Rule types that depend on the move date/time
+TIME_BASED_RULE_TYPES = frozenset({"weekend", "after_hours", "holiday"})
+
 
 class PricingService:
     """Service for calculating booking prices based on configurable rules."""
@@ -23,7 +35,7 @@ class PricingService:
     def _apply_surcharge_rule(
         rule: SurchargeRule,
         base_amount: float,
-        booking_details: dict[str, Any],
+        ctx: BookingContext,
     ) -> tuple[float, dict[str, Any]]:
         """
         Apply a single surcharge rule.
@@ -31,7 +43,7 @@ class PricingService:
         Args:
             rule: Surcharge rule configuration
             base_amount: Base amount before surcharge
-            booking_details: Booking information for context
+            ctx: Booking context for the calculation
 
         Returns:
             Tuple of (surcharge_amount, surcharge_details)
@@ -45,18 +57,12 @@ class PricingService:
 
         # Stairs surcharge
         if rule.type == "stairs":
-            # Calculate stairs separately for pickup and dropoff
-            pickup_floors = booking_details.get("pickup_floors", 0)
-            dropoff_floors = booking_details.get("dropoff_floors", 0)
-            has_elevator_pickup = booking_details.get("has_elevator_pickup", False)
-            has_elevator_dropoff = booking_details.get("has_elevator_dropoff", False)
-
             # Count flights only at locations without elevators
             flights_charged = 0
-            if pickup_floors > 0 and not has_elevator_pickup:
-                flights_charged += pickup_floors
-            if dropoff_floors > 0 and not has_elevator_dropoff:
-                flights_charged += dropoff_floors
+            if ctx.pickup_floors > 0 and not ctx.has_elevator_pickup:
+                flights_charged += ctx.pickup_floors
+            if ctx.dropoff_floors > 0 and not ctx.has_elevator_dropoff:
+                flights_charged += ctx.dropoff_floors
 
             if flights_charged > 0:
                 if rule.per_flight and rule.amount:
@@ -70,23 +76,23 @@ class PricingService:
                     details["amount"] = surcharge
 
         # Special items (piano, fragile, etc.)
-        elif rule.type in ["piano", "fragile", "antiques"]:
-            special_items = booking_details.get("special_items", [])
-            if rule.type in [item.lower() for item in special_items]:
+        elif rule.type in SPECIAL_ITEM_RULE_TYPES:
+            if rule.type in ctx.special_items:
                 if rule.amount:
                     surcharge = rule.amount
                     details["applied"] = True
                     details["amount"] = surcharge
 
         # Time-based surcharges (weekend, after_hours, holiday)
-        elif rule.type in ["weekend", "after_hours", "holiday"]:
-            move_date = booking_details.get("move_date")
-            if not move_date or not isinstance(move_date, datetime):
+        elif rule.type in TIME_BASED_RULE_TYPES:
+            move_date = ctx.move_date
+            if move_date is None:
                 return 0.0, details
 
             # Weekend surcharge
             if rule.type == "weekend" and rule.days:
-                if move_date.weekday() in [6, 0] or move_date.isoweekday() in rule.days:
+                # isoweekday() % 7 maps to the rule's 0=Sunday ... 6=Saturday convention
+                if (1 << (move_date.isoweekday() % 7)) & rule.day_mask:
                     if rule.multiplier:
                         surcharge = base_amount * (rule.multiplier - 1.0)
                         details["applied"] = True
@@ -114,8 +120,7 @@ class PricingService:
 
         # Distance-based surcharge
         elif rule.type == "distance":
-            distance = booking_details.get("estimated_distance_miles", 0)
-            if rule.amount and distance > 50:  # Long distance threshold
+            if rule.amount and ctx.estimated_distance_miles > 50:  # Long distance threshold
                 surcharge = rule.amount
                 details["applied"] = True
                 details["amount"] = surcharge
@@ -133,14 +138,15 @@ class PricingService:
     @staticmethod
     def calculate_price(
         pricing_config: PricingConfigResponse,
-        booking_details: dict[str, Any],
+        booking_details: dict[str, Any] | BookingContext,
     ) -> PriceEstimate:
         """
         Calculate total price for a booking.
 
         Args:
             pricing_config: Organization's pricing configuration
-            booking_details: Booking information including distance, duration, special items, etc.
+            booking_details: Booking information including distance, duration, special items,
+                etc. Plain dicts are converted to a BookingContext once up front.
 
         Returns:
             PriceEstimate with total and breakdown
@@ -149,8 +155,12 @@ class PricingService:
             start_time = datetime.now()
 
             # Extract booking details
-            duration_hours = booking_details.get("estimated_duration_hours", 0)
-            distance_miles = booking_details.get("estimated_distance_miles", 0)
+            if isinstance(booking_details, BookingContext):
+                ctx = booking_details
+            else:
+                ctx = BookingContext.from_dict(booking_details)
+            duration_hours = ctx.estimated_duration_hours
+            distance_miles = ctx.estimated_distance_miles
 
             # Calculate base costs
             base_hourly_cost = float(pricing_config.base_hourly_rate) * duration_hours
@@ -169,7 +179,7 @@ class PricingService:
 
             for rule in pricing_config.surcharge_rules:
                 surcharge_amount, surcharge_details = PricingService._apply_surcharge_rule(
-                    rule, base_subtotal, booking_details
+                    rule, base_subtotal, ctx
                 )
 
                 if surcharge_details["applied"]:
@@ -203,7 +213,7 @@ class PricingService:
 
             # Record metrics
             duration_ms = (datetime.now() - start_time).total_seconds() * 1000
-            pricing_calculation_histogram.record(duration_ms)
+            pricing_metrics_buffer.append(duration_ms)
 
             span.set_attribute("pricing.total_surcharges", total_surcharges)
             span.set_attribute("pricing.minimum_applied", minimum_applied)
@@ -4,21 +4,45 @@ Rating service for managing customer reviews and ratings.
 Handles rating creation, aggregation, and statistics calculation.
 """
 
+import asyncio
+import base64
+import binascii
 import logging
 from datetime import UTC, datetime, timedelta
-from uuid import UUID
+from typing import Any, NoReturn
+from uuid import UUID, uuid4
 
-from sqlalchemy import func, select
+from sqlalchemy import exists, func, literal, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.database import get_engine, get_session_factory
 from app.core.observability import tracer
 from app.models.booking import Booking, BookingStatus
 from app.models.rating import Rating, RatingSummary
-from app.schemas.rating import RatingCreate, RatingUpdate
+from app.schemas.rating import RatingCreate, RatingSummaryResponse, RatingUpdate
+from app.services.redis_cache import get_redis_cache
 
 logger = logging.getLogger(__name__)
 
+# (Rating column, RatingSummary average column, RatingSummary count column)
+CATEGORY_SUMMARY_FIELDS = (
+    ("professionalism_rating", "average_professionalism", "professionalism_count"),
+    ("punctuality_rating", "average_punctuality", "punctuality_count"),
+    ("care_of_items_rating", "average_care_of_items", "care_of_items_count"),
+    ("communication_rating", "average_communication", "communication_count"),
+    ("value_for_money_rating", "average_value_for_money", "value_for_money_count"),
+)
+
+STAR_COUNT_FIELDS = {
+    5: "five_star_count",
+    4: "four_star_count",
+    3: "three_star_count",
+    2: "two_star_count",
+    1: "one_star_count",
+}
+
 
 class RatingAlreadyExistsError(Exception):
     """Raised when trying to create a duplicate rating for a booking."""
@@ -32,6 +56,28 @@ class BookingNotEligibleError(Exception):
     pass
 
 
+def encode_rating_cursor(cursor: tuple[datetime, UUID]) -> str:
+    """Encode a (created_at, id) keyset cursor as an opaque URL-safe string."""
+    created_at, rating_id = cursor
+    raw = f"{created_at.isoformat()}|{rating_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_rating_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by encode_rating_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, rating_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(rating_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
 class RatingService:
     """Service for managing ratings and reviews."""
 
@@ -62,61 +108,56 @@ class RatingService:
             span.set_attribute("booking_id", str(rating_data.booking_id))
             span.set_attribute("overall_rating", rating_data.overall_rating)
 
-            # Get booking
-            stmt = select(Booking).where(Booking.id == rating_data.booking_id)
-            result = await db.execute(stmt)
-            booking = result.scalar_one_or_none()
-
-            if not booking:
-                raise BookingNotEligibleError("Booking not found")
-
-            # Verify booking is completed
-            if booking.status != BookingStatus.COMPLETED:
-                raise BookingNotEligibleError("Can only rate completed bookings")
-
-            # Verify customer
-            if booking.customer_email != customer_email:
-                raise BookingNotEligibleError("Customer email does not match booking")
-
-            # Check if rating already exists
-            rating_stmt = select(Rating).where(Rating.booking_id == rating_data.booking_id)
-            rating_result = await db.execute(rating_stmt)
-            existing = rating_result.scalar_one_or_none()
-
-            if existing:
-                raise RatingAlreadyExistsError("Rating already exists for this booking")
-
-            # Create rating
-            rating = Rating(
-                booking_id=rating_data.booking_id,
-                org_id=booking.org_id,
-                overall_rating=rating_data.overall_rating,
-                professionalism_rating=rating_data.professionalism_rating,
-                punctuality_rating=rating_data.punctuality_rating,
-                care_of_items_rating=rating_data.care_of_items_rating,
-                communication_rating=rating_data.communication_rating,
-                value_for_money_rating=rating_data.value_for_money_rating,
-                review_text=rating_data.review_text,
-                review_title=rating_data.review_title,
-                customer_name=customer_name,
-                is_published=True,
-                is_verified_booking=True,
+            # Insert only if the booking is completed, belongs to this customer and has
+            # no rating yet - eligibility check and insert in a single round-trip
+            values: dict[str, Any] = {
+                "id": uuid4(),
+                "booking_id": rating_data.booking_id,
+                "overall_rating": rating_data.overall_rating,
+                "professionalism_rating": rating_data.professionalism_rating,
+                "punctuality_rating": rating_data.punctuality_rating,
+                "care_of_items_rating": rating_data.care_of_items_rating,
+                "communication_rating": rating_data.communication_rating,
+                "value_for_money_rating": rating_data.value_for_money_rating,
+                "review_text": rating_data.review_text,
+                "review_title": rating_data.review_title,
+                "customer_name": customer_name,
+                "is_published": True,
+                "is_verified_booking": True,
+            }
+            eligible_booking = select(
+                Booking.org_id,
+                *(literal(value, getattr(Rating, name).type) for name, value in values.items()),
+            ).where(
+                Booking.id == rating_data.booking_id,
+                Booking.status == BookingStatus.COMPLETED,
+                Booking.customer_email == customer_email,
+                ~exists().where(Rating.booking_id == rating_data.booking_id),
+            )
+            stmt = (
+                insert(Rating).from_select(["org_id", *values], eligible_booking).returning(Rating)
             )
 
             try:
-                db.add(rating)
-                await db.commit()
-                await db.refresh(rating)
+                rating = (await db.scalars(stmt)).one_or_none()
 
-                # Update rating summary asynchronously
-                await RatingService._update_rating_summary(db, booking.org_id)
+                if rating is None:
+                    await RatingService._raise_ineligible(
+                        db, rating_data.booking_id, customer_email
+                    )
+
+                # Fold the new rating into the summary in the same transaction
+                await RatingService._apply_rating_to_summary(db, rating)
+
+                await db.commit()
+                await get_redis_cache().invalidate_rating_summary(rating.org_id)
 
                 logger.info(
                     f"Rating created: {rating.id}",
                     extra={
                         "rating_id": str(rating.id),
-                        "booking_id": str(booking.id),
-                        "org_id": str(booking.org_id),
+                        "booking_id": str(rating.booking_id),
+                        "org_id": str(rating.org_id),
                         "overall_rating": rating.overall_rating,
                     },
                 )
@@ -128,6 +169,36 @@ class RatingService:
                 logger.error(f"Failed to create rating: {e}")
                 raise RatingAlreadyExistsError("Rating already exists for this booking") from e
 
+    @staticmethod
+    async def _raise_ineligible(
+        db: AsyncSession,
+        booking_id: UUID,
+        customer_email: str,
+    ) -> NoReturn:
+        """
+        Explain why a rating insert matched no eligible booking.
+
+        Only runs on the error path, after the combined insert returned no row.
+        """
+        stmt = select(Booking.status, Booking.customer_email).where(Booking.id == booking_id)
+        row = (await db.execute(stmt)).one_or_none()
+
+        if row is None:
+            raise BookingNotEligibleError("Booking not found")
+
+        status, booking_email = row
+
+        # Verify booking is completed
+        if status != BookingStatus.COMPLETED:
+            raise BookingNotEligibleError("Can only rate completed bookings")
+
+        # Verify customer
+        if booking_email != customer_email:
+            raise BookingNotEligibleError("Customer email does not match booking")
+
+        # Eligible booking, so the NOT EXISTS guard is what filtered it out
+        raise RatingAlreadyExistsError("Rating already exists for this booking")
+
     @staticmethod
     async def add_mover_response(
         db: AsyncSession,
@@ -158,7 +229,8 @@ class RatingService:
                 raise ValueError("Rating not found")
 
             rating.mover_response = response_data.mover_response
-            rating.mover_responded_at = datetime.now(UTC).isoformat()
+            # Database clock, same source as created_at/updated_at
+            rating.mover_responded_at = func.now()  # type: ignore[assignment]
 
             await db.commit()
             await db.refresh(rating)
@@ -189,21 +261,24 @@ class RatingService:
         db: AsyncSession,
         org_id: UUID,
         limit: int = 50,
-        offset: int = 0,
+        cursor: tuple[datetime, UUID] | None = None,
         published_only: bool = True,
-    ) -> tuple[list[Rating], int]:
+    ) -> tuple[list[Rating], tuple[datetime, UUID] | None]:
         """
-        List ratings for an organization.
+        List ratings for an organization, newest first.
+
+        Uses keyset pagination on (created_at, id) so each page is an index seek
+        instead of scanning and discarding OFFSET rows.
 
         Args:
             db: Database session
             org_id: Organization ID
             limit: Max number of results
-            offset: Pagination offset
+            cursor: (created_at, id) of the last rating on the previous page
             published_only: Only return published ratings
 
         Returns:
-            Tuple of (ratings list, total count)
+            Tuple of (ratings list, cursor for the next page or None if no more)
         """
         with tracer.start_as_current_span("rating.list") as span:
             span.set_attribute("org_id", str(org_id))
@@ -212,120 +287,194 @@ class RatingService:
             stmt = select(Rating).where(Rating.org_id == org_id)
             if published_only:
                 stmt = stmt.where(Rating.is_published == True)  # noqa: E712
+            if cursor:
+                stmt = stmt.where(tuple_(Rating.created_at, Rating.id) < cursor)
 
-            # Get total count
-            count_stmt = select(func.count()).select_from(stmt.subquery())
-            count_result = await db.execute(count_stmt)
-            total = count_result.scalar() or 0
-
-            # Get paginated results
-            stmt = stmt.order_by(Rating.created_at.desc()).limit(limit).offset(offset)
+            # Fetch one extra row to know whether another page exists
+            stmt = stmt.order_by(Rating.created_at.desc(), Rating.id.desc()).limit(limit + 1)
             ratings_result = await db.execute(stmt)
             ratings = list(ratings_result.scalars().all())
 
-            span.set_attribute("total_ratings", total)
+            next_cursor: tuple[datetime, UUID] | None = None
+            if len(ratings) > limit:
+                ratings = ratings[:limit]
+                next_cursor = (ratings[-1].created_at, ratings[-1].id)
+
             span.set_attribute("returned_count", len(ratings))
+            span.set_attribute("has_more", next_cursor is not None)
 
-            return ratings, total
+            return ratings, next_cursor
 
     @staticmethod
-    async def get_rating_summary(db: AsyncSession, org_id: UUID) -> RatingSummary | None:
-        """Get rating summary for an organization."""
+    async def get_rating_summary(db: AsyncSession, org_id: UUID) -> RatingSummaryResponse | None:
+        """
+        Get rating summary for an organization.
+
+        Served from Redis when cached; summaries are invalidated whenever they change.
+        The cache is only filled from primary reads: a lagging replica read right after
+        an invalidation would otherwise re-cache the pre-rating summary for the full TTL.
+        """
+        cache = get_redis_cache()
+        cached = await cache.get_cached_rating_summary(org_id)
+        if cached is not None:
+            return RatingSummaryResponse.model_validate(cached)
+
         stmt = select(RatingSummary).where(RatingSummary.org_id == org_id)
         result = await db.execute(stmt)
-        return result.scalar_one_or_none()
+        summary = result.scalar_one_or_none()
+        if summary is None:
+            return None
+
+        response = RatingSummaryResponse.model_validate(summary)
+        if db.bind is get_engine():
+            await cache.cache_rating_summary(org_id, response.model_dump())
+        return response
+
+    @staticmethod
+    async def _apply_rating_to_summary(db: AsyncSession, rating: Rating) -> None:
+        """
+        Incrementally add a new published rating to its organization's summary.
+
+        Single upsert: the first rating inserts the summary row, later ratings bump
+        the counters and running averages in place, so the cost is O(1) per rating.
+        Does not commit.
+        """
+        with tracer.start_as_current_span("rating.apply_to_summary") as span:
+            span.set_attribute("org_id", str(rating.org_id))
+
+            summary = RatingSummary.__table__.c
+            star_field = STAR_COUNT_FIELDS[rating.overall_rating]
+
+            values: dict[str, Any] = {
+                "org_id": rating.org_id,
+                "total_ratings": 1,
+                "average_overall_rating": float(rating.overall_rating),
+                **{field: 0 for field in STAR_COUNT_FIELDS.values()},
+                star_field: 1,
+            }
+            updates: dict[str, Any] = {
+                "total_ratings": summary.total_ratings + 1,
+                "average_overall_rating": (
+                    summary.average_overall_rating * summary.total_ratings + rating.overall_rating
+                )
+                / (summary.total_ratings + 1),
+                star_field: summary[star_field] + 1,
+                "updated_at": func.now(),
+            }
+
+            for rating_field, average_field, count_field in CATEGORY_SUMMARY_FIELDS:
+                value = getattr(rating, rating_field)
+                if value is None:
+                    values[average_field] = None
+                    values[count_field] = 0
+                    continue
+                values[average_field] = float(value)
+                values[count_field] = 1
+                updates[average_field] = (
+                    func.coalesce(summary[average_field], 0.0) * summary[count_field] + value
+                ) / (summary[count_field] + 1)
+                updates[count_field] = summary[count_field] + 1
+
+            stmt = (
+                insert(RatingSummary)
+                .values(**values)
+                .on_conflict_do_update(index_elements=[RatingSummary.org_id], set_=updates)
+            )
+            await db.execute(stmt)
 
     @staticmethod
-    async def _update_rating_summary(db: AsyncSession, org_id: UUID) -> None:
+    async def reconcile_rating_summary(db: AsyncSession, org_id: UUID) -> bool:
         """
-        Update or create rating summary for an organization.
+        Recompute an organization's rating summary from the ratings table.
+
+        Reconciliation path: create_rating maintains the summary incrementally via
+        _apply_rating_to_summary; this corrects any drift. The summary row is locked
+        before aggregating, so a concurrent incremental upsert either committed first
+        (and is counted) or waits and applies on top of the rebuilt values. Commits.
+
+        Args:
+            db: Database session
+            org_id: Organization ID
 
-        Calculates all aggregate statistics from existing ratings.
+        Returns:
+            True if the summary was rewritten, False if the org has no summary yet
         """
-        with tracer.start_as_current_span("rating.update_summary") as span:
+        with tracer.start_as_current_span("rating.reconcile_summary") as span:
             span.set_attribute("org_id", str(org_id))
 
-            # Get all published ratings
-            stmt = select(Rating).where(
-                Rating.org_id == org_id,
-                Rating.is_published == True,  # noqa: E712
+            locked = await db.execute(
+                select(RatingSummary.id).where(RatingSummary.org_id == org_id).with_for_update()
             )
-            result = await db.execute(stmt)
-            ratings = list(result.scalars().all())
-
-            if not ratings:
-                logger.info(f"No ratings found for org {org_id}, skipping summary update")
-                return
-
-            # Calculate statistics
-            total_ratings = len(ratings)
-            overall_sum = sum(r.overall_rating for r in ratings)
-            average_overall = overall_sum / total_ratings
-
-            # Category averages
-            def calc_category_avg(ratings: list[Rating], attr: str) -> float | None:
-                values = [getattr(r, attr) for r in ratings if getattr(r, attr) is not None]
-                return sum(values) / len(values) if values else None
-
-            avg_professionalism = calc_category_avg(ratings, "professionalism_rating")
-            avg_punctuality = calc_category_avg(ratings, "punctuality_rating")
-            avg_care = calc_category_avg(ratings, "care_of_items_rating")
-            avg_communication = calc_category_avg(ratings, "communication_rating")
-            avg_value = calc_category_avg(ratings, "value_for_money_rating")
-
-            # Star distribution
-            star_counts = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
-            for rating in ratings:
-                star_counts[rating.overall_rating] += 1
-
-            # Get or create summary
-            summary_stmt = select(RatingSummary).where(RatingSummary.org_id == org_id)
-            summary_result = await db.execute(summary_stmt)
-            summary: RatingSummary | None = summary_result.scalar_one_or_none()
-
-            if summary:
-                # Update existing
-                summary.total_ratings = total_ratings
-                summary.average_overall_rating = average_overall
-                summary.average_professionalism = avg_professionalism
-                summary.average_punctuality = avg_punctuality
-                summary.average_care_of_items = avg_care
-                summary.average_communication = avg_communication
-                summary.average_value_for_money = avg_value
-                summary.five_star_count = star_counts[5]
-                summary.four_star_count = star_counts[4]
-                summary.three_star_count = star_counts[3]
-                summary.two_star_count = star_counts[2]
-                summary.one_star_count = star_counts[1]
-            else:
-                # Create new
-                summary = RatingSummary(
-                    org_id=org_id,
-                    total_ratings=total_ratings,
-                    average_overall_rating=average_overall,
-                    average_professionalism=avg_professionalism,
-                    average_punctuality=avg_punctuality,
-                    average_care_of_items=avg_care,
-                    average_communication=avg_communication,
-                    average_value_for_money=avg_value,
-                    five_star_count=star_counts[5],
-                    four_star_count=star_counts[4],
-                    three_star_count=star_counts[3],
-                    two_star_count=star_counts[2],
-                    one_star_count=star_counts[1],
+            if locked.scalar_one_or_none() is None:
+                await db.rollback()
+                return False
+
+            # All published ratings aggregated in one subquery, labelled by summary column
+            aggregates = (
+                select(
+                    func.count().label("total_ratings"),
+                    func.coalesce(func.avg(Rating.overall_rating), 0.0).label(
+                        "average_overall_rating"
+                    ),
+                    *(
+                        func.avg(getattr(Rating, rating_field)).label(average_field)
+                        for rating_field, average_field, _ in CATEGORY_SUMMARY_FIELDS
+                    ),
+                    *(
+                        func.count(getattr(Rating, rating_field)).label(count_field)
+                        for rating_field, _, count_field in CATEGORY_SUMMARY_FIELDS
+                    ),
+                    *(
+                        func.count().filter(Rating.overall_rating == stars).label(star_field)
+                        for stars, star_field in STAR_COUNT_FIELDS.items()
+                    ),
                 )
-                db.add(summary)
+                .where(
+                    Rating.org_id == org_id,
+                    Rating.is_published == True,  # noqa: E712
+                )
+                .subquery()
+            )
 
+            # UPDATE rating_summaries ... FROM (aggregates): one statement, no read-back
+            await db.execute(
+                update(RatingSummary)
+                .where(RatingSummary.org_id == org_id)
+                .values(
+                    **{column.name: column for column in aggregates.c},
+                    updated_at=func.now(),
+                )
+            )
             await db.commit()
+            await get_redis_cache().invalidate_rating_summary(org_id)
 
-            logger.info(
-                f"Rating summary updated for org {org_id}",
-                extra={
-                    "org_id": str(org_id),
-                    "total_ratings": total_ratings,
-                    "average_rating": average_overall,
-                },
-            )
+            return True
+
+    @staticmethod
+    async def reconcile_rating_summaries() -> int:
+        """
+        Reconcile every organization's rating summary.
+
+        Scheduled job, so it opens its own session. Each organization is rebuilt in
+        its own short transaction to keep summary row locks brief.
+
+        Returns:
+            Number of summaries rewritten
+        """
+        with tracer.start_as_current_span("rating.reconcile_summaries") as span:
+            async with get_session_factory()() as db:
+                result = await db.execute(select(RatingSummary.org_id))
+                org_ids = list(result.scalars())
+                await db.rollback()
+
+                reconciled = 0
+                for org_id in org_ids:
+                    if await RatingService.reconcile_rating_summary(db, org_id):
+                        reconciled += 1
+
+            span.set_attribute("reconciled_count", reconciled)
+            logger.info(f"Reconciled {reconciled} rating summaries")
+            return reconciled
 
     @staticmethod
     async def calculate_rating_trend(db: AsyncSession, org_id: UUID, days: int = 30) -> str:
@@ -342,31 +491,31 @@ class RatingService:
         """
         cutoff_date = datetime.now(UTC) - timedelta(days=days)
 
-        # Get recent ratings
-        stmt = (
-            select(Rating)
+        # Split recent ratings into two chronological halves and average each in SQL
+        half = func.ntile(2).over(order_by=(Rating.created_at.asc(), Rating.id.asc())).label("half")
+        halves = (
+            select(Rating.overall_rating, half)
             .where(
                 Rating.org_id == org_id,
                 Rating.is_published == True,  # noqa: E712
                 Rating.created_at >= cutoff_date,
             )
-            .order_by(Rating.created_at.asc())
+            .subquery()
+        )
+        stmt = (
+            select(halves.c.half, func.avg(halves.c.overall_rating), func.count())
+            .group_by(halves.c.half)
+            .order_by(halves.c.half)
         )
         result = await db.execute(stmt)
-        ratings = list(result.scalars().all())
+        rows = result.all()
 
-        if len(ratings) < 5:
+        if sum(count for _, _, count in rows) < 5:
             return "stable"  # Not enough data
 
-        # Split into first half and second half
-        mid = len(ratings) // 2
-        first_half = ratings[:mid]
-        second_half = ratings[mid:]
+        (_, avg_first, _), (_, avg_second, _) = rows
 
-        avg_first = sum(r.overall_rating for r in first_half) / len(first_half)
-        avg_second = sum(r.overall_rating for r in second_half) / len(second_half)
-
-        diff = avg_second - avg_first
+        diff = float(avg_second) - float(avg_first)
 
         if diff > 0.3:
             return "improving"
@@ -378,12 +527,37 @@ class RatingService:
     @staticmethod
     async def calculate_response_rate(db: AsyncSession, org_id: UUID) -> float:
         """Calculate percentage of ratings with mover responses."""
-        stmt = select(Rating).where(Rating.org_id == org_id, Rating.is_published == True)  # noqa
+        stmt = select(
+            func.count().filter(Rating.mover_response.isnot(None)),
+            func.count(),
+        ).where(Rating.org_id == org_id, Rating.is_published.is_(True))
         result = await db.execute(stmt)
-        ratings = list(result.scalars().all())
+        with_response, total = result.one()
 
-        if not ratings:
+        if not total:
             return 0.0
 
-        with_response = sum(1 for r in ratings if r.mover_response is not None)
-        return (with_response / len(ratings)) * 100
+        return (with_response / total) * 100
+
+
+async def reconcile_rating_summaries_periodically(interval_seconds: float) -> None:
+    """
+    Periodically reconcile rating summaries until cancelled.
+
+    Every worker runs this loop; a Redis lock held for one interval makes only one
+    of them do the work per window.
+
+    Args:
+        interval_seconds: Delay between reconciliation runs
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        if not await get_redis_cache().acquire_lock(
+            "reconcile_rating_summaries", int(interval_seconds)
+        ):
+            continue
+
+        try:
+            await RatingService.reconcile_rating_summaries()
+        except Exception as e:
+            logger.error(f"Rating summary reconciliation failed: {e}", exc_info=True)
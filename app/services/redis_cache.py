@@ -4,13 +4,20 @@ Redis caching service.
 Provides caching for sessions, availability windows, and frequently accessed data.
 """
 
-import json
 import logging
+from collections.abc import Callable
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 from uuid import UUID
 
+import orjson
 import redis.asyncio as redis
+from redis.asyncio.client import Pipeline
+from redis.asyncio.retry import Retry
+from redis.backoff import ExponentialBackoff
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
 
 from app.core.config import settings
 from app.core.observability import tracer
@@ -18,33 +25,105 @@ from app.models.user import CustomerSession
 
 logger = logging.getLogger(__name__)
 
+# INCR + first-hit EXPIRE in one atomic round-trip
+RATE_LIMIT_SCRIPT = """
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return count
+"""
+
+# Compare-and-delete: consume the OTP only when it matches
+VERIFY_OTP_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    redis.call('DEL', KEYS[1])
+    return 1
+end
+return 0
+"""
+
+
+def _status_cache_key(kind: str, entity_id: UUID, version: str) -> str:
+    """Build the verification status cache key for an org or driver at a version."""
+    return f"vstatus:{kind}:{entity_id}:{version}"
+
+
+class OTPAlreadyPendingError(Exception):
+    """Raised when an unexpired OTP already exists for an identifier."""
+
+    pass
+
 
 class RedisCache:
     """Redis caching service for high-performance data access."""
 
     def __init__(self) -> None:
         """Initialize Redis connection pools."""
-        self.session_pool = redis.ConnectionPool.from_url(
+        # Blocking pools wait at most REDIS_POOL_TIMEOUT for a free connection
+        # instead of queueing without bound; keepalive and health checks catch
+        # connections silently dropped by NAT/firewalls before they are used.
+        pool_options: dict[str, Any] = {
+            "max_connections": settings.REDIS_POOL_SIZE,
+            "timeout": settings.REDIS_POOL_TIMEOUT,
+            "socket_keepalive": True,
+            "health_check_interval": settings.REDIS_HEALTH_CHECK_INTERVAL,
+            "retry": Retry(ExponentialBackoff(cap=1.0, base=0.01), retries=3),
+            "retry_on_error": [RedisConnectionError, RedisTimeoutError],
+        }
+
+        self.session_pool = redis.BlockingConnectionPool.from_url(
             str(settings.REDIS_URL),
             db=settings.REDIS_SESSION_DB,
-            max_connections=settings.REDIS_POOL_SIZE,
             decode_responses=True,
+            **pool_options,
         )
 
-        self.cache_pool = redis.ConnectionPool.from_url(
+        self.cache_pool = redis.BlockingConnectionPool.from_url(
             str(settings.REDIS_URL),
             db=settings.REDIS_CACHE_DB,
-            max_connections=settings.REDIS_POOL_SIZE,
             decode_responses=True,
+            **pool_options,
         )
 
-    async def _get_session_client(self) -> redis.Redis:
+        # Long-lived clients; each command borrows a connection from the pool
+        self._session_client = redis.Redis(connection_pool=self.session_pool)
+        self._cache_client = redis.Redis(connection_pool=self.cache_pool)
+
+        # Lua scripts (EVALSHA, falling back to EVAL on first use)
+        self._rate_limit_script = self._cache_client.register_script(RATE_LIMIT_SCRIPT)
+        self._verify_otp_script = self._session_client.register_script(VERIFY_OTP_SCRIPT)
+
+    def _get_session_client(self) -> redis.Redis:
         """Get Redis client for sessions."""
-        return redis.Redis(connection_pool=self.session_pool)
+        return self._session_client
 
-    async def _get_cache_client(self) -> redis.Redis:
+    def _get_cache_client(self) -> redis.Redis:
         """Get Redis client for general caching."""
-        return redis.Redis(connection_pool=self.cache_pool)
+        return self._cache_client
+
+    async def run_pipeline(
+        self,
+        ops: Callable[[Pipeline], None],
+        use_session_db: bool = False,
+    ) -> list[Any]:
+        """
+        Queue several commands and send them in a single round-trip.
+
+        Pipelines are non-transactional (no MULTI/EXEC); use a Lua script when
+        the commands must be atomic.
+
+        Args:
+            ops: Callback that queues commands on the pipeline
+            use_session_db: Run against the session DB instead of the cache DB
+
+        Returns:
+            Results of the queued commands, in order
+        """
+        client = self._get_session_client() if use_session_db else self._get_cache_client()
+        async with client.pipeline(transaction=False) as pipe:
+            ops(pipe)
+            return await pipe.execute()
 
     # Customer Session Management
 
@@ -65,20 +144,25 @@ class RedisCache:
         """
         with tracer.start_as_current_span("redis.cache_customer_session"):
             try:
-                client = await self._get_session_client()
+                client = self._get_session_client()
 
                 key = f"customer_session:{session.session_token}"
+                # Stored as a hash of plain string fields: no JSON encode/decode,
+                # and single fields can be updated in place
                 value = {
                     "id": str(session.id),
                     "session_token": session.session_token,
                     "identifier": session.identifier,
                     "identifier_type": session.identifier_type,
-                    "is_verified": session.is_verified,
+                    "is_verified": int(session.is_verified),
                     "expires_at": session.expires_at.isoformat(),
                 }
 
-                await client.setex(key, ttl_seconds, json.dumps(value))
-                await client.close()
+                # HSET + EXPIRE in one MULTI/EXEC round-trip
+                async with client.pipeline(transaction=True) as pipe:
+                    pipe.hset(key, mapping=value)
+                    pipe.expire(key, ttl_seconds)
+                    await pipe.execute()
 
                 logger.debug(f"Cached customer session: {session.session_token}")
                 return True
@@ -99,14 +183,14 @@ class RedisCache:
         """
         with tracer.start_as_current_span("redis.get_customer_session"):
             try:
-                client = await self._get_session_client()
+                client = self._get_session_client()
                 key = f"customer_session:{session_token}"
 
-                value = await client.get(key)
-                await client.close()
+                value = await client.hgetall(key)
 
                 if value:
-                    return json.loads(value)
+                    value["is_verified"] = value["is_verified"] == "1"
+                    return value
                 return None
 
             except Exception as e:
@@ -125,11 +209,10 @@ class RedisCache:
         """
         with tracer.start_as_current_span("redis.invalidate_session"):
             try:
-                client = await self._get_session_client()
+                client = self._get_session_client()
                 key = f"customer_session:{session_token}"
 
                 await client.delete(key)
-                await client.close()
 
                 logger.debug(f"Invalidated session: {session_token}")
                 return True
@@ -138,6 +221,32 @@ class RedisCache:
                 logger.error(f"Failed to invalidate session: {e}", exc_info=True)
                 return False
 
+    async def invalidate_customer_sessions(self, session_tokens: list[str]) -> bool:
+        """
+        Invalidate several customer sessions (e.g. all devices) with one DEL.
+
+        Args:
+            session_tokens: Session tokens
+
+        Returns:
+            True if deleted
+        """
+        with tracer.start_as_current_span("redis.invalidate_sessions") as span:
+            span.set_attribute("redis.key_count", len(session_tokens))
+            if not session_tokens:
+                return True
+
+            try:
+                client = self._get_session_client()
+                await client.delete(*(f"customer_session:{token}" for token in session_tokens))
+
+                logger.debug(f"Invalidated {len(session_tokens)} sessions")
+                return True
+
+            except Exception as e:
+                logger.error(f"Failed to invalidate sessions: {e}", exc_info=True)
+                return False
+
     # OTP Management
 
     async def store_otp(
@@ -149,29 +258,36 @@ class RedisCache:
         """
         Store OTP code in Redis.
 
+        Uses SET NX so a live OTP is never overwritten by a repeat request.
+
         Args:
             identifier: Email or phone
             otp_code: 6-digit OTP
             ttl_seconds: Time to live
 
         Returns:
-            True if stored
+            True if stored, False if Redis is unavailable
+
+        Raises:
+            OTPAlreadyPendingError: If an unexpired OTP exists for the identifier
         """
         with tracer.start_as_current_span("redis.store_otp"):
             try:
-                client = await self._get_session_client()
+                client = self._get_session_client()
                 key = f"otp:{identifier}"
 
-                await client.setex(key, ttl_seconds, otp_code)
-                await client.close()
-
-                logger.debug(f"Stored OTP for: {identifier}")
-                return True
+                stored = await client.set(key, otp_code, ex=ttl_seconds, nx=True)
 
             except Exception as e:
                 logger.error(f"Failed to store OTP: {e}", exc_info=True)
                 return False
 
+            if not stored:
+                raise OTPAlreadyPendingError(f"OTP already pending for: {identifier}")
+
+            logger.debug(f"Stored OTP for: {identifier}")
+            return True
+
     async def verify_otp(self, identifier: str, otp_code: str) -> bool:
         """
         Verify OTP code.
@@ -185,19 +301,15 @@ class RedisCache:
         """
         with tracer.start_as_current_span("redis.verify_otp"):
             try:
-                client = await self._get_session_client()
                 key = f"otp:{identifier}"
 
-                stored_otp = await client.get(key)
+                # Atomically check and delete, so an OTP can only be used once
+                verified = await self._verify_otp_script(keys=[key], args=[otp_code])
 
-                if stored_otp == otp_code:
-                    # Delete OTP after successful verification
-                    await client.delete(key)
-                    await client.close()
+                if verified:
                     logger.debug(f"OTP verified for: {identifier}")
                     return True
 
-                await client.close()
                 return False
 
             except Exception as e:
@@ -225,17 +337,10 @@ class RedisCache:
         """
         with tracer.start_as_current_span("redis.check_rate_limit"):
             try:
-                client = await self._get_cache_client()
                 rate_key = f"rate_limit:{key}"
 
-                # Increment counter
-                count = await client.incr(rate_key)
-
-                # Set expiry on first request
-                if count == 1:
-                    await client.expire(rate_key, window_seconds)
-
-                await client.close()
+                # Increment counter and set expiry on first request atomically
+                count = await self._rate_limit_script(keys=[rate_key], args=[window_seconds])
 
                 is_within_limit = count <= max_requests
 
@@ -252,6 +357,29 @@ class RedisCache:
                 # Fail open - allow request on Redis error
                 return True
 
+    async def acquire_lock(self, name: str, ttl_seconds: int) -> bool:
+        """
+        Take a short-lived lock that simply expires (no explicit release).
+
+        Used to debounce bursts of identical work to one run per TTL window.
+
+        Args:
+            name: Lock name
+            ttl_seconds: Lock lifetime in seconds
+
+        Returns:
+            True if acquired, False if held elsewhere or Redis is unavailable
+        """
+        with tracer.start_as_current_span("redis.acquire_lock"):
+            try:
+                client = self._get_cache_client()
+                acquired = await client.set(f"lock:{name}", "1", ex=ttl_seconds, nx=True)
+                return bool(acquired)
+
+            except Exception as e:
+                logger.error(f"Failed to acquire lock {name}: {e}", exc_info=True)
+                return False
+
     # Availability Caching
 
     async def cache_availability(
@@ -275,11 +403,10 @@ class RedisCache:
         """
         with tracer.start_as_current_span("redis.cache_availability"):
             try:
-                client = await self._get_cache_client()
+                client = self._get_cache_client()
                 key = f"availability:{truck_id}:{date.date()}"
 
                 await client.setex(key, ttl_seconds, "1" if is_available else "0")
-                await client.close()
 
                 return True
 
@@ -304,11 +431,10 @@ class RedisCache:
         """
         with tracer.start_as_current_span("redis.get_availability"):
             try:
-                client = await self._get_cache_client()
+                client = self._get_cache_client()
                 key = f"availability:{truck_id}:{date.date()}"
 
                 value = await client.get(key)
-                await client.close()
 
                 if value is not None:
                     return value == "1"
@@ -318,8 +444,328 @@ class RedisCache:
                 logger.error(f"Failed to get availability: {e}", exc_info=True)
                 return None
 
+    async def cache_availability_bulk(
+        self,
+        entries: list[tuple[UUID, datetime, bool]],
+        ttl_seconds: int = 300,  # 5 minutes
+    ) -> bool:
+        """
+        Cache availability for many (truck, date) pairs in one round-trip.
+
+        Args:
+            entries: (truck_id, date, is_available) tuples
+            ttl_seconds: Cache TTL
+
+        Returns:
+            True if cached
+        """
+        with tracer.start_as_current_span("redis.cache_availability_bulk") as span:
+            span.set_attribute("redis.key_count", len(entries))
+            if not entries:
+                return True
+
+            try:
+
+                def queue_writes(pipe: Pipeline) -> None:
+                    for truck_id, date, is_available in entries:
+                        key = f"availability:{truck_id}:{date.date()}"
+                        pipe.setex(key, ttl_seconds, "1" if is_available else "0")
+
+                await self.run_pipeline(queue_writes)
+
+                return True
+
+            except Exception as e:
+                logger.error(f"Failed to cache availability: {e}", exc_info=True)
+                return False
+
+    async def get_cached_availability_bulk(
+        self,
+        pairs: list[tuple[UUID, datetime]],
+    ) -> list[bool | None]:
+        """
+        Get cached availability for many (truck, date) pairs with a single MGET.
+
+        Args:
+            pairs: (truck_id, date) tuples
+
+        Returns:
+            True/False per pair if cached, None if not in cache (same order as pairs)
+        """
+        with tracer.start_as_current_span("redis.get_availability_bulk") as span:
+            span.set_attribute("redis.key_count", len(pairs))
+            if not pairs:
+                return []
+
+            try:
+                keys = [f"availability:{truck_id}:{date.date()}" for truck_id, date in pairs]
+                values = await self._get_cache_client().mget(keys)
+
+                return [value == "1" if value is not None else None for value in values]
+
+            except Exception as e:
+                logger.error(f"Failed to get availability: {e}", exc_info=True)
+                return [None] * len(pairs)
+
+    # Presigned URL Caching
+
+    async def cache_presigned_url(self, cache_key: str, url: str, ttl_seconds: int) -> bool:
+        """
+        Cache a presigned S3 URL.
+
+        Args:
+            cache_key: Key identifying bucket, object and expiry
+            url: Presigned URL
+            ttl_seconds: Cache TTL; must end before the URL itself expires
+
+        Returns:
+            True if cached
+        """
+        with tracer.start_as_current_span("redis.cache_presigned_url"):
+            try:
+                client = self._get_cache_client()
+
+                await client.setex(f"s3:presign:{cache_key}", ttl_seconds, url)
+
+                return True
+
+            except Exception as e:
+                logger.error(f"Failed to cache presigned URL: {e}", exc_info=True)
+                return False
+
+    async def get_cached_presigned_url(self, cache_key: str) -> str | None:
+        """
+        Get cached presigned S3 URL.
+
+        Args:
+            cache_key: Key identifying bucket, object and expiry
+
+        Returns:
+            Presigned URL or None if not in cache
+        """
+        with tracer.start_as_current_span("redis.get_presigned_url"):
+            try:
+                client = self._get_cache_client()
+
+                return await client.get(f"s3:presign:{cache_key}")
+
+            except Exception as e:
+                logger.error(f"Failed to get presigned URL: {e}", exc_info=True)
+                return None
+
+    async def cache_presigned_urls(self, entries: list[tuple[str, str, int]]) -> bool:
+        """
+        Cache several presigned S3 URLs in one pipelined round-trip.
+
+        Args:
+            entries: (cache_key, url, ttl_seconds) tuples
+
+        Returns:
+            True if cached
+        """
+        with tracer.start_as_current_span("redis.cache_presigned_urls") as span:
+            span.set_attribute("redis.key_count", len(entries))
+            try:
+
+                def queue_writes(pipe: Pipeline) -> None:
+                    for cache_key, url, ttl_seconds in entries:
+                        pipe.setex(f"s3:presign:{cache_key}", ttl_seconds, url)
+
+                await self.run_pipeline(queue_writes)
+
+                return True
+
+            except Exception as e:
+                logger.error(f"Failed to cache presigned URLs: {e}", exc_info=True)
+                return False
+
+    async def get_cached_presigned_urls(self, cache_keys: list[str]) -> list[str | None]:
+        """
+        Get several cached presigned S3 URLs with a single MGET.
+
+        Args:
+            cache_keys: Keys identifying bucket, object and expiry
+
+        Returns:
+            URL or None per key, in the same order; all None on Redis error
+        """
+        with tracer.start_as_current_span("redis.get_presigned_urls") as span:
+            span.set_attribute("redis.key_count", len(cache_keys))
+            if not cache_keys:
+                return []
+
+            try:
+                client = self._get_cache_client()
+
+                return await client.mget([f"s3:presign:{key}" for key in cache_keys])
+
+            except Exception as e:
+                logger.error(f"Failed to get presigned URLs: {e}", exc_info=True)
+                return [None] * len(cache_keys)
+
+    # Rating Summary Caching
+
+    async def cache_rating_summary(
+        self,
+        org_id: UUID,
+        summary: dict[str, Any],
+        ttl_seconds: int = 3600,  # 1 hour
+    ) -> bool:
+        """
+        Cache an organization's rating summary.
+
+        Args:
+            org_id: Organization ID
+            summary: Serializable summary fields
+            ttl_seconds: Cache TTL
+
+        Returns:
+            True if cached
+        """
+        with tracer.start_as_current_span("redis.cache_rating_summary"):
+            try:
+                client = self._get_cache_client()
+                key = f"rating_summary:{org_id}"
+
+                await client.setex(key, ttl_seconds, orjson.dumps(summary))
+
+                return True
+
+            except Exception as e:
+                logger.error(f"Failed to cache rating summary: {e}", exc_info=True)
+                return False
+
+    async def get_cached_rating_summary(self, org_id: UUID) -> dict[str, Any] | None:
+        """
+        Get cached rating summary.
+
+        Args:
+            org_id: Organization ID
+
+        Returns:
+            Summary fields or None if not in cache
+        """
+        with tracer.start_as_current_span("redis.get_rating_summary"):
+            try:
+                client = self._get_cache_client()
+                key = f"rating_summary:{org_id}"
+
+                value = await client.get(key)
+
+                if value:
+                    return orjson.loads(value)
+                return None
+
+            except Exception as e:
+                logger.error(f"Failed to get rating summary: {e}", exc_info=True)
+                return None
+
+    async def invalidate_rating_summary(self, org_id: UUID) -> bool:
+        """
+        Invalidate cached rating summary after it changes.
+
+        Args:
+            org_id: Organization ID
+
+        Returns:
+            True if deleted
+        """
+        with tracer.start_as_current_span("redis.invalidate_rating_summary"):
+            try:
+                client = self._get_cache_client()
+                await client.delete(f"rating_summary:{org_id}")
+
+                return True
+
+            except Exception as e:
+                logger.error(f"Failed to invalidate rating summary: {e}", exc_info=True)
+                return False
+
+    # Verification Status Caching
+
+    async def cache_verification_status(
+        self,
+        kind: str,
+        entity_id: UUID,
+        version: str,
+        status: dict[str, Any],
+        ttl_seconds: int = 300,  # 5 minutes
+    ) -> bool:
+        """
+        Cache an organization's or driver's document verification status.
+
+        Entries are keyed by version (the status ETag) rather than invalidated:
+        once the documents change, lookups use a new key and old entries expire.
+
+        Args:
+            kind: Entity kind ("org" or "driver")
+            entity_id: Organization or driver ID
+            version: Validator of the documents the status was built from
+            status: Serializable status fields
+            ttl_seconds: Cache TTL
+
+        Returns:
+            True if cached
+        """
+        with tracer.start_as_current_span("redis.cache_verification_status"):
+            try:
+                client = self._get_cache_client()
+
+                await client.setex(
+                    _status_cache_key(kind, entity_id, version), ttl_seconds, orjson.dumps(status)
+                )
+
+                return True
+
+            except Exception as e:
+                logger.error(f"Failed to cache verification status: {e}", exc_info=True)
+                return False
+
+    async def get_cached_verification_status(
+        self,
+        kind: str,
+        entity_id: UUID,
+        version: str,
+    ) -> dict[str, Any] | None:
+        """
+        Get cached verification status.
+
+        Args:
+            kind: Entity kind ("org" or "driver")
+            entity_id: Organization or driver ID
+            version: Validator of the current documents
+
+        Returns:
+            Status fields or None if not in cache
+        """
+        with tracer.start_as_current_span("redis.get_verification_status"):
+            try:
+                client = self._get_cache_client()
+
+                value = await client.get(_status_cache_key(kind, entity_id, version))
+
+                if value:
+                    return orjson.loads(value)
+                return None
+
+            except Exception as e:
+                logger.error(f"Failed to get verification status: {e}", exc_info=True)
+                return None
+
     async def close(self) -> None:
         """Close all Redis connections."""
+        await self._session_client.aclose()
+        await self._cache_client.aclose()
         await self.session_pool.disconnect()
         await self.cache_pool.disconnect()
         logger.info("Redis connections closed")
+
+
+@lru_cache
+def get_redis_cache() -> RedisCache:
+    """
+    Get the shared Redis cache.
+
+    One instance (and one set of connection pools) per worker process.
+    """
+    return RedisCache()
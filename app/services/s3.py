@@ -4,20 +4,97 @@ S3 service for file uploads with pre-signed URLs.
 Provides secure file uploads without exposing AWS credentials to clients.
 """
 
+import asyncio
 import logging
 import mimetypes
-from datetime import datetime
-from typing import Any
-from uuid import uuid4
+import random
+import secrets
+import time
+from contextlib import AbstractContextManager, nullcontext
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Any, cast
 
 import aioboto3
 from botocore.exceptions import ClientError
+from opentelemetry import trace
 
 from app.core.config import settings
 from app.core.observability import tracer
+from app.services.redis_cache import get_redis_cache
+from app.services.s3_presigner import S3Presigner
 
 logger = logging.getLogger(__name__)
 
+# Allowed extensions (with leading dot, lowercase) for O(1) membership checks
+_ALLOWED_EXTENSIONS = frozenset(ext.lower() for ext in settings.ALLOWED_UPLOAD_EXTENSIONS)
+
+# MIME types for the extensions uploads accept, resolved once at import
+_EXT_TO_MIME = {
+    ext: mimetypes.guess_type(f"file{ext}")[0] or "application/octet-stream"
+    for ext in _ALLOWED_EXTENSIONS
+}
+
+# Cached download URLs are dropped this long before they expire, so a cache hit
+# always has at least this much validity left
+PRESIGNED_URL_CACHE_MARGIN_SECONDS = 600
+
+# Locally signed URLs use the start of the current bucket as their signing time,
+# so every request for an object within a bucket gets the byte-identical URL
+PRESIGNED_URL_TIME_BUCKET_SECONDS = 600
+
+# SigV4 presigned URLs cannot be valid for longer than 7 days
+PRESIGNED_URL_MAX_EXPIRES_SECONDS = 7 * 24 * 3600
+
+# Without static keys, boto signs with temporary credentials (ECS task role/STS) and
+# the URL dies when they expire, typically within hours; cap such URLs to one hour
+PRESIGNED_URL_TEMPORARY_CREDENTIALS_MAX_EXPIRES_SECONDS = 3600
+
+
+def _split_ext(filename: str) -> tuple[str, str]:
+    """Split a filename into (stem, extension without the dot) with a single scan."""
+    dot = filename.rfind(".")
+    if dot == -1:
+        return filename, ""
+    return filename[:dot], filename[dot + 1 :]
+
+
+@lru_cache(maxsize=256)
+def _content_type_for_ext(ext: str) -> str:
+    """MIME type for a lowercase extension (with leading dot), cached per extension."""
+    content_type = _EXT_TO_MIME.get(ext)
+    if content_type:
+        return content_type
+
+    # Extensions outside the upload allow-list (e.g. server-generated files)
+    content_type, _ = mimetypes.guess_type(f"file{ext}")
+    return content_type or "application/octet-stream"
+
+
+def _presign_span(name: str) -> AbstractContextManager[trace.Span]:
+    """
+    Span for a single presign call, recorded for a sample of calls only.
+
+    Presigning is cheap enough that a span per call costs more than the work it
+    traces. Unsampled calls get the no-op INVALID_SPAN, so attribute calls still work.
+    """
+    if random.random() < settings.S3_PRESIGN_SPAN_SAMPLE_RATE:
+        return tracer.start_as_current_span(name)
+    return nullcontext(trace.INVALID_SPAN)
+
+
+# (epoch second, formatted UTC timestamp) of the last generated file key
+_file_key_timestamp: tuple[int, str] = (-1, "")
+
+
+def _file_key_timestamp_now() -> str:
+    """Current UTC time as YYYYMMDD_HHMMSS, formatted at most once per second."""
+    global _file_key_timestamp
+    now = int(time.time())
+    if _file_key_timestamp[0] != now:
+        _file_key_timestamp = (now, time.strftime("%Y%m%d_%H%M%S", time.gmtime(now)))
+    return _file_key_timestamp[1]
+
 
 class S3Service:
     """Service for AWS S3 file operations."""
@@ -31,6 +108,56 @@ class S3Service:
             aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
             region_name=self.region,
         )
+        # One long-lived client: botocore models, endpoint resolution and the
+        # HTTP connection pool are built once instead of on every call
+        self._client_cm: Any = None
+        self._client: Any = None
+        self._client_lock = asyncio.Lock()
+
+        # Download URLs currently being looked up/signed, by cache key; concurrent
+        # requests for the same URL await the first one's result (single-flight)
+        self._inflight: dict[str, asyncio.Future[str]] = {}
+
+        # With static credentials, presigning is done locally (no client call);
+        # otherwise boto resolves credentials (e.g. instance role) and signs
+        self._presigner: S3Presigner | None = None
+        if settings.AWS_ACCESS_KEY_ID and settings.AWS_SECRET_ACCESS_KEY:
+            self._presigner = S3Presigner(
+                bucket_name=self.bucket_name,
+                region=self.region,
+                access_key_id=settings.AWS_ACCESS_KEY_ID,
+                secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            )
+
+    @property
+    def max_download_url_expires_in(self) -> int:
+        """
+        Longest download URL lifetime the configured credentials can honour.
+
+        Locally signed URLs get one extra time bucket on top of expires_in, so
+        the bucket is reserved out of the 7-day SigV4 limit.
+        """
+        if self._presigner:
+            return PRESIGNED_URL_MAX_EXPIRES_SECONDS - PRESIGNED_URL_TIME_BUCKET_SECONDS
+        return PRESIGNED_URL_TEMPORARY_CREDENTIALS_MAX_EXPIRES_SECONDS
+
+    async def _get_client(self) -> Any:
+        """Get the shared S3 client, creating it on first use."""
+        if self._client is None:
+            async with self._client_lock:
+                if self._client is None:
+                    client_cm = self.session.client("s3")
+                    self._client = await client_cm.__aenter__()
+                    self._client_cm = client_cm
+        return self._client
+
+    async def close(self) -> None:
+        """Close the shared S3 client and its connection pool."""
+        if self._client_cm is not None:
+            client_cm = self._client_cm
+            self._client_cm = None
+            self._client = None
+            await client_cm.__aexit__(None, None, None)
 
     async def generate_presigned_upload_url(
         self,
@@ -49,28 +176,35 @@ class S3Service:
         Returns:
             Dict with 'url' and 'fields' for POST request
         """
-        with tracer.start_as_current_span("s3.generate_presigned_upload_url") as span:
+        with _presign_span("s3.generate_presigned_upload_url") as span:
             span.set_attribute("s3.bucket", self.bucket_name)
-            span.set_attribute("s3.key", file_key)
             span.set_attribute("s3.content_type", content_type)
 
             try:
-                async with self.session.client("s3") as s3_client:
-                    # Build conditions
-                    conditions: list[Any] = [
-                        {"bucket": self.bucket_name},
-                        ["starts-with", "$key", file_key.rsplit("/", 1)[0] + "/"],
-                        {"Content-Type": content_type},
-                    ]
-
-                    # Add size limit if specified
-                    if max_size_mb is None:
-                        max_size_mb = settings.MAX_UPLOAD_SIZE_MB
-
-                    max_size_bytes = max_size_mb * 1024 * 1024
-                    conditions.append(["content-length-range", 0, max_size_bytes])
-
-                    # Generate pre-signed POST
+                # Build conditions
+                conditions: list[Any] = [
+                    {"bucket": self.bucket_name},
+                    ["starts-with", "$key", file_key.rsplit("/", 1)[0] + "/"],
+                    {"Content-Type": content_type},
+                ]
+
+                # Add size limit if specified
+                if max_size_mb is None:
+                    max_size_mb = settings.MAX_UPLOAD_SIZE_MB
+
+                max_size_bytes = max_size_mb * 1024 * 1024
+                conditions.append(["content-length-range", 0, max_size_bytes])
+
+                # Generate pre-signed POST
+                if self._presigner:
+                    response = self._presigner.presign_post(
+                        file_key=file_key,
+                        fields={"Content-Type": content_type},
+                        conditions=conditions,
+                        expires_in=settings.S3_PRESIGNED_URL_EXPIRE_SECONDS,
+                    )
+                else:
+                    s3_client = await self._get_client()
                     response = await s3_client.generate_presigned_post(
                         Bucket=self.bucket_name,
                         Key=file_key,
@@ -79,12 +213,12 @@ class S3Service:
                         ExpiresIn=settings.S3_PRESIGNED_URL_EXPIRE_SECONDS,
                     )
 
-                    logger.info(
-                        f"Generated pre-signed upload URL for {file_key}",
-                        extra={"key": file_key, "content_type": content_type},
-                    )
+                logger.info(
+                    f"Generated pre-signed upload URL for {file_key}",
+                    extra={"key": file_key, "content_type": content_type},
+                )
 
-                    return response
+                return response
 
             except ClientError as e:
                 logger.error(f"Failed to generate pre-signed URL: {e}", exc_info=True)
@@ -93,41 +227,180 @@ class S3Service:
     async def generate_presigned_download_url(
         self,
         file_key: str,
-        expires_in: int = 3600,
+        expires_in: int = 7200,
     ) -> str:
         """
         Generate pre-signed GET URL for downloading files.
 
+        Repeat requests for the same object and expiry get the same URL from Redis
+        until it is within PRESIGNED_URL_CACHE_MARGIN_SECONDS of expiring, which
+        skips re-signing and lets browsers reuse their cached download. Concurrent
+        requests for the same URL share a single lookup/sign instead of each
+        hitting Redis and the signer.
+
         Args:
             file_key: S3 object key
-            expires_in: URL expiration in seconds
+            expires_in: URL expiration in seconds, capped to max_download_url_expires_in
 
         Returns:
             Pre-signed download URL
         """
-        with tracer.start_as_current_span("s3.generate_presigned_download_url") as span:
+        with _presign_span("s3.generate_presigned_download_url") as span:
             span.set_attribute("s3.bucket", self.bucket_name)
-            span.set_attribute("s3.key", file_key)
 
+            # Capped before the cache key, so the cache TTL never outlives the URL
+            expires_in = min(expires_in, self.max_download_url_expires_in)
+            cache_key = f"{self.bucket_name}:{file_key}:{expires_in}"
+
+            while (inflight := self._inflight.get(cache_key)) is not None:
+                span.set_attribute("s3.coalesced", True)
+                try:
+                    # Shielded so a cancelled waiter does not cancel everyone else's result
+                    return await asyncio.shield(inflight)
+                except asyncio.CancelledError:
+                    # Only the leader was cancelled: retry, taking over if no one else has
+                    task = asyncio.current_task()
+                    if not inflight.cancelled() or (task is not None and task.cancelling()):
+                        raise
+
+            future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+            self._inflight[cache_key] = future
             try:
-                async with self.session.client("s3") as s3_client:
-                    url = await s3_client.generate_presigned_url(
-                        "get_object",
-                        Params={"Bucket": self.bucket_name, "Key": file_key},
-                        ExpiresIn=expires_in,
-                    )
+                url = await self._get_or_sign_download_url(file_key, expires_in, cache_key, span)
+            except Exception as e:
+                future.set_exception(e)
+                # Mark retrieved: with no waiters asyncio would warn about it
+                future.exception()
+                raise
+            else:
+                future.set_result(url)
+            finally:
+                del self._inflight[cache_key]
+                # Leader cancelled: wake the waiters so one of them takes over the lookup
+                if not future.done():
+                    future.cancel()
 
-                    logger.info(
-                        f"Generated pre-signed download URL for {file_key}",
-                        extra={"key": file_key},
-                    )
+            return url
+
+    async def _get_or_sign_download_url(
+        self,
+        file_key: str,
+        expires_in: int,
+        cache_key: str,
+        span: trace.Span,
+    ) -> str:
+        """Return the Redis-cached download URL, or sign and cache a new one."""
+        redis_cache = get_redis_cache()
+        cache_ttl = expires_in - PRESIGNED_URL_CACHE_MARGIN_SECONDS
+
+        if cache_ttl > 0:
+            cached_url = await redis_cache.get_cached_presigned_url(cache_key)
+            span.set_attribute("cache.hit", cached_url is not None)
+            if cached_url:
+                return cached_url
+
+        try:
+            url = await self._sign_download_url(file_key, expires_in)
 
-                    return url
+            logger.info(
+                f"Generated pre-signed download URL for {file_key}",
+                extra={"key": file_key},
+            )
 
+            if cache_ttl > 0:
+                await redis_cache.cache_presigned_url(cache_key, url, cache_ttl)
+
+            return url
+
+        except ClientError as e:
+            logger.error(f"Failed to generate download URL: {e}", exc_info=True)
+            raise
+
+    async def generate_presigned_download_urls(
+        self,
+        items: list[tuple[str, int]],
+    ) -> list[str]:
+        """
+        Generate pre-signed GET URLs for many files at once.
+
+        Cache lookups and writes are batched into one Redis round-trip each, and
+        misses are signed concurrently. The whole batch is traced as one span.
+
+        Args:
+            items: (S3 object key, URL expiration in seconds) pairs; expirations are
+                capped to max_download_url_expires_in
+
+        Returns:
+            Pre-signed download URLs, in the same order as items
+        """
+        with tracer.start_as_current_span("s3.generate_presigned_download_urls") as span:
+            span.set_attribute("s3.bucket", self.bucket_name)
+            span.set_attribute("s3.url_count", len(items))
+
+            max_expires_in = self.max_download_url_expires_in
+            items = [(file_key, min(expires_in, max_expires_in)) for file_key, expires_in in items]
+
+            redis_cache = get_redis_cache()
+            cache_keys = [
+                f"{self.bucket_name}:{file_key}:{expires_in}" for file_key, expires_in in items
+            ]
+            urls = await redis_cache.get_cached_presigned_urls(cache_keys)
+
+            missing = [index for index, url in enumerate(urls) if url is None]
+            span.set_attribute("cache.misses", len(missing))
+
+            try:
+                signed = await asyncio.gather(
+                    *(self._sign_download_url(*items[index]) for index in missing)
+                )
             except ClientError as e:
-                logger.error(f"Failed to generate download URL: {e}", exc_info=True)
+                logger.error(f"Failed to generate download URLs: {e}", exc_info=True)
                 raise
 
+            to_cache: list[tuple[str, str, int]] = []
+            for index, url in zip(missing, signed, strict=True):
+                urls[index] = url
+                cache_ttl = items[index][1] - PRESIGNED_URL_CACHE_MARGIN_SECONDS
+                if cache_ttl > 0:
+                    to_cache.append((cache_keys[index], url, cache_ttl))
+
+            if to_cache:
+                await redis_cache.cache_presigned_urls(to_cache)
+
+            logger.info(
+                f"Generated {len(items)} pre-signed download URLs ({len(missing)} signed)",
+                extra={"count": len(items), "signed": len(missing)},
+            )
+
+            # Every miss has been filled in above
+            return cast(list[str], urls)
+
+    async def _sign_download_url(self, file_key: str, expires_in: int) -> str:
+        """
+        Sign a GET URL locally, or through the boto client without static credentials.
+
+        Local signatures are aligned to PRESIGNED_URL_TIME_BUCKET_SECONDS: the URL is
+        signed as of the bucket start and its expiry extended by one bucket, so it
+        stays valid for at least expires_in seconds and is identical for the whole
+        bucket (letting browsers and CDNs cache it and responses embedding it).
+        """
+        if self._presigner:
+            now = int(time.time())
+            bucket_start = now - now % PRESIGNED_URL_TIME_BUCKET_SECONDS
+            return self._presigner.presign_get(
+                file_key,
+                expires_in + PRESIGNED_URL_TIME_BUCKET_SECONDS,
+                now=datetime.fromtimestamp(bucket_start, UTC),
+            )
+
+        s3_client = await self._get_client()
+        url: str = await s3_client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self.bucket_name, "Key": file_key},
+            ExpiresIn=min(expires_in, PRESIGNED_URL_TEMPORARY_CREDENTIALS_MAX_EXPIRES_SECONDS),
+        )
+        return url
+
     @staticmethod
     def generate_file_key(
         category: str,
@@ -145,20 +418,12 @@ class S3Service:
         Returns:
             S3 object key
         """
-        # Generate unique filename with timestamp
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        unique_id = uuid4().hex[:8]
-        file_ext = filename.rsplit(".", 1)[-1] if "." in filename else ""
-
-        if file_ext:
-            new_filename = f"{timestamp}_{unique_id}.{file_ext}"
-        else:
-            new_filename = f"{timestamp}_{unique_id}"
+        # Unique filename: UTC timestamp plus 8 random hex chars, original extension kept
+        _, file_ext = _split_ext(filename)
+        suffix = f".{file_ext}" if file_ext else ""
 
         # Construct key: category/org_id/filename
-        key = f"{category}/{org_id}/{new_filename}"
-
-        return key
+        return f"{category}/{org_id}/{_file_key_timestamp_now()}_{secrets.token_hex(4)}{suffix}"
 
     @staticmethod
     def validate_file_type(filename: str) -> bool:
@@ -171,11 +436,8 @@ class S3Service:
         Returns:
             True if valid, False otherwise
         """
-        if "." not in filename:
-            return False
-
-        ext = "." + filename.rsplit(".", 1)[-1].lower()
-        return ext in settings.ALLOWED_UPLOAD_EXTENSIONS
+        _, ext = _split_ext(filename)
+        return f".{ext.lower()}" in _ALLOWED_EXTENSIONS if ext else False
 
     @staticmethod
     def get_content_type(filename: str) -> str:
@@ -188,8 +450,8 @@ class S3Service:
         Returns:
             MIME type
         """
-        content_type, _ = mimetypes.guess_type(filename)
-        return content_type or "application/octet-stream"
+        _, ext = _split_ext(filename)
+        return _content_type_for_ext(f".{ext.lower()}" if ext else "")
 
     async def upload_file(
         self,
@@ -216,23 +478,23 @@ class S3Service:
                 content_type = self.get_content_type(filename)
 
             try:
-                async with self.session.client("s3") as s3_client:
-                    await s3_client.put_object(
-                        Bucket=self.bucket_name,
-                        Key=filename,
-                        Body=file_data,
-                        ContentType=content_type,
-                    )
+                s3_client = await self._get_client()
+                await s3_client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=filename,
+                    Body=file_data,
+                    ContentType=content_type,
+                )
 
-                    # Generate public URL
-                    url = f"https://{self.bucket_name}.s3.{self.region}.amazonaws.com/{filename}"
+                # Generate public URL
+                url = f"https://{self.bucket_name}.s3.{self.region}.amazonaws.com/{filename}"
 
-                    logger.info(
-                        f"Uploaded file to S3: {filename}",
-                        extra={"key": filename, "size": len(file_data)},
-                    )
+                logger.info(
+                    f"Uploaded file to S3: {filename}",
+                    extra={"key": filename, "size": len(file_data)},
+                )
 
-                    return url
+                return url
 
             except ClientError as e:
                 logger.error(f"Failed to upload file: {e}", exc_info=True)
@@ -253,13 +515,19 @@ class S3Service:
             span.set_attribute("s3.key", file_key)
 
             try:
-                async with self.session.client("s3") as s3_client:
-                    await s3_client.delete_object(Bucket=self.bucket_name, Key=file_key)
+                s3_client = await self._get_client()
+                await s3_client.delete_object(Bucket=self.bucket_name, Key=file_key)
 
-                    logger.info(f"Deleted file from S3: {file_key}", extra={"key": file_key})
+                logger.info(f"Deleted file from S3: {file_key}", extra={"key": file_key})
 
-                    return True
+                return True
 
             except ClientError as e:
                 logger.error(f"Failed to delete file: {e}", exc_info=True)
                 return False
+
+
+@lru_cache
+def get_s3_service() -> S3Service:
+    """Get the shared S3 service (and its long-lived client)."""
+    return S3Service()
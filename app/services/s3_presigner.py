@@ -0,0 +1,186 @@
+"""
+Local AWS Signature Version 4 presigner for S3.
+
+Presigning is pure local cryptography, so URLs and POST policies are signed here
+directly instead of going through an aioboto3 client call. The derived signing key
+only changes once per UTC day and is cached.
+"""
+
+import base64
+import hashlib
+import hmac
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from typing import Any
+from urllib.parse import quote
+
+import orjson
+
+ALGORITHM = "AWS4-HMAC-SHA256"
+SERVICE = "s3"
+
+
+@lru_cache(maxsize=8)
+def _signing_key(secret_key: str, date_stamp: str, region: str) -> bytes:
+    """
+    Derive the SigV4 signing key (kDate -> kRegion -> kService -> kSigning).
+
+    Args:
+        secret_key: AWS secret access key
+        date_stamp: UTC date as YYYYMMDD
+        region: AWS region
+
+    Returns:
+        Signing key bytes
+    """
+    k_date = hmac.digest(f"AWS4{secret_key}".encode(), date_stamp.encode(), hashlib.sha256)
+    k_region = hmac.digest(k_date, region.encode(), hashlib.sha256)
+    k_service = hmac.digest(k_region, SERVICE.encode(), hashlib.sha256)
+    return hmac.digest(k_service, b"aws4_request", hashlib.sha256)
+
+
+def _uri_encode(value: str, safe: str = "-_.~") -> str:
+    """Percent-encode everything except RFC 3986 unreserved characters."""
+    return quote(value, safe=safe)
+
+
+class S3Presigner:
+    """Signs S3 GET URLs and POST policies locally with static credentials."""
+
+    def __init__(
+        self,
+        bucket_name: str,
+        region: str,
+        access_key_id: str,
+        secret_access_key: str,
+        session_token: str | None = None,
+    ) -> None:
+        """Initialize presigner for a single bucket."""
+        self.bucket_name = bucket_name
+        self.region = region
+        self.access_key_id = access_key_id
+        self.secret_access_key = secret_access_key
+        self.session_token = session_token
+
+        # Virtual-hosted style; us-east-1 uses the legacy global endpoint
+        if region == "us-east-1":
+            self.host = f"{bucket_name}.s3.amazonaws.com"
+        else:
+            self.host = f"{bucket_name}.s3.{region}.amazonaws.com"
+
+    def _credential_scope(self, date_stamp: str) -> str:
+        return f"{date_stamp}/{self.region}/{SERVICE}/aws4_request"
+
+    def _sign(self, string_to_sign: str, date_stamp: str) -> str:
+        key = _signing_key(self.secret_access_key, date_stamp, self.region)
+        return hmac.new(key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+
+    def presign_get(
+        self,
+        file_key: str,
+        expires_in: int,
+        now: datetime | None = None,
+    ) -> str:
+        """
+        Build a presigned GET URL for an object.
+
+        Args:
+            file_key: S3 object key
+            expires_in: URL lifetime in seconds
+            now: Signing time (defaults to current UTC time)
+
+        Returns:
+            Presigned download URL
+        """
+        now = now or datetime.now(UTC)
+        amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        date_stamp = amz_date[:8]
+        scope = self._credential_scope(date_stamp)
+
+        params = {
+            "X-Amz-Algorithm": ALGORITHM,
+            "X-Amz-Credential": f"{self.access_key_id}/{scope}",
+            "X-Amz-Date": amz_date,
+            "X-Amz-Expires": str(expires_in),
+            "X-Amz-SignedHeaders": "host",
+        }
+        if self.session_token:
+            params["X-Amz-Security-Token"] = self.session_token
+
+        canonical_uri = "/" + _uri_encode(file_key, safe="/-_.~")
+        canonical_query = "&".join(
+            f"{_uri_encode(name)}={_uri_encode(value)}" for name, value in sorted(params.items())
+        )
+        canonical_request = (
+            f"GET\n{canonical_uri}\n{canonical_query}\n"
+            f"host:{self.host}\n\nhost\nUNSIGNED-PAYLOAD"
+        )
+        string_to_sign = (
+            f"{ALGORITHM}\n{amz_date}\n{scope}\n"
+            f"{hashlib.sha256(canonical_request.encode()).hexdigest()}"
+        )
+        signature = self._sign(string_to_sign, date_stamp)
+
+        return f"https://{self.host}{canonical_uri}?{canonical_query}&X-Amz-Signature={signature}"
+
+    def presign_post(
+        self,
+        file_key: str,
+        fields: dict[str, str],
+        conditions: list[Any],
+        expires_in: int,
+        now: datetime | None = None,
+    ) -> dict[str, Any]:
+        """
+        Build a presigned POST policy for browser uploads.
+
+        Args:
+            file_key: S3 object key
+            fields: Extra form fields (e.g. Content-Type)
+            conditions: Extra policy conditions
+            expires_in: Policy lifetime in seconds
+            now: Signing time (defaults to current UTC time)
+
+        Returns:
+            Dict with 'url' and 'fields' for the POST request
+        """
+        now = now or datetime.now(UTC)
+        amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        date_stamp = amz_date[:8]
+        credential = f"{self.access_key_id}/{self._credential_scope(date_stamp)}"
+
+        form_fields = {
+            **fields,
+            "key": file_key,
+            "x-amz-algorithm": ALGORITHM,
+            "x-amz-credential": credential,
+            "x-amz-date": amz_date,
+        }
+        if self.session_token:
+            form_fields["x-amz-security-token"] = self.session_token
+
+        expiration = now + timedelta(seconds=expires_in)
+        policy = {
+            "expiration": expiration.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "conditions": [
+                *conditions,
+                {"bucket": self.bucket_name},
+                {"key": file_key},
+                *(
+                    {name: form_fields[name]}
+                    for name in (
+                        "x-amz-algorithm",
+                        "x-amz-credential",
+                        "x-amz-date",
+                        "x-amz-security-token",
+                    )
+                    if name in form_fields
+                ),
+            ],
+        }
+        encoded_policy = base64.b64encode(orjson.dumps(policy)).decode()
+
+        form_fields["policy"] = encoded_policy
+        form_fields["x-amz-signature"] = self._sign(encoded_policy, date_stamp)
+
+        return {"url": f"https://{self.host}/", "fields": form_fields}
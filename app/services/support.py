@@ -1,17 +1,22 @@
 """Support ticket service."""
 
 import logging
-from datetime import datetime
-from uuid import UUID
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID, uuid4
 
-from sqlalchemy import func, select
+from sqlalchemy import func, inspect, literal, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
+from app.core.database import get_session_factory
 from app.core.observability import tracer
 from app.models.booking import Booking
+from app.models.organization import Organization
 from app.models.support import IssueComment, IssuePriority, IssueStatus, IssueType, SupportIssue
-from app.services.notification_templates import EmailTemplates
-from app.services.notifications import NotificationService
+from app.services.notification_templates import email_templates
+from app.services.notifications import get_notification_service
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +27,12 @@ class SupportError(Exception):
     pass
 
 
+class SupportBookingNotFoundError(SupportError):
+    """Raised when the ticket's booking is missing or not the customer's."""
+
+    pass
+
+
 class SupportTicketService:
     """Service for support ticket management."""
 
@@ -37,6 +48,7 @@ class SupportTicketService:
         reporter_phone: str | None = None,
         evidence_urls: list[str] | None = None,
         priority: IssuePriority = IssuePriority.MEDIUM,
+        customer_email: str | None = None,
     ) -> SupportIssue:
         """
         Create a new support ticket.
@@ -52,43 +64,61 @@ class SupportTicketService:
             reporter_phone: Optional phone
             evidence_urls: Optional evidence URLs
             priority: Issue priority
+            customer_email: Only create the ticket if the booking belongs to
+                this customer
 
         Returns:
             Created support ticket
+
+        Raises:
+            SupportBookingNotFoundError: If the booking does not exist or is not
+                owned by customer_email
         """
         with tracer.start_as_current_span("support.create_ticket") as span:
             span.set_attribute("booking_id", str(booking_id))
             span.set_attribute("issue_type", issue_type.value)
 
-            # Get booking to get org_id
-            result = await db.execute(select(Booking).where(Booking.id == booking_id))
-            booking = result.scalar_one_or_none()
-
-            if not booking:
-                raise SupportError(f"Booking {booking_id} not found")
-
             # Auto-escalate certain issue types
             if issue_type in [IssueType.DAMAGE, IssueType.RUDE_BEHAVIOR]:
                 priority = IssuePriority.HIGH
 
-            # Create ticket
-            ticket = SupportIssue(
-                booking_id=booking_id,
-                org_id=booking.org_id,
-                issue_type=issue_type,
-                priority=priority,
-                status=IssueStatus.OPEN,
-                title=title,
-                description=description,
-                evidence_urls=evidence_urls or [],
-                reporter_name=reporter_name,
-                reporter_email=reporter_email,
-                reporter_phone=reporter_phone,
+            # Copy org_id from the booking inside the INSERT itself; RETURNING hands
+            # back the server-generated columns, so no pre-SELECT or refresh is needed.
+            # A missing (or foreign) booking selects no row, so nothing is inserted.
+            values: dict[str, Any] = {
+                "id": uuid4(),
+                "booking_id": booking_id,
+                "issue_type": issue_type,
+                "priority": priority,
+                "status": IssueStatus.OPEN,
+                "title": title,
+                "description": description,
+                "evidence_urls": evidence_urls or [],
+                "reporter_name": reporter_name,
+                "reporter_email": reporter_email,
+                "reporter_phone": reporter_phone,
+            }
+            booking_org = select(
+                Booking.org_id,
+                *(
+                    literal(value, getattr(SupportIssue, name).type)
+                    for name, value in values.items()
+                ),
+            ).where(Booking.id == booking_id)
+            if customer_email is not None:
+                booking_org = booking_org.where(Booking.customer_email == customer_email)
+            stmt = (
+                insert(SupportIssue)
+                .from_select(["org_id", *values], booking_org)
+                .returning(SupportIssue)
             )
 
-            db.add(ticket)
+            ticket = (await db.scalars(stmt)).one_or_none()
+
+            if ticket is None:
+                raise SupportBookingNotFoundError(f"Booking {booking_id} not found")
+
             await db.commit()
-            await db.refresh(ticket)
 
             logger.info(
                 f"Support ticket created: {ticket.id} for booking {booking_id}",
@@ -100,27 +130,41 @@ class SupportTicketService:
                 },
             )
 
-            # Send notifications
-            try:
-                await SupportTicketService._send_ticket_created_notifications(
-                    db=db,
-                    ticket=ticket,
-                    booking=booking,
-                )
-            except Exception as e:
-                logger.error(f"Failed to send ticket creation notifications: {e}")
-
+            # Notifications are sent by notify_ticket_created as a background task
             return ticket
 
+    @staticmethod
+    async def notify_ticket_created(ticket_id: UUID) -> None:
+        """
+        Send ticket-created emails off the request path.
+
+        Meant to run as a background task after the response is sent, so it opens
+        its own session and reloads the ticket.
+
+        Args:
+            ticket_id: Ticket ID
+        """
+        try:
+            async with get_session_factory()() as db:
+                ticket = await db.get(SupportIssue, ticket_id)
+                if ticket:
+                    await SupportTicketService._send_ticket_created_notifications(
+                        db=db,
+                        ticket=ticket,
+                    )
+        except Exception as e:
+            logger.error(
+                f"Failed to send ticket creation notifications: {e}",
+                extra={"ticket_id": str(ticket_id)},
+            )
+
     @staticmethod
     async def _send_ticket_created_notifications(
         db: AsyncSession,
         ticket: SupportIssue,
-        booking: Booking,
     ) -> None:
         """Send notifications when ticket is created."""
-        notification_service = NotificationService()
-        email_templates = EmailTemplates()
+        notification_service = get_notification_service()
 
         # Notify customer
         customer_data = {
@@ -138,9 +182,16 @@ class SupportTicketService:
         )
 
         # Notify mover organization
-        if booking.organization:
+        result = await db.execute(
+            select(Organization.business_name, Organization.contact_email).where(
+                Organization.id == ticket.org_id
+            )
+        )
+        organization = result.one_or_none()
+
+        if organization:
             mover_data = {
-                "customer_name": booking.organization.business_name,
+                "customer_name": organization.business_name,
                 "ticket_id": str(ticket.id),
                 "issue_type": ticket.issue_type.value,
                 "description": ticket.description,
@@ -148,7 +199,7 @@ class SupportTicketService:
             subject, html_content = email_templates.support_ticket_created(mover_data)
 
             await notification_service.send_email(
-                to_email=booking.organization.contact_email,
+                to_email=organization.contact_email,
                 subject=subject,
                 html_content=html_content,
             )
@@ -182,8 +233,7 @@ class SupportTicketService:
         """
         with tracer.start_as_current_span("support.add_comment"):
             # Verify ticket exists
-            result = await db.execute(select(SupportIssue).where(SupportIssue.id == issue_id))
-            ticket = result.scalar_one_or_none()
+            ticket = await db.get(SupportIssue, issue_id)
 
             if not ticket:
                 raise SupportError(f"Support ticket {issue_id} not found")
@@ -224,6 +274,7 @@ class SupportTicketService:
         resolution_notes: str | None = None,
         refund_amount: float | None = None,
         resolved_by: UUID | None = None,
+        ticket: SupportIssue | None = None,
     ) -> SupportIssue:
         """
         Update support ticket.
@@ -237,13 +288,14 @@ class SupportTicketService:
             resolution_notes: Resolution notes
             refund_amount: Refund amount if applicable
             resolved_by: User resolving ticket
+            ticket: Already-loaded ticket; skips re-selecting it
 
         Returns:
             Updated ticket
         """
         with tracer.start_as_current_span("support.update_ticket"):
-            result = await db.execute(select(SupportIssue).where(SupportIssue.id == issue_id))
-            ticket = result.scalar_one_or_none()
+            if ticket is None:
+                ticket = await db.get(SupportIssue, issue_id)
 
             if not ticket:
                 raise SupportError(f"Support ticket {issue_id} not found")
@@ -254,7 +306,7 @@ class SupportTicketService:
             if status is not None:
                 ticket.status = status
                 if status == IssueStatus.RESOLVED:
-                    ticket.resolved_at = datetime.utcnow().isoformat()
+                    ticket.resolved_at = datetime.now(UTC)
                     ticket.resolved_by = resolved_by
 
             if priority is not None:
@@ -268,7 +320,7 @@ class SupportTicketService:
 
             if refund_amount is not None:
                 ticket.refund_amount = refund_amount
-                ticket.refund_issued_at = datetime.utcnow().isoformat()
+                ticket.refund_issued_at = datetime.now(UTC)
 
             await db.commit()
             await db.refresh(ticket)
@@ -282,44 +334,52 @@ class SupportTicketService:
                 },
             )
 
-            # Send notification if resolved
-            if status == IssueStatus.RESOLVED and old_status != IssueStatus.RESOLVED:
-                try:
-                    await SupportTicketService._send_resolution_notification(db=db, ticket=ticket)
-                except Exception as e:
-                    logger.error(f"Failed to send resolution notification: {e}")
-
+            # Resolution emails are sent by notify_ticket_resolved as a background task
             return ticket
 
+    @staticmethod
+    async def notify_ticket_resolved(ticket_id: UUID) -> None:
+        """
+        Send the ticket-resolved email off the request path.
+
+        Meant to run as a background task after the response is sent, so it opens
+        its own session and reloads the ticket.
+
+        Args:
+            ticket_id: Ticket ID
+        """
+        try:
+            async with get_session_factory()() as db:
+                ticket = await db.get(SupportIssue, ticket_id)
+                if ticket:
+                    await SupportTicketService._send_resolution_notification(db=db, ticket=ticket)
+        except Exception as e:
+            logger.error(
+                f"Failed to send resolution notification: {e}",
+                extra={"ticket_id": str(ticket_id)},
+            )
+
     @staticmethod
     async def _send_resolution_notification(
         db: AsyncSession,
         ticket: SupportIssue,
     ) -> None:
         """Send notification when ticket is resolved."""
-        notification_service = NotificationService()
-
-        resolution_message = ticket.resolution_notes or "Your issue has been resolved."
-
-        # Simple email (would use template in production)
-        html_content = f"""
-        <html>
-        <body>
-            <h2>Support Ticket Resolved</h2>
-            <p>Dear {ticket.reporter_name},</p>
-            <p>Your support ticket has been resolved.</p>
-            <p><strong>Ticket ID:</strong> {ticket.id}</p>
-            <p><strong>Issue Type:</strong> {ticket.issue_type.value}</p>
-            <p><strong>Resolution:</strong> {resolution_message}</p>
-            {f"<p><strong>Refund Amount:</strong> ${ticket.refund_amount:.2f}</p>" if ticket.refund_amount else ""}
-            <p>Thank you for your patience.</p>
-        </body>
-        </html>
-        """
+        notification_service = get_notification_service()
+
+        subject, html_content = email_templates.support_ticket_resolved(
+            {
+                "ticket_id": str(ticket.id),
+                "reporter_name": ticket.reporter_name,
+                "issue_type": ticket.issue_type.value,
+                "resolution_notes": ticket.resolution_notes or "Your issue has been resolved.",
+                "refund_amount": ticket.refund_amount,
+            }
+        )
 
         await notification_service.send_email(
             to_email=ticket.reporter_email,
-            subject=f"Support Ticket Resolved - #{ticket.id}",
+            subject=subject,
             html_content=html_content,
         )
 
@@ -340,11 +400,18 @@ class SupportTicketService:
         Returns:
             Updated ticket
         """
+        # Identity-map lookup: no SELECT if the ticket is already in the session
+        ticket = await db.get(SupportIssue, issue_id)
+
+        if not ticket:
+            raise SupportError(f"Support ticket {issue_id} not found")
+
         return await SupportTicketService.update_ticket(
             db=db,
             issue_id=issue_id,
             status=IssueStatus.ESCALATED,
             priority=IssuePriority.URGENT,
+            ticket=ticket,
         )
 
     @staticmethod
@@ -362,20 +429,18 @@ class SupportTicketService:
         Returns:
             Tuple of (ticket, comments)
         """
-        # Get ticket
-        ticket_result = await db.execute(select(SupportIssue).where(SupportIssue.id == issue_id))
-        ticket = ticket_result.scalar_one_or_none()
+        # Ticket and its comments (ordered by the relationship) in one LEFT JOIN,
+        # or no query at all when the session already holds the ticket
+        ticket = await db.get(SupportIssue, issue_id, options=[joinedload(SupportIssue.comments)])
 
         if not ticket:
             raise SupportError(f"Support ticket {issue_id} not found")
 
-        # Get comments
-        comments_result = await db.execute(
-            select(IssueComment)
-            .where(IssueComment.issue_id == issue_id)
-            .order_by(IssueComment.created_at.asc())
-        )
-        comments = list(comments_result.scalars().all())
+        # Identity-map hits skip the eager load; fetch comments explicitly then
+        if "comments" in inspect(ticket).unloaded:
+            await db.refresh(ticket, attribute_names=["comments"])
+
+        comments = list(ticket.comments)
 
         return ticket, comments
 
@@ -391,48 +456,35 @@ class SupportTicketService:
             Dictionary with statistics
         """
         with tracer.start_as_current_span("support.get_stats"):
-            # Get counts by status
-            open_result = await db.execute(
-                select(func.count(SupportIssue.id)).where(SupportIssue.status == IssueStatus.OPEN)
-            )
-            total_open = open_result.scalar_one()
-
-            in_progress_result = await db.execute(
-                select(func.count(SupportIssue.id)).where(
-                    SupportIssue.status == IssueStatus.IN_PROGRESS
-                )
+            # Status counts and refund total in a single scan
+            stmt = select(
+                func.count().filter(SupportIssue.status == IssueStatus.OPEN),
+                func.count().filter(SupportIssue.status == IssueStatus.IN_PROGRESS),
+                func.count().filter(SupportIssue.status == IssueStatus.RESOLVED),
+                func.count().filter(SupportIssue.status == IssueStatus.ESCALATED),
+                func.sum(SupportIssue.refund_amount),
+                func.avg(func.extract("epoch", SupportIssue.resolved_at - SupportIssue.created_at))
+                / 3600,
             )
-            total_in_progress = in_progress_result.scalar_one()
-
-            resolved_result = await db.execute(
-                select(func.count(SupportIssue.id)).where(
-                    SupportIssue.status == IssueStatus.RESOLVED
-                )
-            )
-            total_resolved = resolved_result.scalar_one()
-
-            escalated_result = await db.execute(
-                select(func.count(SupportIssue.id)).where(
-                    SupportIssue.status == IssueStatus.ESCALATED
-                )
-            )
-            total_escalated = escalated_result.scalar_one()
-
-            # Get total refunds
-            refund_result = await db.execute(
-                select(func.sum(SupportIssue.refund_amount)).where(
-                    SupportIssue.refund_amount.isnot(None)
-                )
-            )
-            total_refunds = refund_result.scalar_one() or 0.0
-
-            # TODO: Calculate average resolution time
+            result = await db.execute(stmt)
+            (
+                total_open,
+                total_in_progress,
+                total_resolved,
+                total_escalated,
+                total_refunds,
+                avg_resolution_hours,
+            ) = result.one()
 
             return {
                 "total_open": total_open,
                 "total_in_progress": total_in_progress,
                 "total_resolved": total_resolved,
                 "total_escalated": total_escalated,
-                "average_resolution_time_hours": None,  # TODO
-                "total_refunds_issued": float(total_refunds),
+                "average_resolution_time_hours": (
+                    round(float(avg_resolution_hours), 2)
+                    if avg_resolution_hours is not None
+                    else None
+                ),
+                "total_refunds_issued": float(total_refunds or 0.0),
             }
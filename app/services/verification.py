@@ -1,20 +1,45 @@
 """Document verification service for admin workflows."""
 
 import logging
-from datetime import datetime, timedelta
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, Select, func, insert, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
+from app.core.database import get_session_factory
 from app.core.observability import tracer
-from app.models.driver import Driver
-from app.models.organization import Organization
 from app.models.verification import DocumentType, DocumentVerification, VerificationStatus
-from app.services.notifications import NotificationService
+from app.services.notification_templates import email_templates
+from app.services.notifications import get_notification_service
+from app.services.redis_cache import get_redis_cache
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per page when iterating expiring documents
+EXPIRING_DOCUMENTS_CHUNK_SIZE = 500
+
+# Sent expiry reminders flagged per UPDATE/commit by the reminder job
+EXPIRY_REMINDER_MARK_BATCH_SIZE = 500
+
+# Review outcomes that notify the submitter: status -> (subject, message) templates
+_STATUS_MESSAGES: dict[VerificationStatus, tuple[str, str]] = {
+    VerificationStatus.APPROVED: (
+        "Document Approved - {document_type}",
+        "Your {document_type} has been approved.",
+    ),
+    VerificationStatus.REJECTED: (
+        "Document Rejected - {document_type}",
+        "Your {document_type} was rejected. Reason: {rejection_reason}",
+    ),
+    VerificationStatus.RESUBMISSION_REQUIRED: (
+        "Resubmission Required - {document_type}",
+        "Please resubmit your {document_type}. {review_notes}",
+    ),
+}
+
 
 class VerificationError(Exception):
     """Base exception for verification errors."""
@@ -26,17 +51,21 @@ class VerificationService:
     """Service for document verification workflows."""
 
     # Required documents for organization onboarding
-    REQUIRED_ORG_DOCUMENTS = [
-        DocumentType.BUSINESS_LICENSE,
-        DocumentType.LIABILITY_INSURANCE,
-        DocumentType.WORKERS_COMP_INSURANCE,
-    ]
+    REQUIRED_ORG_DOCUMENTS: frozenset[DocumentType] = frozenset(
+        {
+            DocumentType.BUSINESS_LICENSE,
+            DocumentType.LIABILITY_INSURANCE,
+            DocumentType.WORKERS_COMP_INSURANCE,
+        }
+    )
 
     # Required documents for driver verification
-    REQUIRED_DRIVER_DOCUMENTS = [
-        DocumentType.DRIVERS_LICENSE,
-        DocumentType.BACKGROUND_CHECK,
-    ]
+    REQUIRED_DRIVER_DOCUMENTS: frozenset[DocumentType] = frozenset(
+        {
+            DocumentType.DRIVERS_LICENSE,
+            DocumentType.BACKGROUND_CHECK,
+        }
+    )
 
     @staticmethod
     async def submit_organization_document(
@@ -64,20 +93,23 @@ class VerificationService:
             Created verification record
         """
         with tracer.start_as_current_span("verification.submit_org_document"):
-            verification = DocumentVerification(
-                org_id=org_id,
-                driver_id=None,
-                document_type=document_type,
-                document_url=document_url,
-                document_number=document_number,
-                status=VerificationStatus.PENDING,
-                expiry_date=expiry_date,
-                additional_data=additional_data or {},
+            # RETURNING hands back id and server defaults; no refresh round-trip
+            stmt = (
+                insert(DocumentVerification)
+                .values(
+                    org_id=org_id,
+                    driver_id=None,
+                    document_type=document_type,
+                    document_url=document_url,
+                    document_number=document_number,
+                    status=VerificationStatus.PENDING,
+                    expiry_date=expiry_date,
+                    additional_data=additional_data or {},
+                )
+                .returning(DocumentVerification)
             )
-
-            db.add(verification)
+            verification = (await db.scalars(stmt)).one()
             await db.commit()
-            await db.refresh(verification)
 
             logger.info(
                 f"Document submitted for org {org_id}: {document_type.value}",
@@ -116,20 +148,23 @@ class VerificationService:
             Created verification record
         """
         with tracer.start_as_current_span("verification.submit_driver_document"):
-            verification = DocumentVerification(
-                org_id=None,
-                driver_id=driver_id,
-                document_type=document_type,
-                document_url=document_url,
-                document_number=document_number,
-                status=VerificationStatus.PENDING,
-                expiry_date=expiry_date,
-                additional_data=additional_data or {},
+            # RETURNING hands back id and server defaults; no refresh round-trip
+            stmt = (
+                insert(DocumentVerification)
+                .values(
+                    org_id=None,
+                    driver_id=driver_id,
+                    document_type=document_type,
+                    document_url=document_url,
+                    document_number=document_number,
+                    status=VerificationStatus.PENDING,
+                    expiry_date=expiry_date,
+                    additional_data=additional_data or {},
+                )
+                .returning(DocumentVerification)
             )
-
-            db.add(verification)
+            verification = (await db.scalars(stmt)).one()
             await db.commit()
-            await db.refresh(verification)
 
             logger.info(
                 f"Document submitted for driver {driver_id}: {document_type.value}",
@@ -169,103 +204,115 @@ class VerificationService:
             span.set_attribute("verification_id", str(verification_id))
             span.set_attribute("new_status", new_status.value)
 
-            # Get verification
-            result = await db.execute(
-                select(DocumentVerification).where(DocumentVerification.id == verification_id)
+            # Single UPDATE ... RETURNING instead of SELECT, mutate, commit and refresh
+            stmt = (
+                update(DocumentVerification)
+                .where(DocumentVerification.id == verification_id)
+                .values(
+                    status=new_status,
+                    reviewed_by=reviewer_id,
+                    reviewed_at=func.now(),
+                    review_notes=review_notes,
+                    rejection_reason=rejection_reason,
+                )
+                .returning(DocumentVerification)
             )
-            verification = result.scalar_one_or_none()
+            verification = (await db.scalars(stmt)).one_or_none()
 
             if not verification:
                 raise VerificationError(f"Verification {verification_id} not found")
 
-            # Update verification
-            old_status = verification.status
-            verification.status = new_status
-            verification.reviewed_by = reviewer_id
-            verification.reviewed_at = datetime.utcnow()
-            verification.review_notes = review_notes
-            verification.rejection_reason = rejection_reason
-
             await db.commit()
-            await db.refresh(verification)
 
             logger.info(
-                f"Document verification reviewed: {verification_id} from {old_status.value} to {new_status.value}",
+                f"Document verification reviewed: {verification_id} to {new_status.value}",
                 extra={
                     "verification_id": str(verification_id),
-                    "old_status": old_status.value,
                     "new_status": new_status.value,
                     "reviewer_id": str(reviewer_id),
                 },
             )
 
-            # Send notification
-            try:
-                await VerificationService._send_verification_notification(
-                    db=db,
-                    verification=verification,
-                )
-            except Exception as e:
-                logger.error(f"Failed to send verification notification: {e}")
-
+            # Notification is sent by notify_verification_reviewed as a background task
             return verification
 
     @staticmethod
-    async def _send_verification_notification(
-        db: AsyncSession,
-        verification: DocumentVerification,
-    ) -> None:
-        """Send notification about verification status change."""
-        notification_service = NotificationService()
+    async def notify_verification_reviewed(verification_id: UUID) -> None:
+        """
+        Send the verification status email off the request path.
 
-        # Get entity (org or driver)
-        if verification.org_id:
-            result = await db.execute(
-                select(Organization).where(Organization.id == verification.org_id)
-            )
-            org = result.scalar_one_or_none()
-            if not org:
+        Meant to run as a background task after the response is sent, so it opens
+        its own session and reloads the verification. The session is released
+        before the email is sent, so no pooled connection waits on the email call.
+
+        Args:
+            verification_id: Verification record ID
+        """
+        try:
+            async with get_session_factory()() as db:
+                # Recipient (org or driver) comes back in the same query
+                verification = await db.get(
+                    DocumentVerification,
+                    verification_id,
+                    options=[
+                        joinedload(DocumentVerification.organization),
+                        joinedload(DocumentVerification.driver),
+                    ],
+                )
+
+            # Session is closed (connection back in the pool) before the email call
+            if not verification:
                 return
 
-            recipient_email = org.contact_email
-            recipient_name = org.business_name
-        elif verification.driver_id:
-            result = await db.execute(select(Driver).where(Driver.id == verification.driver_id))
-            driver = result.scalar_one_or_none()
-            if not driver:
+            if verification.organization:
+                recipient_email = verification.organization.contact_email
+                recipient_name = verification.organization.business_name
+            elif verification.driver:
+                recipient_email = verification.driver.email
+                recipient_name = verification.driver.name
+            else:
                 return
 
-            recipient_email = driver.email
-            recipient_name = driver.name
-        else:
+            await VerificationService._send_verification_notification(
+                verification=verification,
+                recipient_email=recipient_email,
+                recipient_name=recipient_name,
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to send verification notification: {e}",
+                extra={"verification_id": str(verification_id)},
+            )
+
+    @staticmethod
+    async def _send_verification_notification(
+        verification: DocumentVerification,
+        recipient_email: str,
+        recipient_name: str,
+    ) -> None:
+        """Send notification about verification status change."""
+        # No notification for other statuses
+        entry = _STATUS_MESSAGES.get(verification.status)
+        if not entry:
             return
 
-        # Send notification based on status
-        if verification.status == VerificationStatus.APPROVED:
-            subject = f"Document Approved - {verification.document_type.value}"
-            message = f"Your {verification.document_type.value} has been approved."
-        elif verification.status == VerificationStatus.REJECTED:
-            subject = f"Document Rejected - {verification.document_type.value}"
-            message = f"Your {verification.document_type.value} was rejected. Reason: {verification.rejection_reason}"
-        elif verification.status == VerificationStatus.RESUBMISSION_REQUIRED:
-            subject = f"Resubmission Required - {verification.document_type.value}"
-            message = f"Please resubmit your {verification.document_type.value}. {verification.review_notes}"
-        else:
-            return  # No notification for other statuses
-
-        # Simple text email (would use template in production)
-        html_content = f"""
-        <html>
-        <body>
-            <h2>Document Verification Update</h2>
-            <p>Dear {recipient_name},</p>
-            <p>{message}</p>
-            <p>Document Type: {verification.document_type.value}</p>
-            {f'<p>Review Notes: {verification.review_notes}</p>' if verification.review_notes else ''}
-            <p>Thank you,<br>MoveHub Platform Team</p>
-        </body>
-        </html>
-        """
+        subject_template, message_template = entry
+        fields = {
+            "document_type": verification.document_type.value,
+            "rejection_reason": verification.rejection_reason or "",
+            "review_notes": verification.review_notes or "",
+        }
+        subject, html_content = email_templates.document_verification_update(
+            {
+                "recipient_name": recipient_name,
+                "document_type": verification.document_type.value,
+                "subject": subject_template.format(**fields),
+                "message": message_template.format(**fields),
+                "review_notes": verification.review_notes,
+            }
+        )
+
+        notification_service = get_notification_service()
 
         await notification_service.send_email(
             to_email=recipient_email,
@@ -273,78 +320,119 @@ class VerificationService:
             html_content=html_content,
         )
 
+    @staticmethod
+    def _latest_documents_query(entity_filter: ColumnElement[bool]) -> Select:
+        """Newest submission of each document type: (document_type, status, updated_at)."""
+        return (
+            select(
+                DocumentVerification.document_type,
+                DocumentVerification.status,
+                DocumentVerification.updated_at,
+            )
+            .where(entity_filter)
+            .order_by(DocumentVerification.document_type, DocumentVerification.created_at.desc())
+            .distinct(DocumentVerification.document_type)
+        )
+
+    @staticmethod
+    async def _document_status_summary(
+        db: AsyncSession,
+        entity_filter: ColumnElement[bool],
+        required_documents: frozenset[DocumentType],
+    ) -> dict:
+        """
+        Summarize the latest submission of each document type for an org or driver.
+
+        One query: a DISTINCT ON (document_type) CTE picks the newest submission per
+        type, and array_agg(...) FILTER (WHERE status ...) buckets them, so only the
+        four document-type arrays come back.
+
+        Args:
+            db: Database session
+            entity_filter: Condition selecting the org's or driver's documents
+            required_documents: Document types required for full verification
+
+        Returns:
+            Dict with verification status details
+        """
+        latest = VerificationService._latest_documents_query(entity_filter).cte("latest")
+        doc_type = latest.c.document_type
+        stmt = select(
+            func.array_agg(doc_type),
+            func.array_agg(doc_type).filter(latest.c.status == VerificationStatus.APPROVED),
+            func.array_agg(doc_type).filter(
+                latest.c.status.in_([VerificationStatus.PENDING, VerificationStatus.UNDER_REVIEW])
+            ),
+            func.array_agg(doc_type).filter(
+                latest.c.status.in_(
+                    [VerificationStatus.REJECTED, VerificationStatus.RESUBMISSION_REQUIRED]
+                )
+            ),
+        )
+        result = await db.execute(stmt)
+
+        # array_agg yields NULL rather than an empty array when nothing matches
+        submitted_docs, approved_docs, pending_docs, rejected_docs = (
+            {DocumentType(doc) for doc in docs or ()} for docs in result.one()
+        )
+
+        missing_docs = required_documents - submitted_docs
+        is_fully_verified = required_documents.issubset(approved_docs)
+        progress = (
+            int((len(approved_docs) / len(required_documents)) * 100) if required_documents else 0
+        )
+
+        return {
+            "is_fully_verified": is_fully_verified,
+            "required_documents": list(required_documents),
+            "submitted_documents": list(submitted_docs),
+            "approved_documents": list(approved_docs),
+            "pending_documents": list(pending_docs),
+            "rejected_documents": list(rejected_docs),
+            "missing_documents": list(missing_docs),
+            "verification_progress_percentage": progress,
+        }
+
     @staticmethod
     async def get_organization_verification_status(
         db: AsyncSession,
         org_id: UUID,
+        version: str,
     ) -> dict:
         """
         Get comprehensive verification status for organization.
 
+        Cached under the caller's version (the status ETag), so a status computed
+        before a submit or review can never be served for the state after it.
+
         Args:
             db: Database session
             org_id: Organization ID
+            version: Validator of the documents the status is built from
 
         Returns:
             Dict with verification status details
         """
-        with tracer.start_as_current_span("verification.get_org_status"):
-            # Get all verifications for org
-            result = await db.execute(
-                select(DocumentVerification).where(DocumentVerification.org_id == org_id)
+        with tracer.start_as_current_span("verification.get_org_status") as span:
+            cache = get_redis_cache()
+            cached = await cache.get_cached_verification_status("org", org_id, version)
+            span.set_attribute("cache.hit", cached is not None)
+            if cached is not None:
+                return cached
+
+            status = await VerificationService._document_status_summary(
+                db,
+                DocumentVerification.org_id == org_id,
+                VerificationService.REQUIRED_ORG_DOCUMENTS,
             )
-            verifications = result.scalars().all()
-
-            # Group by document type (latest submission)
-            doc_status = {}
-            for v in verifications:
-                if v.document_type not in doc_status:
-                    doc_status[v.document_type] = v
-                else:
-                    # Keep most recent
-                    if v.created_at > doc_status[v.document_type].created_at:
-                        doc_status[v.document_type] = v
-
-            # Calculate status
-            required_docs = set(VerificationService.REQUIRED_ORG_DOCUMENTS)
-            submitted_docs = set(doc_status.keys())
-            approved_docs = {
-                doc for doc, v in doc_status.items() if v.status == VerificationStatus.APPROVED
-            }
-            pending_docs = {
-                doc
-                for doc, v in doc_status.items()
-                if v.status in [VerificationStatus.PENDING, VerificationStatus.UNDER_REVIEW]
-            }
-            rejected_docs = {
-                doc
-                for doc, v in doc_status.items()
-                if v.status
-                in [VerificationStatus.REJECTED, VerificationStatus.RESUBMISSION_REQUIRED]
-            }
-            missing_docs = required_docs - submitted_docs
-
-            # Check if fully verified
-            is_fully_verified = required_docs.issubset(approved_docs)
-
-            # Calculate progress
-            progress = int((len(approved_docs) / len(required_docs)) * 100) if required_docs else 0
-
-            return {
-                "is_fully_verified": is_fully_verified,
-                "required_documents": list(required_docs),
-                "submitted_documents": list(submitted_docs),
-                "approved_documents": list(approved_docs),
-                "pending_documents": list(pending_docs),
-                "rejected_documents": list(rejected_docs),
-                "missing_documents": list(missing_docs),
-                "verification_progress_percentage": progress,
-            }
+            await cache.cache_verification_status("org", org_id, version, status)
+            return status
 
     @staticmethod
     async def get_driver_verification_status(
         db: AsyncSession,
         driver_id: UUID,
+        version: str,
     ) -> dict:
         """
         Get comprehensive verification status for driver.
@@ -352,58 +440,88 @@ class VerificationService:
         Args:
             db: Database session
             driver_id: Driver ID
+            version: Validator of the documents the status is built from
 
         Returns:
             Dict with verification status details
         """
-        with tracer.start_as_current_span("verification.get_driver_status"):
-            # Get all verifications for driver
-            result = await db.execute(
-                select(DocumentVerification).where(DocumentVerification.driver_id == driver_id)
+        with tracer.start_as_current_span("verification.get_driver_status") as span:
+            cache = get_redis_cache()
+            cached = await cache.get_cached_verification_status("driver", driver_id, version)
+            span.set_attribute("cache.hit", cached is not None)
+            if cached is not None:
+                return cached
+
+            status = await VerificationService._document_status_summary(
+                db,
+                DocumentVerification.driver_id == driver_id,
+                VerificationService.REQUIRED_DRIVER_DOCUMENTS,
             )
-            verifications = result.scalars().all()
-
-            # Group by document type (latest submission)
-            doc_status = {}
-            for v in verifications:
-                if v.document_type not in doc_status:
-                    doc_status[v.document_type] = v
-                else:
-                    if v.created_at > doc_status[v.document_type].created_at:
-                        doc_status[v.document_type] = v
-
-            # Calculate status
-            required_docs = set(VerificationService.REQUIRED_DRIVER_DOCUMENTS)
-            submitted_docs = set(doc_status.keys())
-            approved_docs = {
-                doc for doc, v in doc_status.items() if v.status == VerificationStatus.APPROVED
-            }
-            pending_docs = {
-                doc
-                for doc, v in doc_status.items()
-                if v.status in [VerificationStatus.PENDING, VerificationStatus.UNDER_REVIEW]
-            }
-            rejected_docs = {
-                doc
-                for doc, v in doc_status.items()
-                if v.status
-                in [VerificationStatus.REJECTED, VerificationStatus.RESUBMISSION_REQUIRED]
-            }
-            missing_docs = required_docs - submitted_docs
-
-            is_fully_verified = required_docs.issubset(approved_docs)
-            progress = int((len(approved_docs) / len(required_docs)) * 100) if required_docs else 0
-
-            return {
-                "is_fully_verified": is_fully_verified,
-                "required_documents": list(required_docs),
-                "submitted_documents": list(submitted_docs),
-                "approved_documents": list(approved_docs),
-                "pending_documents": list(pending_docs),
-                "rejected_documents": list(rejected_docs),
-                "missing_documents": list(missing_docs),
-                "verification_progress_percentage": progress,
-            }
+            await cache.cache_verification_status("driver", driver_id, version, status)
+            return status
+
+    @staticmethod
+    async def _latest_documents(
+        db: AsyncSession,
+        entity_filter: ColumnElement[bool],
+    ) -> list[tuple[DocumentType, VerificationStatus, datetime]]:
+        """The rows a status summary is built from, for use as its validator."""
+        result = await db.execute(VerificationService._latest_documents_query(entity_filter))
+        return list(result.tuples())
+
+    @staticmethod
+    async def get_organization_latest_documents(
+        db: AsyncSession,
+        org_id: UUID,
+    ) -> list[tuple[DocumentType, VerificationStatus, datetime]]:
+        """
+        Get the newest submission of each of an organization's document types.
+
+        Cheap validator for the status endpoint: the status summary is computed from
+        exactly these rows, so it cannot change without them changing. Compared as
+        values rather than max(updated_at), because updated_at is the transaction
+        start time and a later commit can carry an earlier timestamp.
+
+        Args:
+            db: Database session
+            org_id: Organization ID
+
+        Returns:
+            (document_type, status, updated_at) per submitted document type
+        """
+        return await VerificationService._latest_documents(
+            db, DocumentVerification.org_id == org_id
+        )
+
+    @staticmethod
+    async def get_driver_latest_documents(
+        db: AsyncSession,
+        driver_id: UUID,
+    ) -> list[tuple[DocumentType, VerificationStatus, datetime]]:
+        """
+        Get the newest submission of each of a driver's document types.
+
+        Args:
+            db: Database session
+            driver_id: Driver ID
+
+        Returns:
+            (document_type, status, updated_at) per submitted document type
+        """
+        return await VerificationService._latest_documents(
+            db, DocumentVerification.driver_id == driver_id
+        )
+
+    @staticmethod
+    def _expiring_documents_filter(days_threshold: int) -> tuple[ColumnElement[bool], ...]:
+        """Conditions for approved documents expiring within threshold, not yet reminded."""
+        threshold_date = datetime.now(UTC) + timedelta(days=days_threshold)
+        return (
+            DocumentVerification.status == VerificationStatus.APPROVED,
+            DocumentVerification.expiry_date.isnot(None),
+            DocumentVerification.expiry_date <= threshold_date,
+            DocumentVerification.expiry_reminder_sent == False,  # noqa: E712
+        )
 
     @staticmethod
     async def get_expiring_documents(
@@ -421,29 +539,102 @@ class VerificationService:
             List of expiring document verifications
         """
         with tracer.start_as_current_span("verification.get_expiring"):
-            threshold_date = datetime.utcnow() + timedelta(days=days_threshold)
-
             result = await db.execute(
-                select(DocumentVerification)
-                .where(DocumentVerification.status == VerificationStatus.APPROVED)
-                .where(DocumentVerification.expiry_date.isnot(None))
-                .where(DocumentVerification.expiry_date <= threshold_date)
-                .where(DocumentVerification.expiry_reminder_sent == False)  # noqa: E712
+                select(DocumentVerification).where(
+                    *VerificationService._expiring_documents_filter(days_threshold)
+                )
             )
 
             return list(result.scalars().all())
 
+    @staticmethod
+    async def iter_expiring_documents(
+        db: AsyncSession,
+        days_threshold: int = 30,
+        batch_size: int = EXPIRING_DOCUMENTS_CHUNK_SIZE,
+    ) -> AsyncIterator[DocumentVerification]:
+        """
+        Iterate documents expiring within threshold, keyset-paginated by (expiry_date, id).
+
+        Each page is its own short query, so memory stays bounded and the caller
+        may commit between rows (e.g. to flag sent reminders) without invalidating
+        a server-side cursor.
+
+        Args:
+            db: Database session
+            days_threshold: Days until expiry
+            batch_size: Rows fetched per page
+
+        Yields:
+            Expiring document verifications, soonest expiry first
+        """
+        conditions = VerificationService._expiring_documents_filter(days_threshold)
+        order = (DocumentVerification.expiry_date, DocumentVerification.id)
+        sort_key = tuple_(*order)
+        last_key: tuple[datetime | None, UUID] | None = None
+
+        while True:
+            stmt = select(DocumentVerification).where(*conditions)
+            if last_key is not None:
+                stmt = stmt.where(sort_key > tuple_(*last_key))
+            stmt = stmt.order_by(*order).limit(batch_size)
+
+            batch = (await db.scalars(stmt)).all()
+            for verification in batch:
+                yield verification
+
+            if len(batch) < batch_size:
+                return
+            last_key = (batch[-1].expiry_date, batch[-1].id)
+
+    @staticmethod
+    async def count_expiring_documents(
+        db: AsyncSession,
+        days_threshold: int = 30,
+    ) -> int:
+        """
+        Count documents expiring within threshold without loading them.
+
+        Args:
+            db: Database session
+            days_threshold: Days until expiry
+
+        Returns:
+            Number of expiring document verifications
+        """
+        result = await db.execute(
+            select(func.count())
+            .select_from(DocumentVerification)
+            .where(*VerificationService._expiring_documents_filter(days_threshold))
+        )
+        return result.scalar_one()
+
     @staticmethod
     async def mark_expiry_reminder_sent(
         db: AsyncSession,
         verification_id: UUID,
     ) -> None:
         """Mark that expiry reminder was sent."""
-        result = await db.execute(
-            select(DocumentVerification).where(DocumentVerification.id == verification_id)
-        )
-        verification = result.scalar_one_or_none()
+        await VerificationService.mark_expiry_reminders_sent(db, [verification_id])
 
-        if verification:
-            verification.expiry_reminder_sent = True
-            await db.commit()
+    @staticmethod
+    async def mark_expiry_reminders_sent(
+        db: AsyncSession,
+        verification_ids: list[UUID],
+    ) -> None:
+        """
+        Mark that expiry reminders were sent, in one UPDATE and one commit.
+
+        Args:
+            db: Database session
+            verification_ids: Verification record IDs
+        """
+        if not verification_ids:
+            return
+
+        await db.execute(
+            update(DocumentVerification)
+            .where(DocumentVerification.id.in_(verification_ids))
+            .values(expiry_reminder_sent=True)
+        )
+        await db.commit()
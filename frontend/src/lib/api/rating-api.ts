@@ -53,15 +53,15 @@ export const ratingAPI = {
   },
 
   /**
-   * List all ratings for an organization (paginated)
+   * List ratings for an organization (cursor-paginated, newest first)
    */
   listOrganizationRatings: async (
     orgId: string,
-    page: number = 1,
+    cursor?: string | null,
     limit: number = 20
   ): Promise<RatingListResponse> => {
     const response = await apiClient.get<RatingListResponse>(`/ratings/organization/${orgId}`, {
-      params: { page, limit },
+      params: cursor ? { cursor, limit } : { limit },
     });
     return response.data;
   },
@@ -57,10 +57,9 @@ export interface RatingSummary {
 
 export interface RatingListResponse {
   ratings: Rating[];
-  total: number;
-  page: number;
   page_size: number;
   has_more: boolean;
+  next_cursor: string | null;
 }
 
 export interface RatingStats {
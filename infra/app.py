@@ -25,7 +25,7 @@ network_stack = NetworkStack(
     env=env,
 )
 
-# 2. Data Stack (EFS, S3)
+# 2. Data Stack (RDS, EFS, S3)
 data_stack = DataStack(
     app,
     f"{app_name}-Data",
@@ -45,7 +45,8 @@ compute_stack = ComputeStack(
     app,
     f"{app_name}-Compute",
     vpc=network_stack.vpc,
-    postgres_fs=data_stack.postgres_fs,
+    database=data_stack.database,
+    database_url_secret=data_stack.database_url_secret,
     redis_fs=data_stack.redis_fs,
     upload_bucket=data_stack.upload_bucket,
     env=env,
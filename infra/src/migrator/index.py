@@ -1,27 +1,75 @@
 import os
 import logging
-import subprocess
+
+import boto3
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# alembic.ini, the alembic/ scripts and the app package are bundled next to this file
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Extensions the schema relies on (mirrors scripts/init-db.sql). RDS does not run an
+# init script on first boot, so the migrator enables them before upgrading.
+REQUIRED_EXTENSIONS = ("uuid-ossp", "postgis", "btree_gist")
+
+
+def _resolve_database_url():
+    """Return DATABASE_URL, reading it from Secrets Manager when only the ARN is set."""
+    db_url = os.environ.get("DATABASE_URL")
+    secret_arn = os.environ.get("DATABASE_URL_SECRET_ARN")
+    if not db_url and secret_arn:
+        secret = boto3.client("secretsmanager").get_secret_value(SecretId=secret_arn)
+        db_url = secret["SecretString"]
+        # alembic/env.py reads the URL from DATABASE_URL
+        os.environ["DATABASE_URL"] = db_url
+    return db_url
+
+
+def _ensure_extensions(db_url):
+    """Create the required Postgres extensions if they are missing."""
+    from sqlalchemy import create_engine, text
+
+    engine = create_engine(db_url.replace("+asyncpg", ""))
+    try:
+        with engine.begin() as conn:
+            for extension in REQUIRED_EXTENSIONS:
+                conn.execute(text(f'CREATE EXTENSION IF NOT EXISTS "{extension}"'))
+    finally:
+        engine.dispose()
+
+
 def handler(event, context):
     """
-    Database migration and seeding task.
-    This function would typically run 'alembic upgrade head'.
+    Database migration task.
+    Runs 'alembic upgrade head' in-process through the Alembic API.
     """
     logger.info("Starting migration task")
-    
-    # In a real scenario, you would bundle alembic and run it here.
-    # For now, we'll just log the intent.
-    db_url = os.environ.get("DATABASE_URL")
+
+    db_url = _resolve_database_url()
     if not db_url:
         logger.error("DATABASE_URL not set")
         return {"statusCode": 500, "body": "DATABASE_URL not set"}
 
     logger.info(f"Connecting to database at {db_url.split('@')[-1]}") # Log only host/db
-    
-    # subprocess.run(["alembic", "upgrade", "head"], check=True)
-    
-    logger.info("Migration task completed")
-    return {"statusCode": 200, "body": "Migration completed"}
+
+    # alembic/env.py takes the database URL from DATABASE_URL, without loading the
+    # app settings (which would also require REDIS_URL, JWT_SECRET_KEY, ...)
+    cfg = Config(os.path.join(BASE_DIR, "alembic.ini"))
+    cfg.set_main_option("script_location", os.path.join(BASE_DIR, "alembic"))
+
+    try:
+        _ensure_extensions(db_url)
+        command.upgrade(cfg, "head")
+    except Exception as e:
+        logger.exception("Migration failed")
+        return {"statusCode": 500, "body": f"Migration failed: {e}"}
+
+    # After a successful upgrade the database is at the script head
+    revision = ScriptDirectory.from_config(cfg).get_current_head()
+
+    logger.info(f"Migration task completed at revision {revision}")
+    return {"statusCode": 200, "body": "Migration completed", "revision": revision}
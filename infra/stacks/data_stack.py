@@ -1,9 +1,14 @@
 from aws_cdk import (
+    Duration,
+    Fn,
     RemovalPolicy,
+    SecretValue,
     Stack,
     aws_ec2 as ec2,
     aws_efs as efs,
+    aws_rds as rds,
     aws_s3 as s3,
+    aws_secretsmanager as secretsmanager,
 )
 from constructs import Construct
 
@@ -29,18 +34,53 @@ class DataStack(Stack):
             ],
         )
 
-        # 2. EFS for Postgres Data
-        self.postgres_fs = efs.FileSystem(
+        # 2. RDS PostgreSQL (PostGIS is enabled by the migrator before it upgrades)
+        # Runs on local RDS storage rather than a Fargate task with its data
+        # directory on EFS, where every WAL fsync is an NFS round-trip
+        self.database = rds.DatabaseInstance(
             self,
-            "PostgresFileSystem",
+            "PostgresDatabase",
+            engine=rds.DatabaseInstanceEngine.postgres(
+                version=rds.PostgresEngineVersion.of("17.2", "17"),
+            ),
+            instance_type=ec2.InstanceType.of(ec2.InstanceClass.R6G, ec2.InstanceSize.LARGE),
             vpc=vpc,
-            encrypted=True,
-            lifecycle_policy=efs.LifecyclePolicy.AFTER_14_DAYS,
-            performance_mode=efs.PerformanceMode.GENERAL_PURPOSE,
-            throughput_mode=efs.ThroughputMode.BURSTING,
+            vpc_subnets=ec2.SubnetSelection(subnet_type=ec2.SubnetType.PRIVATE_ISOLATED),
+            database_name="movehub",
+            # The password is embedded in DATABASE_URL, so keep it URL-safe
+            credentials=rds.Credentials.from_generated_secret(
+                "movehub",
+                exclude_characters=" %+~`#$&*()|[]{}:;<>?!'/@\"\\,=^",
+            ),
+            allocated_storage=100,
+            storage_type=rds.StorageType.GP3,
+            storage_encrypted=True,
+            backup_retention=Duration.days(7),
+            deletion_protection=True,
             removal_policy=RemovalPolicy.RETAIN,
         )
 
+        # Full asyncpg DATABASE_URL for the API and migrator, resolved from the
+        # generated credentials at deploy time
+        self.database_url_secret = secretsmanager.Secret(
+            self,
+            "DatabaseUrlSecret",
+            secret_string_value=SecretValue.unsafe_plain_text(
+                Fn.join(
+                    "",
+                    [
+                        "postgresql+asyncpg://movehub:",
+                        self.database.secret.secret_value_from_json("password").unsafe_unwrap(),
+                        "@",
+                        self.database.db_instance_endpoint_address,
+                        ":",
+                        self.database.db_instance_endpoint_port,
+                        "/movehub",
+                    ],
+                )
+            ),
+        )
+
         # 3. EFS for Redis Data
         self.redis_fs = efs.FileSystem(
             self,
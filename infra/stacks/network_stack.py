@@ -4,6 +4,13 @@ from aws_cdk import (
 )
 from constructs import Construct
 
+# Subnet tiers created in every AZ
+_SUBNET_SPEC = (
+    dict(name="Public", subnet_type=ec2.SubnetType.PUBLIC, cidr_mask=24),
+    dict(name="Private", subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS, cidr_mask=24),
+    dict(name="Isolated", subnet_type=ec2.SubnetType.PRIVATE_ISOLATED, cidr_mask=24),
+)
+
 
 class NetworkStack(Stack):
     def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
@@ -20,21 +27,5 @@ class NetworkStack(Stack):
             "MoveHubVPC",
             max_azs=2,
             nat_gateways=2,
-            subnet_configuration=[
-                ec2.SubnetConfiguration(
-                    name="Public",
-                    subnet_type=ec2.SubnetType.PUBLIC,
-                    cidr_mask=24,
-                ),
-                ec2.SubnetConfiguration(
-                    name="Private",
-                    subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS,
-                    cidr_mask=24,
-                ),
-                ec2.SubnetConfiguration(
-                    name="Isolated",
-                    subnet_type=ec2.SubnetType.PRIVATE_ISOLATED,
-                    cidr_mask=24,
-                ),
-            ],
+            subnet_configuration=[ec2.SubnetConfiguration(**spec) for spec in _SUBNET_SPEC],
         )
@@ -13,82 +13,174 @@ Usage:
 """
 
 import asyncio
+import enum
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Any
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.core.database import get_db_context
+from sqlalchemy import exists, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db_context, get_engine, get_pool_status
+from app.models.booking import Booking, BookingStatus
 from app.models.driver import Driver
 from app.models.insurance import InsurancePolicy, InsuranceType
+from app.models.invoice import Invoice, InvoiceStatus
 from app.models.organization import Organization, OrganizationStatus
 from app.models.pricing import PricingConfig
+from app.models.support import IssuePriority, IssueStatus, IssueType, SupportIssue
 from app.models.truck import Truck
 
-
-async def seed_insurance_policies(orgs: list[Organization]):
+# Surcharge rules shared by every seeded pricing config
+_DEFAULT_SURCHARGE_RULES = [
+    {
+        "type": "stairs",
+        "amount": 50.0,
+        "per_flight": True,
+        "description": "Stairs surcharge (per flight)",
+    },
+    {"type": "piano", "amount": 150.0, "description": "Piano moving surcharge"},
+    {
+        "type": "weekend",
+        "multiplier": 1.25,
+        "days": [0, 6],  # Sunday and Saturday
+        "description": "Weekend surcharge (25% extra)",
+    },
+    {
+        "type": "after_hours",
+        "multiplier": 1.20,
+        "min_time": "18:00",
+        "max_time": "08:00",
+        "description": "After hours surcharge (20% extra)",
+    },
+]
+
+# New-row batches at least this large are loaded with COPY instead of INSERT
+COPY_THRESHOLD = 100
+
+
+async def bulk_copy(db: AsyncSession, model, rows: list[dict[str, Any]]) -> None:
+    """
+    Load rows into a model's table with asyncpg's binary COPY.
+
+    COPY does not support ON CONFLICT, so callers must already have filtered out
+    rows that exist. It also bypasses SQLAlchemy, so Python-side column defaults
+    (e.g. the uuid4 primary key) are filled in here.
+    """
+    table = model.__table__
+    defaults = {
+        column.key: column.default
+        for column in table.columns
+        if column.default is not None
+        and not (column.default.is_sequence or column.default.is_clause_element)
+    }
+
+    # Build the COPY records column by column: one pass per column over the rows,
+    # then zip the columns into tuples, instead of a dict lookup per cell
+    columns = list(rows[0]) + [key for key in defaults if key not in rows[0]]
+    column_values = []
+    for column in columns:
+        if column in rows[0]:
+            values = [row[column] for row in rows]
+        else:
+            default = defaults[column]
+            values = [default.arg(None) if default.is_callable else default.arg for _ in rows]
+        if isinstance(values[0], enum.Enum):
+            values = [value.value if isinstance(value, enum.Enum) else value for value in values]
+        column_values.append(values)
+
+    connection = await db.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        table.name,
+        records=list(zip(*column_values)),
+        columns=[table.columns[column].name for column in columns],
+    )
+
+
+async def existing_keys(db: AsyncSession, columns: list, candidates: list, *criteria) -> set:
+    """
+    Find which candidate keys already exist with one SELECT ... WHERE key IN (...).
+
+    Seeders decide what to insert against the returned set instead of issuing one
+    existence query per row. Multi-column keys are matched and returned as tuples.
+    """
+    if not candidates:
+        return set()
+
+    key = columns[0] if len(columns) == 1 else tuple_(*columns)
+    result = await db.execute(select(*columns).where(key.in_(candidates), *criteria))
+    if len(columns) == 1:
+        return set(result.scalars())
+    return set(result.tuples())
+
+
+async def seed_insurance_policies(db: AsyncSession, orgs: list[Organization]):
     """Create insurance policies for organizations."""
     print("Creating insurance policies...")
-    from sqlalchemy import select
 
-    async with get_db_context() as db:
-        count = 0
-        for org in orgs:
-            # Check if liability insurance exists
-            result = await db.execute(
-                select(InsurancePolicy).where(
-                    InsurancePolicy.org_id == org.id,
-                    InsurancePolicy.policy_type == InsuranceType.LIABILITY
-                )
-            )
-            existing_liability = result.scalar_one_or_none()
-
-            if not existing_liability:
-                # General liability
-                liability = InsurancePolicy(
-                    org_id=org.id,
-                    policy_type=InsuranceType.LIABILITY,
-                    provider="State Farm",
-                    policy_number=f"GL-{org.business_license_number}-001",
-                    coverage_amount=1000000,
-                    effective_date=datetime.utcnow() - timedelta(days=30),
-                    expiry_date=datetime.utcnow() + timedelta(days=335),
-                    document_url="https://example.com/insurance/liability.pdf",
-                )
-                db.add(liability)
-                count += 1
-
-            # Check if cargo insurance exists
-            result = await db.execute(
-                select(InsurancePolicy).where(
-                    InsurancePolicy.org_id == org.id,
-                    InsurancePolicy.policy_type == InsuranceType.CARGO
-                )
-            )
-            existing_cargo = result.scalar_one_or_none()
-
-            if not existing_cargo:
-                # Cargo insurance
-                cargo = InsurancePolicy(
-                    org_id=org.id,
-                    policy_type=InsuranceType.CARGO,
-                    provider="Allstate",
-                    policy_number=f"CG-{org.business_license_number}-001",
-                    coverage_amount=500000,
-                    effective_date=datetime.utcnow() - timedelta(days=30),
-                    expiry_date=datetime.utcnow() + timedelta(days=335),
-                    document_url="https://example.com/insurance/cargo.pdf",
-                )
-                db.add(cargo)
-                count += 1
-
-        await db.commit()
-        print(f"✓ Created {count} insurance policies")
-
-
-async def seed_trucks(orgs: list[Organization]):
+    # One timestamp for the whole stage, so every seeded policy shares its dates
+    now = datetime.utcnow()
+    effective_date = now - timedelta(days=30)
+    expiry_date = now + timedelta(days=335)
+
+    policy_templates = [
+        (InsuranceType.LIABILITY, "State Farm", "GL", 1000000, "liability"),
+        (InsuranceType.CARGO, "Allstate", "CG", 500000, "cargo"),
+    ]
+
+    # One query for every (org, type) pair that already has a policy
+    existing = await existing_keys(
+        db,
+        [InsurancePolicy.org_id, InsurancePolicy.policy_type],
+        [(org.id, template[0]) for org in orgs for template in policy_templates],
+    )
+
+    rows = [
+        {
+            "org_id": org.id,
+            "policy_type": policy_type,
+            "provider": provider,
+            "policy_number": f"{prefix}-{org.business_license_number}-001",
+            "coverage_amount": coverage_amount,
+            "effective_date": effective_date,
+            "expiry_date": expiry_date,
+            "document_url": f"https://example.com/insurance/{document}.pdf",
+        }
+        for org in orgs
+        for policy_type, provider, prefix, coverage_amount, document in policy_templates
+        if (org.id, policy_type) not in existing
+    ]
+
+    if not rows:
+        print("✓ Insurance policies already seeded")
+        return
+
+    if len(rows) >= COPY_THRESHOLD:
+        await bulk_copy(db, InsurancePolicy, rows)
+        count = len(rows)
+    else:
+        # One executemany INSERT, batched by insertmanyvalues; the seeded policy
+        # numbers are unique, so a concurrent run cannot insert duplicates
+        result = await db.execute(
+            (
+                pg_insert(InsurancePolicy)
+                .on_conflict_do_nothing(index_elements=["policy_number"])
+                .returning(InsurancePolicy.id)
+            ),
+            rows,
+        )
+        count = len(result.all())
+
+    print(f"✓ Created {count} insurance policies")
+
+
+async def seed_trucks(db: AsyncSession, orgs: list[Organization]):
     """Create sample trucks."""
     print("Creating trucks...")
 
@@ -152,40 +244,52 @@ async def seed_trucks(orgs: list[Organization]):
         },
     ]
 
-    from sqlalchemy import select
-
-    async with get_db_context() as db:
-        trucks = []
-        created_count = 0
-
-        # Assign trucks to organizations (2 each)
-        for i, truck_data in enumerate(trucks_data):
-            org_index = i // 2
-
-            # Check if truck already exists by license plate
-            result = await db.execute(
-                select(Truck).where(Truck.license_plate == truck_data["license_plate"])
-            )
-            existing_truck = result.scalar_one_or_none()
+    plates = [truck_data["license_plate"] for truck_data in trucks_data]
 
-            if existing_truck:
-                trucks.append(existing_truck)
-            else:
-                truck = Truck(org_id=orgs[org_index].id, **truck_data)
-                db.add(truck)
-                trucks.append(truck)
-                created_count += 1
-
-        await db.commit()
-
-        for truck in trucks:
-            await db.refresh(truck)
-
-        print(f"✓ Created {created_count} trucks ({len(trucks)} total)")
-        return trucks
+    # One query for the trucks that already exist
+    result = await db.execute(select(Truck).where(Truck.license_plate.in_(plates)))
+    by_plate = {truck.license_plate: truck for truck in result.scalars()}
 
+    # Assign trucks to organizations (2 each)
+    new_rows = [
+        {"org_id": orgs[i // 2].id, **truck_data}
+        for i, truck_data in enumerate(trucks_data)
+        if truck_data["license_plate"] not in by_plate
+    ]
 
-async def seed_drivers(orgs: list[Organization]):
+    if not new_rows:
+        print(f"✓ Trucks already seeded ({len(by_plate)} total)")
+        return [by_plate[plate] for plate in plates]
+
+    if len(new_rows) >= COPY_THRESHOLD:
+        await bulk_copy(db, Truck, new_rows)
+        result = await db.scalars(
+            select(Truck).where(Truck.license_plate.in_([r["license_plate"] for r in new_rows]))
+        )
+        created = result.all()
+        by_plate.update((truck.license_plate, truck) for truck in created)
+        created_count = len(created)
+    else:
+        # Insert and return the new rows in one statement; no refresh needed
+        result = await db.scalars(
+            (
+                pg_insert(Truck)
+                .on_conflict_do_nothing(index_elements=["license_plate"])
+                .returning(Truck)
+            ),
+            new_rows,
+        )
+        created = result.all()
+        by_plate.update((truck.license_plate, truck) for truck in created)
+        created_count = len(created)
+
+    trucks = [by_plate[plate] for plate in plates if plate in by_plate]
+
+    print(f"✓ Created {created_count} trucks ({len(trucks)} total)")
+    return trucks
+
+
+async def seed_drivers(db: AsyncSession, orgs: list[Organization]):
     """Create sample drivers."""
     print("Creating drivers...")
 
@@ -271,290 +375,275 @@ async def seed_drivers(orgs: list[Organization]):
         },
     ]
 
-    from sqlalchemy import select
+    license_numbers = [driver_data["drivers_license_number"] for driver_data in drivers_data]
 
-    async with get_db_context() as db:
-        drivers = []
-        created_count = 0
+    # One query for the drivers that already exist
+    result = await db.execute(
+        select(Driver).where(Driver.drivers_license_number.in_(license_numbers))
+    )
+    by_license = {driver.drivers_license_number: driver for driver in result.scalars()}
 
-        # Assign drivers to organizations (2 each)
-        for i, driver_data in enumerate(drivers_data):
-            org_index = i // 2
-
-            # Check if driver already exists by license number
-            result = await db.execute(
-                select(Driver).where(
-                    Driver.drivers_license_number == driver_data["drivers_license_number"]
-                )
-            )
-            existing_driver = result.scalar_one_or_none()
+    # Assign drivers to organizations (2 each)
+    new_rows = [
+        {"org_id": orgs[i // 2].id, **driver_data}
+        for i, driver_data in enumerate(drivers_data)
+        if driver_data["drivers_license_number"] not in by_license
+    ]
 
-            if existing_driver:
-                drivers.append(existing_driver)
-            else:
-                driver = Driver(org_id=orgs[org_index].id, **driver_data)
-                db.add(driver)
-                drivers.append(driver)
-                created_count += 1
+    if not new_rows:
+        print(f"✓ Drivers already seeded ({len(by_license)} total)")
+        return [by_license[number] for number in license_numbers]
 
-        await db.commit()
+    if len(new_rows) >= COPY_THRESHOLD:
+        await bulk_copy(db, Driver, new_rows)
+        result = await db.scalars(
+            select(Driver).where(
+                Driver.drivers_license_number.in_([r["drivers_license_number"] for r in new_rows])
+            )
+        )
+        created = result.all()
+        by_license.update((driver.drivers_license_number, driver) for driver in created)
+        created_count = len(created)
+    else:
+        # Insert and return the new rows in one statement; no refresh needed
+        result = await db.scalars(
+            (
+                pg_insert(Driver)
+                .on_conflict_do_nothing(index_elements=["drivers_license_number"])
+                .returning(Driver)
+            ),
+            new_rows,
+        )
+        created = result.all()
+        by_license.update((driver.drivers_license_number, driver) for driver in created)
+        created_count = len(created)
+
+    drivers = [by_license[number] for number in license_numbers if number in by_license]
+
+    print(f"✓ Created {created_count} drivers ({len(drivers)} total)")
+    return drivers
+
+
+async def seed_pricing_configs(db: AsyncSession, orgs: list[Organization]):
+    """Create pricing configurations."""
+    print("Creating pricing configurations...")
 
-        for driver in drivers:
-            await db.refresh(driver)
+    rows = [
+        {
+            "org_id": org.id,
+            "base_hourly_rate": 150.0,
+            "base_mileage_rate": 2.50,
+            "minimum_charge": 200.0,
+            "surcharge_rules": _DEFAULT_SURCHARGE_RULES,
+            "is_active": True,
+        }
+        for org in orgs
+    ]
 
-        print(f"✓ Created {created_count} drivers ({len(drivers)} total)")
-        return drivers
+    # One INSERT; orgs that already have an active config hit the
+    # uq_pricing_configs_active_org partial unique index and are skipped
+    result = await db.execute(
+        pg_insert(PricingConfig)
+        .on_conflict_do_nothing(
+            index_elements=["org_id"],
+            index_where=PricingConfig.is_active.is_(True),
+        )
+        .returning(PricingConfig.id),
+        rows,
+    )
+    count = len(result.all())
 
+    print(f"✓ Created {count} pricing configurations")
 
-async def seed_pricing_configs(orgs: list[Organization]):
-    """Create pricing configurations."""
-    print("Creating pricing configurations...")
-    from sqlalchemy import select
 
-    async with get_db_context() as db:
-        count = 0
-        for org in orgs:
-            # Check if pricing config already exists for this org
-            result = await db.execute(
-                select(PricingConfig).where(
-                    PricingConfig.org_id == org.id,
-                    PricingConfig.is_active == True
-                )
-            )
-            existing_pricing = result.scalar_one_or_none()
-
-            if not existing_pricing:
-                pricing = PricingConfig(
-                    org_id=org.id,
-                    base_hourly_rate=150.0,
-                    base_mileage_rate=2.50,
-                    minimum_charge=200.0,
-                    surcharge_rules=[
-                        {
-                            "type": "stairs",
-                            "amount": 50.0,
-                            "per_flight": True,
-                            "description": "Stairs surcharge (per flight)",
-                        },
-                        {"type": "piano", "amount": 150.0, "description": "Piano moving surcharge"},
-                        {
-                            "type": "weekend",
-                            "multiplier": 1.25,
-                            "days": [0, 6],  # Sunday and Saturday
-                            "description": "Weekend surcharge (25% extra)",
-                        },
-                        {
-                            "type": "after_hours",
-                            "multiplier": 1.20,
-                            "min_time": "18:00",
-                            "max_time": "08:00",
-                            "description": "After hours surcharge (20% extra)",
-                        },
-                    ],
-                    is_active=True,
-                )
-                db.add(pricing)
-                count += 1
-
-        await db.commit()
-        print(f"✓ Created {count} pricing configurations")
-
-
-async def seed_bookings(orgs: list[Organization]):
+async def seed_bookings(db: AsyncSession, orgs: list[Organization]):
     """Create sample bookings."""
     print("Creating bookings...")
-    from app.models.booking import Booking, BookingStatus
-    from app.models.truck import Truck
-    from sqlalchemy import select
 
-    async with get_db_context() as db:
-        count = 0
-        for org in orgs:
-            # Get a truck for this org
-            result = await db.execute(select(Truck).where(Truck.org_id == org.id).limit(1))
-            truck = result.scalar_one_or_none()
-
-            if not truck:
-                continue
-
-            # Check if past booking exists
-            past_date = datetime.utcnow() - timedelta(days=2)
-            result = await db.execute(
-                select(Booking).where(
-                    Booking.org_id == org.id,
-                    Booking.customer_email == "olivia.martin@email.com"
-                )
-            )
-            existing_booking1 = result.scalar_one_or_none()
-
-            if not existing_booking1:
-                # Past booking (Completed)
-                booking1 = Booking(
-                    org_id=org.id,
-                    truck_id=truck.id,
-                    customer_name="Olivia Martin",
-                    customer_email="olivia.martin@email.com",
-                    customer_phone="+15551234567",
-                    pickup_address="123 Start St, San Francisco, CA 94102",
-                    dropoff_address="456 End Ave, Oakland, CA 94601",
-                    pickup_date=past_date,
-                    move_date=past_date,
-                    status=BookingStatus.COMPLETED,
-                    estimated_amount=1999.00,
-                    actual_amount=1999.00,
-                    distance_miles=15.5,
-                    estimated_duration_hours=4,
-                )
-                db.add(booking1)
-                count += 1
-
-            # Check if upcoming booking exists
-            result = await db.execute(
-                select(Booking).where(
-                    Booking.org_id == org.id,
-                    Booking.customer_email == "jackson.lee@email.com"
-                )
-            )
-            existing_booking2 = result.scalar_one_or_none()
-
-            if not existing_booking2:
-                # Upcoming booking (Confirmed)
-                future_date = datetime.utcnow() + timedelta(days=1)
-                booking2 = Booking(
-                    org_id=org.id,
-                    truck_id=truck.id,
-                    customer_name="Jackson Lee",
-                    customer_email="jackson.lee@email.com",
-                    customer_phone="+15559876543",
-                    pickup_address="789 Main St, San Francisco, CA 94103",
-                    dropoff_address="321 Oak Ave, Berkeley, CA 94704",
-                    pickup_date=future_date,
-                    move_date=future_date,
-                    status=BookingStatus.CONFIRMED,
-                    estimated_amount=1250.00,
-                    distance_miles=12.0,
-                    estimated_duration_hours=3,
-                )
-                db.add(booking2)
-                count += 1
-
-        await db.commit()
-        print(f"✓ Created {count} bookings")
-
-
-async def seed_invoices(orgs: list[Organization]):
+    now = datetime.utcnow()
+    past_date = now - timedelta(days=2)
+    future_date = now + timedelta(days=1)
+
+    # Sample bookings seeded for every org, keyed by customer email
+    booking_templates = {
+        # Past booking (Completed)
+        "olivia.martin@email.com": {
+            "customer_name": "Olivia Martin",
+            "customer_phone": "+15551234567",
+            "pickup_address": "123 Start St, San Francisco, CA 94102",
+            "dropoff_address": "456 End Ave, Oakland, CA 94601",
+            "pickup_date": past_date,
+            "move_date": past_date,
+            "status": BookingStatus.COMPLETED,
+            "estimated_amount": 1999.00,
+            "actual_amount": 1999.00,
+            "distance_miles": 15.5,
+            "estimated_duration_hours": 4,
+        },
+        # Upcoming booking (Confirmed)
+        "jackson.lee@email.com": {
+            "customer_name": "Jackson Lee",
+            "customer_phone": "+15559876543",
+            "pickup_address": "789 Main St, San Francisco, CA 94103",
+            "dropoff_address": "321 Oak Ave, Berkeley, CA 94704",
+            "pickup_date": future_date,
+            "move_date": future_date,
+            "status": BookingStatus.CONFIRMED,
+            "estimated_amount": 1250.00,
+            "distance_miles": 12.0,
+            "estimated_duration_hours": 3,
+        },
+    }
+
+    org_ids = [org.id for org in orgs]
+    keys = [(org_id, email) for org_id in org_ids for email in booking_templates]
+
+    # One truck per org, and the (org_id, customer_email) pairs that already exist,
+    # in two queries
+    result = await db.execute(
+        select(Truck.org_id, Truck.id).where(Truck.org_id.in_(org_ids)).distinct(Truck.org_id)
+    )
+    truck_ids = dict(result.tuples().all())
+    existing = await existing_keys(db, [Booking.org_id, Booking.customer_email], keys)
+
+    rows = [
+        {
+            "org_id": org_id,
+            "truck_id": truck_ids[org_id],
+            "customer_email": email,
+            **booking_templates[email],
+        }
+        for org_id, email in keys
+        if org_id in truck_ids and (org_id, email) not in existing
+    ]
+
+    if not rows:
+        print("✓ Bookings already seeded")
+        return
+
+    await db.execute(pg_insert(Booking), rows)
+    print(f"✓ Created {len(rows)} bookings")
+
+
+async def seed_invoices(db: AsyncSession, orgs: list[Organization]):
     """Create sample invoices."""
     print("Creating invoices...")
-    from app.models.invoice import Invoice, InvoiceStatus
-    from app.models.booking import Booking
-    from sqlalchemy import select
 
-    async with get_db_context() as db:
-        count = 0
-        for org in orgs:
-            # Get bookings for this org
-            result = await db.execute(select(Booking).where(Booking.org_id == org.id))
-            bookings = result.scalars().all()
-
-            for booking in bookings:
-                # Check if invoice already exists for this booking
-                result = await db.execute(
-                    select(Invoice).where(Invoice.booking_id == booking.id)
-                )
-                existing_invoice = result.scalar_one_or_none()
-
-                if not existing_invoice:
-                    status = (
-                        InvoiceStatus.PAID if booking.status == "COMPLETED" else InvoiceStatus.ISSUED
-                    )
-                    amount = (
-                        booking.actual_amount if booking.actual_amount else booking.estimated_amount
-                    )
-
-                    invoice = Invoice(
-                        org_id=org.id,
-                        booking_id=booking.id,
-                        invoice_number=f"INV-{booking.id.hex[:8].upper()}",
-                        status=status,
-                        subtotal=amount * 0.9,
-                        tax_amount=amount * 0.1,
-                        total_amount=amount,
-                        issued_at=datetime.utcnow(),
-                        due_date=datetime.utcnow() + timedelta(days=30),
-                        paid_at=datetime.utcnow() if status == InvoiceStatus.PAID else None,
-                        payment_method="credit_card" if status == InvoiceStatus.PAID else None,
-                    )
-                    db.add(invoice)
-                    count += 1
-
-        await db.commit()
-        print(f"✓ Created {count} invoices")
-
-
-async def seed_support_tickets(orgs: list[Organization]):
+    now = datetime.utcnow()
+    due_date = now + timedelta(days=30)
+
+    # Only the seeded orgs' bookings that have no invoice yet, filtered server-side
+    result = await db.execute(
+        select(Booking).where(
+            Booking.org_id.in_([org.id for org in orgs]),
+            ~exists().where(Invoice.booking_id == Booking.id),
+        )
+    )
+    pending = result.scalars().all()
+    invoice_numbers = {booking.id: f"INV-{booking.id.hex[:8].upper()}" for booking in pending}
+
+    invoice_rows = []
+    for booking in pending:
+        status = InvoiceStatus.PAID if booking.status == "COMPLETED" else InvoiceStatus.ISSUED
+        amount = booking.actual_amount if booking.actual_amount else booking.estimated_amount
+
+        invoice_rows.append(
+            {
+                "org_id": booking.org_id,
+                "booking_id": booking.id,
+                "invoice_number": invoice_numbers[booking.id],
+                "status": status,
+                "subtotal": amount * 0.9,
+                "tax_amount": amount * 0.1,
+                "total_amount": amount,
+                "issued_at": now,
+                "due_date": due_date,
+                "paid_at": now if status == InvoiceStatus.PAID else None,
+                "payment_method": "credit_card" if status == InvoiceStatus.PAID else None,
+            }
+        )
+
+    if not invoice_rows:
+        print("✓ Invoices already seeded")
+        return
+
+    if len(invoice_rows) >= COPY_THRESHOLD:
+        await bulk_copy(db, Invoice, invoice_rows)
+        count = len(invoice_rows)
+    else:
+        # One executemany INSERT; a booking has at most one invoice (uq_invoice_booking)
+        result = await db.execute(
+            (
+                pg_insert(Invoice)
+                .on_conflict_do_nothing(index_elements=["booking_id"])
+                .returning(Invoice.id)
+            ),
+            invoice_rows,
+        )
+        count = len(result.all())
+
+    print(f"✓ Created {count} invoices")
+
+
+async def seed_support_tickets(db: AsyncSession, orgs: list[Organization]):
     """Create sample support tickets."""
     print("Creating support tickets...")
-    from app.models.support import SupportTicket, IssueStatus, IssueType, IssuePriority
-    from sqlalchemy import select
 
-    async with get_db_context() as db:
-        count = 0
-        for org in orgs:
-            # Check if ticket from Alice exists
-            result = await db.execute(
-                select(SupportTicket).where(
-                    SupportTicket.org_id == org.id,
-                    SupportTicket.customer_email == "alice@example.com"
-                )
-            )
-            existing_ticket1 = result.scalar_one_or_none()
-
-            if not existing_ticket1:
-                ticket1 = SupportTicket(
-                    org_id=org.id,
-                    customer_name="Alice Johnson",
-                    customer_email="alice@example.com",
-                    subject="Late Arrival",
-                    description="The movers arrived 2 hours late.",
-                    issue_type=IssueType.LATE_ARRIVAL,
-                    priority=IssuePriority.MEDIUM,
-                    status=IssueStatus.OPEN,
-                )
-                db.add(ticket1)
-                count += 1
-
-            # Check if ticket from Bob exists
-            result = await db.execute(
-                select(SupportTicket).where(
-                    SupportTicket.org_id == org.id,
-                    SupportTicket.customer_email == "bob@example.com"
-                )
-            )
-            existing_ticket2 = result.scalar_one_or_none()
-
-            if not existing_ticket2:
-                ticket2 = SupportTicket(
-                    org_id=org.id,
-                    customer_name="Bob Smith",
-                    customer_email="bob@example.com",
-                    subject="Damaged Item",
-                    description="My lamp was broken during the move.",
-                    issue_type=IssueType.DAMAGE,
-                    priority=IssuePriority.HIGH,
-                    status=IssueStatus.IN_PROGRESS,
-                )
-                db.add(ticket2)
-                count += 1
-
-        await db.commit()
-        print(f"✓ Created {count} support tickets")
-
-
-async def seed_organizations():
+    # Sample issues seeded for every org, keyed by reporter email
+    issue_templates = {
+        "alice@example.com": {
+            "reporter_name": "Alice Johnson",
+            "title": "Late Arrival",
+            "description": "The movers arrived 2 hours late.",
+            "issue_type": IssueType.LATE_NO_SHOW,
+            "priority": IssuePriority.MEDIUM,
+            "status": IssueStatus.OPEN,
+        },
+        "bob@example.com": {
+            "reporter_name": "Bob Smith",
+            "title": "Damaged Item",
+            "description": "My lamp was broken during the move.",
+            "issue_type": IssueType.DAMAGE,
+            "priority": IssuePriority.HIGH,
+            "status": IssueStatus.IN_PROGRESS,
+        },
+    }
+
+    org_ids = [org.id for org in orgs]
+    keys = [(org_id, email) for org_id in org_ids for email in issue_templates]
+
+    # Issues are filed against a booking: take one per org, plus the
+    # (org_id, reporter_email) pairs that already exist, in two queries
+    result = await db.execute(
+        select(Booking.org_id, Booking.id)
+        .where(Booking.org_id.in_(org_ids))
+        .distinct(Booking.org_id)
+    )
+    booking_ids = dict(result.tuples().all())
+    existing = await existing_keys(db, [SupportIssue.org_id, SupportIssue.reporter_email], keys)
+
+    rows = [
+        {
+            "booking_id": booking_ids[org_id],
+            "org_id": org_id,
+            "reporter_email": email,
+            **issue_templates[email],
+        }
+        for org_id, email in keys
+        if org_id in booking_ids and (org_id, email) not in existing
+    ]
+
+    if not rows:
+        print("✓ Support tickets already seeded")
+        return
+
+    await db.execute(pg_insert(SupportIssue), rows)
+    print(f"✓ Created {len(rows)} support tickets")
+
+
+async def seed_organizations(db: AsyncSession):
     """Create sample organizations."""
     print("Creating organizations...")
-    from app.models.organization import Organization, OrganizationStatus
-    from sqlalchemy import select
 
     organizations_data = [
         {
@@ -581,47 +670,23 @@ async def seed_organizations():
         },
     ]
 
-    created_orgs = []
-    count = 0
-    async with get_db_context() as db:
-        for org_data in organizations_data:
-            # Check if org exists
-            result = await db.execute(
-                select(Organization).where(Organization.email == org_data["email"])
-            )
-            existing_org = result.scalar_one_or_none()
-
-            if existing_org:
-                print(f"  - Organization {org_data['name']} already exists")
-                created_orgs.append(existing_org)
-                continue
-
-            org = Organization(
-                name=org_data["name"],
-                email=org_data["email"],
-                phone=org_data["phone"],
-                business_license_number=org_data["business_license_number"],
-                tax_id=org_data["tax_id"],
-                address_line1=org_data["address_line1"],
-                city=org_data["city"],
-                state=org_data["state"],
-                zip_code=org_data["zip_code"],
-                status=OrganizationStatus.APPROVED,
-            )
-            db.add(org)
-            created_orgs.append(org)
-            count += 1
-
-        await db.commit()
+    # One INSERT skipping orgs whose email already exists (uq_organization_email)
+    result = await db.execute(
+        pg_insert(Organization)
+        .on_conflict_do_nothing(index_elements=["email"])
+        .returning(Organization.id),
+        [{**org_data, "status": OrganizationStatus.APPROVED} for org_data in organizations_data],
+    )
+    count = len(result.all())
 
-        # Refresh all orgs to ensure they are bound to the session
-        for i, org in enumerate(created_orgs):
-            if org not in db:
-                result = await db.execute(select(Organization).where(Organization.id == org.id))
-                created_orgs[i] = result.scalar_one()
+    # Load new and pre-existing orgs together for the later stages
+    emails = [org_data["email"] for org_data in organizations_data]
+    result = await db.execute(select(Organization).where(Organization.email.in_(emails)))
+    by_email = {org.email: org for org in result.scalars()}
+    created_orgs = [by_email[email] for email in emails]
 
-        print(f"✓ Created {count} organizations")
-        return created_orgs
+    print(f"✓ Created {count} organizations")
+    return created_orgs
 
 
 async def main():
@@ -629,17 +694,26 @@ async def main():
     print("\n=== Seeding Database ===\n")
 
     try:
-        # Create organizations first
-        orgs = await seed_organizations()
-
-        # Create dependent data
-        await seed_insurance_policies(orgs)
-        await seed_trucks(orgs)
-        await seed_drivers(orgs)
-        await seed_pricing_configs(orgs)
-        await seed_bookings(orgs)
-        await seed_invoices(orgs)
-        await seed_support_tickets(orgs)
+        # One session and transaction for the whole run, committed once at the end
+        # by get_db_context. Each stage runs in a savepoint so a failing stage rolls
+        # back only its own writes before the error aborts the run.
+        async with get_db_context() as db:
+            # Create organizations first
+            async with db.begin_nested():
+                orgs = await seed_organizations(db)
+
+            # Create dependent data; bookings need trucks, invoices need bookings
+            for seed_stage in (
+                seed_insurance_policies,
+                seed_trucks,
+                seed_drivers,
+                seed_pricing_configs,
+                seed_bookings,
+                seed_invoices,
+                seed_support_tickets,
+            ):
+                async with db.begin_nested():
+                    await seed_stage(db, orgs)
 
         print("\n=== ✓ Database seeded successfully! ===\n")
         print("Sample Organizations:")
@@ -653,6 +727,12 @@ async def main():
         traceback.print_exc()
         sys.exit(1)
 
+    finally:
+        # All sessions are closed by now, so nothing should still be checked out
+        engine = get_engine()
+        print(f"Connection pool: {get_pool_status(engine)}")
+        await engine.dispose()
+
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -15,7 +15,7 @@ from sqlalchemy.pool import NullPool
 
 # Import all models to ensure tables are created
 from app import models  # noqa: F401
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.main import app
 from app.models.base import Base
 
@@ -83,6 +83,7 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
 
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
         yield ac
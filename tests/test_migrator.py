@@ -0,0 +1,56 @@
+"""Unit tests for the migrator Lambda handler."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+HANDLER_PATH = REPO_ROOT / "infra" / "src" / "migrator" / "index.py"
+
+
+def _load_handler_module():
+    spec = importlib.util.spec_from_file_location("migrator_index", HANDLER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.unit
+class TestMigratorHandler:
+    """Test the migrator runs Alembic with only DATABASE_URL configured."""
+
+    def test_upgrade_runs_without_app_settings(self, monkeypatch, tmp_path):
+        """Test alembic/env.py loads without REDIS_URL, JWT_SECRET_KEY or app settings."""
+        migrator = _load_handler_module()
+        upgrade = command.upgrade
+
+        alembic_cfg = Config(str(REPO_ROOT / "alembic.ini"))
+        alembic_cfg.set_main_option("script_location", str(REPO_ROOT / "alembic"))
+        head = ScriptDirectory.from_config(alembic_cfg).get_current_head()
+
+        # The Lambda only gets the database URL; make any app settings import fail
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("DATABASE_URL", "postgresql+asyncpg://user:pw@db:5432/movehub")
+        monkeypatch.delenv("DATABASE_URL_SECRET_ARN", raising=False)
+        monkeypatch.delenv("REDIS_URL", raising=False)
+        monkeypatch.delenv("JWT_SECRET_KEY", raising=False)
+        monkeypatch.setitem(sys.modules, "app.core.config", None)
+
+        # Run env.py and every migration in offline (--sql) mode, so no database is needed
+        monkeypatch.setattr(migrator, "BASE_DIR", str(REPO_ROOT))
+        monkeypatch.setattr(migrator, "_ensure_extensions", lambda db_url: None)
+        monkeypatch.setattr(
+            migrator.command,
+            "upgrade",
+            lambda cfg, revision: upgrade(cfg, revision, sql=True),
+        )
+
+        response = migrator.handler({}, None)
+
+        assert response["statusCode"] == 200, response["body"]
+        assert response["revision"] == head
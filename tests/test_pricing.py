@@ -142,6 +142,34 @@ class TestPricingService:
 
         assert result.estimated_amount == expected_total
 
+    def test_weekend_surcharge_not_applied_on_weekday(self):
+        """Test weekend surcharge is skipped for a weekday move."""
+        # Arrange
+        pricing_config = PricingConfigResponse(
+            id="00000000-0000-0000-0000-000000000000",  # type: ignore
+            org_id="00000000-0000-0000-0000-000000000000",  # type: ignore
+            base_hourly_rate=150.0,
+            base_mileage_rate=2.50,
+            minimum_charge=200.0,
+            surcharge_rules=[SurchargeRule(type="weekend", multiplier=1.25, days=[0, 6])],
+            is_active=True,
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+        )
+
+        booking_details = {
+            "estimated_duration_hours": 4.0,
+            "estimated_distance_miles": 20.0,
+            "move_date": datetime(2024, 1, 8, 10, 0),  # Monday
+        }
+
+        # Act
+        result = PricingService.calculate_price(pricing_config, booking_details)
+
+        # Assert
+        assert result.estimated_amount == 650.0
+        assert result.breakdown.surcharges == []
+
     def test_multiple_surcharges(self):
         """Test that multiple surcharges are applied correctly."""
         # Arrange
@@ -182,6 +210,39 @@ class TestPricingService:
         assert result.estimated_amount == expected_total
         assert len(result.breakdown.surcharges) == 2
 
+    def test_special_items_match_case_insensitively(self):
+        """Test special item surcharges match regardless of item casing."""
+        # Arrange
+        pricing_config = PricingConfigResponse(
+            id="00000000-0000-0000-0000-000000000000",  # type: ignore
+            org_id="00000000-0000-0000-0000-000000000000",  # type: ignore
+            base_hourly_rate=150.0,
+            base_mileage_rate=2.50,
+            minimum_charge=200.0,
+            surcharge_rules=[
+                SurchargeRule(type="piano", amount=100.0),
+                SurchargeRule(type="fragile", amount=40.0),
+            ],
+            is_active=True,
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+        )
+
+        booking_details = {
+            "estimated_duration_hours": 4.0,
+            "estimated_distance_miles": 20.0,
+            "special_items": ["Piano", "FRAGILE"],
+        }
+
+        # Act
+        result = PricingService.calculate_price(pricing_config, booking_details)
+
+        # Assert
+        expected_total = 650.0 + 100.0 + 40.0  # 790.0
+
+        assert result.estimated_amount == expected_total
+        assert len(result.breakdown.surcharges) == 2
+
     def test_platform_fee_calculation(self):
         """Test platform fee calculation (5%)."""
         # Arrange
@@ -5,16 +5,20 @@ from uuid import uuid4
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.booking import Booking, BookingStatus
 from app.models.organization import Organization, OrganizationStatus
+from app.models.rating import RatingSummary
 from app.models.truck import Truck
 from app.models.user import CustomerSession
 from app.services.rating import (
     BookingNotEligibleError,
     RatingAlreadyExistsError,
     RatingService,
+    decode_rating_cursor,
+    encode_rating_cursor,
 )
 
 
@@ -381,6 +385,121 @@ class TestRatingService:
         assert summary.two_star_count == 0
         assert summary.one_star_count == 0
 
+    async def test_reconcile_rating_summary_corrects_drift(self, db_session: AsyncSession):
+        """Test that reconciliation rebuilds a drifted summary from the ratings."""
+        # Create organization
+        org = Organization(
+            name="Test Movers Reconcile",
+            email="test5@movers.com",
+            phone="+15551234571",
+            business_license_number="BL127",
+            tax_id="12-3456793",
+            address_line1="123 Main St",
+            city="San Francisco",
+            state="CA",
+            zip_code="94102",
+            status=OrganizationStatus.APPROVED,
+        )
+        db_session.add(org)
+        await db_session.commit()
+
+        # Create truck
+        truck = Truck(
+            org_id=org.id,
+            make="Ford",
+            model="Transit",
+            year=2022,
+            capacity_cubic_feet=1000,
+            license_plate="ABC127",
+        )
+        db_session.add(truck)
+        await db_session.commit()
+
+        from app.schemas.rating import RatingCreate
+
+        for idx, stars in enumerate((5, 3)):
+            booking = Booking(
+                org_id=org.id,
+                truck_id=truck.id,
+                customer_name=f"Reconcile Customer {idx}",
+                customer_email=f"reconcile{idx}@example.com",
+                customer_phone=f"+1555987655{idx}",
+                move_date=datetime.now(UTC) + timedelta(days=1),
+                pickup_address="123 Start St",
+                pickup_city="San Francisco",
+                pickup_state="CA",
+                pickup_zip="94102",
+                dropoff_address="456 End Ave",
+                dropoff_city="Oakland",
+                dropoff_state="CA",
+                dropoff_zip="94601",
+                estimated_distance_miles=15.5,
+                estimated_duration_hours=4.0,
+                estimated_amount=600.0,
+                platform_fee=30.0,
+                special_items=[],
+                pickup_floors=0,
+                dropoff_floors=0,
+                has_elevator_pickup=True,
+                has_elevator_dropoff=True,
+                effective_start=datetime.now(UTC),
+                effective_end=datetime.now(UTC) + timedelta(hours=4),
+                status=BookingStatus.COMPLETED,
+            )
+            db_session.add(booking)
+            await db_session.commit()
+
+            await RatingService.create_rating(
+                db=db_session,
+                rating_data=RatingCreate(booking_id=booking.id, overall_rating=stars),
+                customer_name=f"Reconcile Customer {idx}",
+                customer_email=f"reconcile{idx}@example.com",
+            )
+
+        # Simulate drift in the incrementally maintained counters
+        await db_session.execute(
+            update(RatingSummary)
+            .where(RatingSummary.org_id == org.id)
+            .values(total_ratings=7, average_overall_rating=1.0, five_star_count=0)
+        )
+        await db_session.commit()
+
+        reconciled = await RatingService.reconcile_rating_summary(db_session, org.id)
+
+        assert reconciled is True
+        result = await db_session.execute(
+            select(RatingSummary)
+            .where(RatingSummary.org_id == org.id)
+            .execution_options(populate_existing=True)
+        )
+        summary = result.scalar_one()
+        assert summary.total_ratings == 2
+        assert summary.average_overall_rating == 4.0
+        assert summary.five_star_count == 1
+        assert summary.three_star_count == 1
+
+    async def test_reconcile_rating_summary_without_summary(self, db_session: AsyncSession):
+        """Test that reconciliation skips organizations that have no summary yet."""
+        reconciled = await RatingService.reconcile_rating_summary(db_session, uuid4())
+
+        assert reconciled is False
+
+
+@pytest.mark.unit
+class TestRatingCursor:
+    """Test keyset pagination cursor encoding."""
+
+    def test_cursor_round_trip(self):
+        """Test a cursor decodes back to the same (created_at, id) pair."""
+        cursor = (datetime(2024, 1, 6, 10, 30, tzinfo=UTC), uuid4())
+
+        assert decode_rating_cursor(encode_rating_cursor(cursor)) == cursor
+
+    def test_invalid_cursor_rejected(self):
+        """Test malformed cursors raise ValueError."""
+        with pytest.raises(ValueError):
+            decode_rating_cursor("not-a-cursor")
+
 
 @pytest.mark.asyncio
 class TestRatingAPI:
@@ -483,5 +602,6 @@ class TestRatingAPI:
         # Should return empty list for non-existent org
         assert response.status_code == 200
         data = response.json()
-        assert data["total"] == 0
         assert data["ratings"] == []
+        assert data["has_more"] is False
+        assert data["next_cursor"] is None